@@ -8,18 +8,22 @@ import os
 import re
 import shutil
 import subprocess
+import threading
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
+from functools import cached_property
 from datetime import datetime, timezone
 import time
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
 
 from . import __version__
 from .layout import resolve_input, ResolvedInput
 from .inspect import inspect_export
-from .melody_fingerprint import melody_fingerprint_file
-from .file_utils import sha1_file
+from .melody_fingerprint import FINGERPRINT_KIND, melody_fingerprint_many
+from .file_utils import CONTENT_DIGEST_IS_SHA1, content_digest_file, sha1_file
+from .util import json_dumps_bytes, json_loads
 from .subset import build_subset, BuildCancelled, SubsetOptions
 from .constants import (
     LOGS_DIRNAME,
@@ -48,6 +52,24 @@ class DiscIndex:
     song_count: int
     warnings: list[str]
 
+    # cached_property stores into the instance __dict__ directly, so it works on this frozen
+    # dataclass and is computed at most once per index.
+    @cached_property
+    def display_product(self) -> str:
+        """Product label shown in the GUI: "<desc> [<code>]" when both are known."""
+        if self.product_code and self.product_desc:
+            return f"{self.product_desc} [{self.product_code}]"
+        return self.product_desc or self.product_code or "(unknown)"
+
+    @cached_property
+    def is_expected_base(self) -> bool:
+        """True when this looks like the tested base disc (SingStar, BCES00011)."""
+        # On some discs, PRODUCT_CODE is just "00011" even though the title ID is BCES00011.
+        code = (self.product_code or "").strip().upper()
+        if code in {"BCES00011", "00011"}:
+            return True
+        return "BCES00011" in (self.product_desc or "").strip().upper()
+
 
 @dataclass(frozen=True)
 class SongAgg:
@@ -74,8 +96,47 @@ def _strip_ns(tag: str) -> str:
     return tag
 
 
-def _sha1_path(p: Path) -> Optional[str]:
-    return sha1_file(p)
+def _sha1_path(p: str | Path) -> Optional[str]:
+    return _cached_file_digest(p, "sha1", sha1_file)
+
+
+def _fingerprint_path(p: str | Path) -> Optional[str]:
+    """Raw-bytes equality fingerprint (xxh3 when available); not for display."""
+    return _cached_file_digest(p, _CONTENT_DIGEST_KIND, content_digest_file)
+
+
+def _melody_fp_paths(paths: Sequence[str]) -> Dict[str, Optional[str]]:
+    """Semantic melody fingerprints, persisted in the digest cache by (mtime, size).
+
+    Cache misses are fingerprinted together via melody_fingerprint_many().
+    """
+    out: Dict[str, Optional[str]] = {}
+    misses: Dict[str, os.stat_result] = {}
+    for p in paths:
+        try:
+            st = os.stat(p)
+        except OSError:
+            out[p] = None
+            continue
+        hit = _digest_cache_hit(f"{FINGERPRINT_KIND}|{p}", st)
+        if hit is not None:
+            out[p] = hit
+        else:
+            misses[p] = st
+    if misses:
+        for p, fp in melody_fingerprint_many(list(misses)).items():
+            out[p] = fp
+            if fp is not None:
+                st = misses[p]
+                _store_file_digest(f"{FINGERPRINT_KIND}|{p}", st.st_mtime_ns, st.st_size, fp)
+    return out
+
+
+def _display_sha1(fingerprint: Optional[str], p: str | Path) -> Optional[str]:
+    """SHA-1 for UI/report display given a _fingerprint_path() value for the same file."""
+    if CONTENT_DIGEST_IS_SHA1:
+        return fingerprint
+    return _sha1_path(p)
 
 
 # Covers.xml helper:
@@ -111,6 +172,7 @@ def compute_song_id_conflicts(
     except Exception:
         roots = {}
 
+    candidates: list[tuple[int, str, str, list[tuple[str, Optional[str], Optional[str]]]]] = []
     for s in songs:
         try:
             song_id = int(getattr(s, "song_id", 0) or 0)
@@ -122,170 +184,59 @@ def compute_song_id_conflicts(
         except Exception:
             continue
 
-        occs: list[SongOccur] = []
-
-
-        sha_fp: list[str] = []
-
-
-        sha_mismatch = False
-
-
-
-        # First pass: raw SHA1 is cheap; use it as a candidate filter only.
-
-
+        # First pass: raw digest is cheap; use it as a candidate filter only. Rows stay
+        # plain (label, path, digest) tuples so non-conflicting ids never build a SongOccur.
+        sid_s = str(song_id)
+        rows: list[tuple[str, Optional[str], Optional[str]]] = []
+        sha_fp: set[str] = set()
         for lab in srcs:
-
-
             label = str(lab)
-
-
             root_s = str(roots.get(label, "") or "")
-
-
+            p = os.path.join(root_s, sid_s, "melody_1.xml") if root_s else None
             sha = None
-
-
             try:
-
-
-                if root_s:
-
-
-                    p = Path(root_s) / str(song_id) / "melody_1.xml"
-
-
-                    sha = _sha1_path(p)
-
-
+                if p is not None:
+                    sha = _fingerprint_path(p)
             except Exception:
-
-
                 sha = None
+            rows.append((label, p, sha))
+            sha_fp.add(str(sha or "MISSING"))
 
+        if len(sha_fp) <= 1:
+            continue
+        candidates.append((song_id, title, artist, rows))
 
-            sha_fp.append(str(sha or "MISSING"))
-
-
+    # Candidates only: semantic fingerprints from note events, fanned out in one batch
+    # (cache misses only), then the SHA-1 shown in the UI/report and one SongOccur per source.
+    try:
+        fps = _melody_fp_paths([p for *_, rows in candidates for _label, p, _sha in rows if p is not None])
+    except Exception:
+        fps = {}
+    for song_id, title, artist, rows in candidates:
+        occs: list[SongOccur] = []
+        for label, p, sha in rows:
+            fp = None
+            if p is not None:
+                try:
+                    sha = _display_sha1(sha, p)
+                except Exception:
+                    sha = None
+                fp = fps.get(p)
             occs.append(
-
-
                 SongOccur(
-
-
                     song_id=song_id,
-
-
                     title=title,
-
-
                     artist=artist,
-
-
                     source_label=label,
-
-
                     melody1_sha1=sha,
-
-
-                    melody1_fp=None,
-
-
-                )
-
-
-            )
-
-
-
-        try:
-
-
-            sha_mismatch = len(set(sha_fp)) > 1
-
-
-        except Exception:
-
-
-            sha_mismatch = True
-
-
-
-        if not sha_mismatch:
-
-
-            continue
-
-
-
-        # Second pass (semantic): compute a canonical fingerprint from note events.
-
-
-        fp_vals: Dict[str, Optional[str]] = {}
-
-
-        for i, o in enumerate(list(occs)):
-
-
-            try:
-
-
-                label = str(getattr(o, "source_label", "") or "")
-
-
-                root_s = str(roots.get(label, "") or "")
-
-
-                fp = None
-
-
-                if root_s:
-
-
-                    p = Path(root_s) / str(song_id) / "melody_1.xml"
-
-
-                    fp = melody_fingerprint_file(p)
-
-
-                fp_vals[label] = fp
-
-
-                occs[i] = SongOccur(
-
-
-                    song_id=o.song_id,
-
-
-                    title=o.title,
-
-
-                    artist=o.artist,
-
-
-                    source_label=o.source_label,
-
-
-                    melody1_sha1=o.melody1_sha1,
-
-
                     melody1_fp=fp,
-
-
                 )
-
-
-            except Exception:
-
-
-                continue
-
-
+            )
 
         # Include all SHA-mismatch duplicates. The caller/UI will classify them.
         conflicts[int(song_id)] = tuple(occs)
 
+    _flush_file_digest_cache()
     return conflicts
 
 
@@ -328,13 +279,38 @@ def _covers_song_to_page(export_root: Path) -> Dict[int, int]:
     return out
 
 
+_TEXTURE_PAGE_EXTS = ("jpg", "png", "gtf", "dds", "bmp")
+
+
 def _texture_page_exists(textures_dir: Path, page_num: int) -> bool:
-    for ext in ("jpg", "png", "gtf", "dds", "bmp"):
+    for ext in _TEXTURE_PAGE_EXTS:
         if (textures_dir / f"page_{page_num}.{ext}").exists():
             return True
     return False
 
 
+def _texture_page_set(textures_dir: Path | str) -> set[int]:
+    """Page numbers with a page_<n>.<ext> texture in textures_dir (one scandir, no stats).
+
+    Equivalent to _texture_page_exists() for every page at once; missing dir -> empty set.
+    Names go through os.path.normcase so Page_3.JPG counts where exists() would find it.
+    """
+    pages: set[int] = set()
+    try:
+        with os.scandir(textures_dir) as it:
+            for e in it:
+                stem, dot, ext = os.path.normcase(e.name).partition(".")
+                if not dot or ext not in _TEXTURE_PAGE_EXTS or not stem.startswith("page_"):
+                    continue
+                num = stem[5:]
+                # Only canonical numbers ("page_01" is not what page_1 probes for).
+                if num.isdigit() and str(int(num)) == num:
+                    pages.add(int(num))
+    except OSError:
+        pass
+    return pages
+
+
 GUI_SETTINGS_FILE = "spcdb_gui_settings.json"
 
 
@@ -348,18 +324,38 @@ def _load_settings() -> dict:
     if not p.exists():
         return {}
     try:
-        return json.loads(p.read_text(encoding="utf-8"))
+        return json_loads(p.read_bytes())
     except Exception:
         return {}
 
 
-def _save_settings(data: dict) -> None:
+def _settings_bytes(data: dict) -> bytes:
+    return json_dumps_bytes(data, pretty=True, sort_keys=True)
+
+
+def _write_settings_bytes(blob: bytes) -> bool:
+    """Replace the settings file atomically (temp file + os.replace); True if written."""
     p = _settings_path()
+    tmp = p.with_name(f"{p.name}.{os.getpid()}.tmp")
     try:
-        p.write_text(json.dumps(data, indent=2, sort_keys=True), encoding="utf-8")
+        tmp.write_bytes(blob)
+        os.replace(tmp, p)
     except Exception:
         # best-effort only
-        pass
+        try:
+            tmp.unlink()
+        except Exception:
+            pass
+        return False
+    return True
+
+
+def _save_settings(data: dict) -> None:
+    try:
+        blob = _settings_bytes(data)
+    except Exception:
+        return
+    _write_settings_bytes(blob)
 
 
 # -------- Persistent disc index/song cache (v0.5.8d) --------
@@ -439,7 +435,7 @@ def _load_index_cache(input_path: str) -> tuple[Optional[DiscIndex], Optional[Di
         return None, None, False, ""
 
     try:
-        raw = json.loads(cache_path.read_text(encoding="utf-8"))
+        raw = json_loads(cache_path.read_bytes())
     except Exception as e:
         return None, None, False, f"cache read failed: {e}"
 
@@ -516,6 +512,11 @@ def _load_index_cache(input_path: str) -> tuple[Optional[DiscIndex], Optional[Di
     return idx, songs_map, False, 'ok'
 
 
+# Serialises the read-merge-replace in _write_index_cache: the GUI's background writer
+# and song-map loads may write the same record concurrently.
+_index_cache_write_lock = threading.Lock()
+
+
 def _write_index_cache(idx: DiscIndex, songs: Optional[Dict[int, Tuple[str, str]]] = None) -> None:
     """Write/refresh the cache record for a disc index (and optional songs)."""
     try:
@@ -526,8 +527,8 @@ def _write_index_cache(idx: DiscIndex, songs: Optional[Dict[int, Tuple[str, str]
 
     cache_path = _index_cache_path_for_input(idx.input_path)
 
-    # If we are only writing the index and not songs, do NOT keep old songs
-    # because signature may have changed. Songs will be rebuilt on refresh.
+    # If we are only writing the index and not songs, keep old songs only when the
+    # stored signature still matches; otherwise they are rebuilt on refresh.
     sig = ''
     try:
         sig = _compute_disc_signature_for_idx(idx)
@@ -564,11 +565,32 @@ def _write_index_cache(idx: DiscIndex, songs: Optional[Dict[int, Tuple[str, str]
         rows.sort(key=lambda r: int(r[0]) if r else 0)
         payload['songs'] = rows
 
-    try:
-        cache_path.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding='utf-8')
-    except Exception:
-        # best-effort only
-        return
+    with _index_cache_write_lock:
+        if songs is None and sig:
+            # A songs-less refresh queued behind a songs write must not wipe them.
+            try:
+                old = json_loads(cache_path.read_bytes())
+                if (
+                    int(old.get('schema', 0) or 0) == INDEX_CACHE_SCHEMA
+                    and str(old.get('signature') or '') == sig
+                    and isinstance(old.get('songs'), list)
+                ):
+                    payload['songs'] = old['songs']
+            except Exception:
+                pass
+
+        # Compact encoding + atomic replace: readers never see a half-written record.
+        tmp = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            tmp.write_bytes(json_dumps_bytes(payload, sort_keys=True))
+            os.replace(tmp, cache_path)
+        except Exception:
+            # best-effort only
+            try:
+                tmp.unlink()
+            except Exception:
+                pass
+            return
 
 
 def get_index_cache_status(input_path: str) -> dict:
@@ -593,7 +615,7 @@ def get_index_cache_status(input_path: str) -> dict:
 
     raw = None
     try:
-        raw = json.loads(cache_path.read_text(encoding="utf-8"))
+        raw = json_loads(cache_path.read_bytes())
         status["saved_utc"] = str(raw.get("saved_utc") or "")
         status["version"] = str(raw.get("version") or "")
     except Exception as e:
@@ -617,8 +639,141 @@ def get_index_cache_status(input_path: str) -> dict:
     return status
 
 
+# -------- Persistent file digest cache --------
+#
+# melody_1.xml digests keyed by (kind, path) and validated against
+# (st_mtime_ns, st_size), so repeated conflict checks skip unchanged files.
+# Lives in the index cache dir and is removed by clear_index_cache().
+
+FILE_DIGEST_CACHE_FILE = "file_digests.json"
+FILE_DIGEST_CACHE_SCHEMA = 1
+FILE_DIGEST_CACHE_MAX = 50000
+
+_CONTENT_DIGEST_KIND = "sha1" if CONTENT_DIGEST_IS_SHA1 else "xxh3_64"
+
+_digest_cache_lock = threading.Lock()
+_digest_cache: Dict[str, list] = {}  # "kind|path" -> [mtime_ns, size, digest]
+_digest_cache_path: Optional[Path] = None
+_digest_cache_dirty = False
+
+
+def _digest_cache_file() -> Path:
+    return _index_cache_dir() / FILE_DIGEST_CACHE_FILE
+
+
+def _ensure_digest_cache_loaded() -> None:
+    """Load the on-disk digest cache once per cache location (caller holds the lock)."""
+    global _digest_cache, _digest_cache_path, _digest_cache_dirty
+    p = _digest_cache_file()
+    if _digest_cache_path == p:
+        return
+    entries: Dict[str, list] = {}
+    try:
+        raw = json_loads(p.read_bytes())
+        if isinstance(raw, dict) and raw.get("schema") == FILE_DIGEST_CACHE_SCHEMA:
+            got = raw.get("entries")
+            if isinstance(got, dict):
+                entries = got
+    except Exception:
+        entries = {}
+    _digest_cache = entries
+    _digest_cache_path = p
+    _digest_cache_dirty = False
+
+
+def _digest_cache_hit(key: str, st: os.stat_result) -> Optional[str]:
+    with _digest_cache_lock:
+        _ensure_digest_cache_loaded()
+        hit = _digest_cache.get(key)
+    if hit is not None and len(hit) == 3 and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+        return hit[2]
+    return None
+
+
+def _store_file_digest(key: str, mtime_ns: int, size: int, digest: str) -> None:
+    global _digest_cache_dirty
+    with _digest_cache_lock:
+        _ensure_digest_cache_loaded()
+        _digest_cache.pop(key, None)  # re-insert so eviction order tracks recency
+        _digest_cache[key] = [mtime_ns, size, digest]
+        _digest_cache_dirty = True
+
+
+def _cached_file_digest(p: str | Path, kind: str, compute: Callable[[str | Path], Optional[str]]) -> Optional[str]:
+    try:
+        st = os.stat(p)
+    except OSError:
+        return None
+    key = f"{kind}|{os.fspath(p)}"
+    hit = _digest_cache_hit(key, st)
+    if hit is not None:
+        return hit
+    digest = compute(p)
+    if digest is not None:
+        _store_file_digest(key, st.st_mtime_ns, st.st_size, digest)
+    return digest
+
+
+def _peek_fingerprint_path(p: str) -> Optional[str]:
+    """Cached _fingerprint_path() value if still current; None on a miss (never hashes)."""
+    try:
+        st = os.stat(p)
+    except OSError:
+        return None
+    return _digest_cache_hit(f"{_CONTENT_DIGEST_KIND}|{p}", st)
+
+
+def _fingerprint_file_task(p: str) -> Tuple[Optional[int], Optional[int], Optional[str]]:
+    """Process-pool worker: (mtime_ns, size, fingerprint) for p, bypassing the cache.
+
+    Top-level so it pickles; the parent records results via _remember_fingerprint().
+    """
+    try:
+        st = os.stat(p)
+    except OSError:
+        return None, None, None
+    return st.st_mtime_ns, st.st_size, content_digest_file(p)
+
+
+def _remember_fingerprint(p: str, mtime_ns: Optional[int], size: Optional[int], digest: Optional[str]) -> None:
+    """Record a _fingerprint_file_task() result in the digest cache."""
+    if digest is None or mtime_ns is None or size is None:
+        return
+    _store_file_digest(f"{_CONTENT_DIGEST_KIND}|{p}", mtime_ns, size, digest)
+
+
+def _flush_file_digest_cache() -> None:
+    """Persist the digest cache if it changed (atomic replace, best-effort)."""
+    global _digest_cache_dirty
+    with _digest_cache_lock:
+        if not _digest_cache_dirty or _digest_cache_path is None:
+            return
+        while len(_digest_cache) > FILE_DIGEST_CACHE_MAX:
+            _digest_cache.pop(next(iter(_digest_cache)))
+        payload = {"schema": FILE_DIGEST_CACHE_SCHEMA, "entries": dict(_digest_cache)}
+        p = _digest_cache_path
+        _digest_cache_dirty = False
+    try:
+        p.parent.mkdir(parents=True, exist_ok=True)
+    except Exception:
+        return
+    tmp = p.with_name(f"{p.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        tmp.write_bytes(json_dumps_bytes(payload))
+        os.replace(tmp, p)
+    except Exception:
+        try:
+            tmp.unlink()
+        except Exception:
+            pass
+
+
 def clear_index_cache() -> tuple[bool, str]:
     """Delete the persistent index cache directory (best-effort)."""
+    global _digest_cache_path
+    with _digest_cache_lock:
+        _digest_cache.clear()
+        _digest_cache_path = None
     d = _index_cache_dir()
     try:
         if not d.exists():
@@ -925,17 +1080,28 @@ def _load_songs_for_disc_cached(idx: DiscIndex) -> Dict[int, Tuple[str, str]]:
 
 
 
-def build_song_catalog(
+def _song_agg_from(a: Dict[str, object]) -> SongAgg:
+    return SongAgg(
+        song_id=int(a["song_id"]),  # type: ignore[arg-type]
+        title=str(a.get("title") or ""),
+        artist=str(a.get("artist") or ""),
+        preferred_source=str(a.get("preferred") or "Base"),
+        sources=tuple(sorted(a["sources"])),  # type: ignore[arg-type]
+    )
+
+
+def iter_song_catalog(
     discs: Sequence[Tuple[str, DiscIndex, bool]],
     cancel: Optional["CancelToken"] = None,
     log: Optional[Callable[[str], None]] = None,
-) -> Tuple[List[SongAgg], Dict[str, set[int]]]:
-    """Build an aggregated song catalog (UI-agnostic).
+) -> Iterator[Tuple[str, List[SongAgg], set[int]]]:
+    """Aggregate the song catalog disc by disc (UI-agnostic, streaming).
 
     discs: sequence of (label, DiscIndex, is_base). Prefer base first.
-    Returns (songs_out, disc_song_ids_by_label).
+    Yields (label, songs, song_ids) after each disc, where songs holds the
+    up-to-date SongAgg for every song on that disc (sorted by song_id). A
+    later yield for the same song_id supersedes the earlier one.
     """
-    disc_song_ids_by_label: Dict[str, set[int]] = {}
     agg: Dict[int, Dict[str, object]] = {}
 
     for label, di, is_base in discs:
@@ -950,9 +1116,9 @@ def build_song_catalog(
         songs = _load_songs_for_disc_cached(di)
 
         try:
-            disc_song_ids_by_label.setdefault(label, set()).update(set(songs.keys()))
+            ids = set(songs.keys())
         except Exception:
-            disc_song_ids_by_label.setdefault(label, set())
+            ids = set()
 
         for sid, (title, artist) in songs.items():
             if sid not in agg:
@@ -980,19 +1146,28 @@ def build_song_catalog(
                     if artist:
                         a["artist"] = artist
 
-    songs_out: List[SongAgg] = []
-    for _sid, a in agg.items():
-        sources = sorted(list(a["sources"]))  # type: ignore[index]
-        songs_out.append(
-            SongAgg(
-                song_id=int(a["song_id"]),  # type: ignore[arg-type]
-                title=str(a.get("title") or ""),
-                artist=str(a.get("artist") or ""),
-                preferred_source=str(a.get("preferred") or "Base"),
-                sources=tuple(sources),
-            )
-        )
-    songs_out.sort(key=lambda s: s.song_id)
+        yield label, [_song_agg_from(agg[sid]) for sid in sorted(ids)], ids
+
+
+def build_song_catalog(
+    discs: Sequence[Tuple[str, DiscIndex, bool]],
+    cancel: Optional["CancelToken"] = None,
+    log: Optional[Callable[[str], None]] = None,
+) -> Tuple[List[SongAgg], Dict[str, set[int]]]:
+    """Build an aggregated song catalog (UI-agnostic).
+
+    discs: sequence of (label, DiscIndex, is_base). Prefer base first.
+    Returns (songs_out, disc_song_ids_by_label).
+    """
+    disc_song_ids_by_label: Dict[str, set[int]] = {}
+    by_id: Dict[int, SongAgg] = {}
+
+    for label, songs, ids in iter_song_catalog(discs, cancel=cancel, log=log):
+        disc_song_ids_by_label.setdefault(label, set()).update(ids)
+        for s in songs:
+            by_id[s.song_id] = s
+
+    songs_out = [by_id[sid] for sid in sorted(by_id)]
     return songs_out, disc_song_ids_by_label
 
 # --- Cancellation token + disc validation operations (Block D / 0.5.10a3) ---
@@ -1211,9 +1386,8 @@ def validate_one_disc(label: str, input_path: str) -> dict:
         textures_dir = export_root / "textures"
         missing = 0
         if textures_dir.exists():
-            for pnum in pages:
-                if not _texture_page_exists(textures_dir, int(pnum)):
-                    missing += 1
+            present = _texture_page_set(textures_dir)
+            missing = sum(1 for pnum in pages if int(pnum) not in present)
         else:
             missing = int(len(pages))
         covers_info["missing_pages"] = int(missing)
@@ -1435,9 +1609,8 @@ def validate_one_disc_from_export_root(label: str, input_path: str, export_root:
         textures_dir = export_root / "textures"
         missing = 0
         if textures_dir.exists():
-            for pnum in pages:
-                if not _texture_page_exists(textures_dir, int(pnum)):
-                    missing += 1
+            present = _texture_page_set(textures_dir)
+            missing = sum(1 for pnum in pages if int(pnum) not in present)
         else:
             missing = int(len(pages))
         covers_info["missing_pages"] = int(missing)
@@ -2697,11 +2870,9 @@ def verify_disc_extraction(
     if not textures_dir.exists():
         textures_dir = export_root / "Textures"
 
+    present_pages = _texture_page_set(textures_dir)
     for _sid, page in (covers_map or {}).items():
-        try:
-            if not _texture_page_exists(textures_dir, int(page)):
-                missing_texture_pages.add(int(page))
-        except Exception:
+        if int(page) not in present_pages:
             missing_texture_pages.add(int(page))
 
     # Summaries
@@ -2760,6 +2931,43 @@ def verify_disc_extraction(
     }
 
 
+def _plan_cleanup_moves(disc_root: Path, sources: Sequence[Path], trash_disc_dir: Path) -> List[Tuple[Path, Path, bool]]:
+    """Return (src, dst, is_dir) moves into trash_disc_dir with collision-free destinations."""
+    plan: List[Tuple[Path, Path, bool]] = []
+    taken: set[Path] = set()
+    for src in sources:
+        try:
+            rel = src.relative_to(disc_root)
+        except Exception:
+            rel = Path(src.name)
+        # Keep the disc folder name inside the trash session so multiple discs stay tidy.
+        dst = trash_disc_dir / rel
+
+        # Avoid collisions (with existing trash content and with earlier planned moves)
+        if dst in taken or dst.exists():
+            stem = dst.name
+            parent = dst.parent
+            i = 2
+            while True:
+                cand = parent / f"{stem}_{i}"
+                if cand not in taken and not cand.exists():
+                    dst = cand
+                    break
+                i += 1
+        taken.add(dst)
+        plan.append((src, dst, src.is_dir()))
+    return plan
+
+
+def _move_path(src: Path, dst: Path) -> None:
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        # Same filesystem (the usual case): a single rename.
+        os.rename(str(src), str(dst))
+    except OSError:
+        shutil.move(str(src), str(dst))
+
+
 def cleanup_extraction_artifacts(
     disc_root: Path,
     *,
@@ -2769,6 +2977,7 @@ def cleanup_extraction_artifacts(
     trash_root_dir: Optional[Path] = None,
     trash_ts: Optional[str] = None,
     log_cb: Optional[Callable[[str], None]] = None,
+    max_workers: int = 1,
 ) -> dict:
     """Cleanup legacy extraction artifacts (destructive).
 
@@ -2779,6 +2988,11 @@ def cleanup_extraction_artifacts(
 
     If delete_instead=True, artifacts are PERMANENTLY DELETED (cannot be undone).
 
+    max_workers > 1 performs the trash moves concurrently (many Pack*.pkd_out dirs
+    are latency-bound renames); destinations are always planned up front. In either
+    mode each move is logged when it completes, no new move starts after a failure,
+    a totals line is logged, and the first error is re-raised.
+
     Returns a dict including:
       - trash_dir (str|None)  # the session folder: <discs_folder>/_spcdb_trash/<timestamp>/
       - moved_files / moved_dirs
@@ -2888,38 +3102,58 @@ def cleanup_extraction_artifacts(
     trash_disc_dir = trash_session_dir / disc_root.name
     trash_disc_dir.mkdir(parents=True, exist_ok=True)
 
-    for src in filtered:
+    # Plan sequentially (collision names must be unique), then move. Both modes log each
+    # move as it completes (from this thread), stop starting moves after the first
+    # failure, and end with the same totals line.
+    plan = _plan_cleanup_moves(disc_root, filtered, trash_disc_dir)
+    stop = threading.Event()
+    skipped = object()  # result of a move not attempted because an earlier one failed
+
+    def _move(item: Tuple[Path, Path, bool]) -> object:
+        src, dst, _is_dir = item
+        if stop.is_set():
+            return skipped
         try:
-            try:
-                rel = src.relative_to(disc_root)
-            except Exception:
-                rel = Path(src.name)
-            # Keep the disc folder name inside the trash session so multiple discs stay tidy.
-            dst = trash_disc_dir / rel
-
-            # Avoid collisions
-            if dst.exists():
-                stem = dst.name
-                parent = dst.parent
-                i = 2
-                while True:
-                    cand = parent / f"{stem}_{i}"
-                    if not cand.exists():
-                        dst = cand
-                        break
-                    i += 1
-
-            dst.parent.mkdir(parents=True, exist_ok=True)
-            _emit(f"[cleanup] Moving: {src} -> {dst}")
-            shutil.move(str(src), str(dst))
+            _move_path(src, dst)
+            return None
+        except Exception as e:
+            stop.set()
+            return e
+
+    errors: list[Exception] = []
+    n_skipped = 0
+
+    def _record(item: Tuple[Path, Path, bool], res: object) -> None:
+        nonlocal moved_dirs, moved_files, n_skipped
+        src, dst, is_dir = item
+        if res is skipped:
+            n_skipped += 1
+        elif isinstance(res, Exception):
+            errors.append(res)
+            _emit(f"[cleanup] ERROR moving {src}: {res}")
+        else:
+            _emit(f"[cleanup] Moved: {src} -> {dst}")
             moved.append(str(dst))
-            if dst.is_dir():
+            if is_dir:
                 moved_dirs += 1
             else:
                 moved_files += 1
-        except Exception as e:
-            _emit(f"[cleanup] ERROR moving {src}: {e}")
-            raise
+
+    if max_workers > 1 and len(plan) > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as ex:
+            futs = {ex.submit(_move, item): item for item in plan}
+            for fut in as_completed(futs):
+                _record(futs[fut], fut.result())
+    else:
+        for item in plan:
+            _record(item, _move(item))
+
+    _emit(
+        f"[cleanup] Moved {moved_dirs} dir(s), {moved_files} file(s); "
+        f"{len(errors)} failed, {n_skipped} skipped"
+    )
+    if errors:
+        raise errors[0]
 
     return {
         "trash_dir": str(trash_session_dir),
@@ -3204,8 +3438,12 @@ def _build_song_verification_sidecars(
     }
 
 
-def _write_build_report(out_dir: Path, report: dict) -> Optional[Path]:
-    """Write a build report JSON next to the built disc folder."""
+def _write_build_report(out_dir: Path, report: dict, *, pretty: bool = False) -> Optional[Path]:
+    """Write a build report JSON next to the built disc folder.
+
+    Compact by default (the companion .txt report is the human-readable one); pass
+    pretty=True for indented output.
+    """
     try:
         out_dir = Path(out_dir).resolve()
         out_dir.mkdir(parents=True, exist_ok=True)
@@ -3214,8 +3452,7 @@ def _write_build_report(out_dir: Path, report: dict) -> Optional[Path]:
         report_dir.mkdir(parents=True, exist_ok=True)
         safe_name = disc_dir.name or 'disc'
         rp = report_dir / f"{safe_name}_build_report.json"
-        with rp.open("w", encoding="utf-8") as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
+        rp.write_bytes(json_dumps_bytes(report, pretty=pretty))
         return rp
     except Exception:
         return None
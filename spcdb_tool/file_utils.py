@@ -1,26 +1,73 @@
 from __future__ import annotations
 
 import hashlib
+import mmap
+import os
+import stat
 from pathlib import Path
 from typing import Optional
 
+try:  # optional: much faster non-cryptographic digest for equality checks
+    import xxhash
+except ImportError:  # pragma: no cover - depends on the environment
+    xxhash = None
+
 _DEFAULT_CHUNK_SIZE = 1024 * 1024
+_MMAP_MIN_SIZE = 1 << 20
+
+
+def _new_sha1() -> "hashlib._Hash":
+    # Content fingerprint, not a security boundary: usedforsecurity=False keeps FIPS-mode
+    # OpenSSL builds from rejecting/wrapping SHA-1 and goes straight to EVP_sha1 (SHA-NI/ARMv8).
+    return hashlib.sha1(usedforsecurity=False)
 
 
-def sha1_file(path: Path, *, chunk_size: int = _DEFAULT_CHUNK_SIZE) -> Optional[str]:
-    """Return SHA1 hexdigest of a file, or None if missing/unreadable."""
+def sha1_file(path: str | Path, *, chunk_size: int = _DEFAULT_CHUNK_SIZE) -> Optional[str]:
+    """Return SHA1 hexdigest of a file, or None if missing/unreadable.
+
+    Uses hashlib.file_digest (Python 3.11+, C-level read loop); older interpreters
+    hash large files through one mmap and small ones with chunked reads.
+    """
+    try:
+        f = open(path, "rb")
+    except Exception:
+        return None
+
     try:
-        p = Path(path)
+        with f:
+            st = os.fstat(f.fileno())
+            if not stat.S_ISREG(st.st_mode):
+                return None
+            if hasattr(hashlib, "file_digest"):
+                return hashlib.file_digest(f, _new_sha1).hexdigest()
+            h = _new_sha1()
+            if st.st_size >= _MMAP_MIN_SIZE:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    h.update(mm)
+            else:
+                for chunk in iter(lambda: f.read(int(chunk_size)), b""):
+                    h.update(chunk)
+            return h.hexdigest()
     except Exception:
         return None
 
+
+# True when content_digest_file() returns plain SHA-1 hex (xxhash not installed).
+CONTENT_DIGEST_IS_SHA1 = xxhash is None
+
+
+def content_digest_file(path: str | Path) -> Optional[str]:
+    """Fast equality fingerprint of a file's bytes, or None if missing/unreadable.
+
+    xxh3_64 when the optional xxhash package is installed, else SHA-1 (see sha1_file).
+    Only compare values produced by this function in the same process.
+    """
+    if xxhash is None:
+        return sha1_file(path)
     try:
-        if not p.exists() or not p.is_file():
-            return None
-        h = hashlib.sha1()
-        with p.open("rb") as f:
-            for chunk in iter(lambda: f.read(int(chunk_size)), b""):
-                h.update(chunk)
-        return h.hexdigest()
+        with open(path, "rb") as f:
+            if not stat.S_ISREG(os.fstat(f.fileno()).st_mode):
+                return None
+            return xxhash.xxh3_64_hexdigest(f.read())
     except Exception:
         return None
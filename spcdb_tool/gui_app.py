@@ -8,23 +8,29 @@ import re
 from datetime import datetime
 import time
 import hashlib
+import heapq
 import queue
 import threading
+from collections import deque
+from itertools import islice
 import subprocess
 import shutil
+import stat
 import fnmatch
+import concurrent.futures
+import multiprocessing
 import tkinter as tk
 import xml.etree.ElementTree as ET
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from .util import ensure_default_extractor_dir, default_extractor_dir, detect_default_extractor_exe
 from tkinter import filedialog, messagebox, ttk
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Callable, Collection, Dict, List, Optional, Set, Tuple
 
 from . import __version__
 from .layout import resolve_input, ResolvedInput
 from .merge import MergeError
-from .util import dumps_pretty
+from .util import dumps_pretty, json_dumps_bytes, json_loads
 
 
 # NOTE: UI-agnostic helpers/types are being extracted into controller.py (Block D / 0.5.10a).
@@ -41,7 +47,7 @@ from .controller import (
     validate_discs,
     validate_one_disc_from_export_root,
     index_disc,
-    build_song_catalog,
+    iter_song_catalog,
     extract_disc_pkds,
     verify_disc_extraction,
     cleanup_extraction_artifacts,
@@ -56,15 +62,21 @@ from .controller import (
     _normalize_input_path,
     _parse_config,
     _parse_song_id,
-    _save_settings,
+    _settings_bytes,
     _settings_path,
-    _sha1_path,
+    _display_sha1,
+    _flush_file_digest_cache,
+    _fingerprint_file_task,
+    _fingerprint_path,
+    _peek_fingerprint_path,
+    _remember_fingerprint,
     _strip_ns,
-    _texture_page_exists,
+    _texture_page_set,
     _write_index_cache,
+    _write_settings_bytes,
 )
 
-def scan_for_disc_inputs(root: Path, max_depth: int = 4) -> list[str]:
+def scan_for_disc_inputs(root: Path, max_depth: int = 4) -> list[tuple[str, str]]:
     """Find candidate disc folders beneath root.
 
     This finds both extracted and unextracted PS3 disc folders by detecting
@@ -73,9 +85,14 @@ def scan_for_disc_inputs(root: Path, max_depth: int = 4) -> list[str]:
     We keep this lightweight and heuristic-driven. For extracted discs we can
     further confirm by calling resolve_input(); for unextracted discs we still
     include them so they can be extracted in-app.
+
+    Returns (disc_path, resolved_key) pairs. Each disc_path is already a
+    normalized disc root that existed during the walk, and resolved_key is its
+    resolved path, so callers can dedupe without touching the filesystem again.
     """
     root = root.expanduser().resolve()
-    out: list[str] = []
+    root_str = str(root)
+    out: list[tuple[str, str]] = []
     seen: set[str] = set()
 
     def _normalize_disc_root(p: Path) -> Path:
@@ -112,7 +129,7 @@ def scan_for_disc_inputs(root: Path, max_depth: int = 4) -> list[str]:
             if key in seen:
                 return True
             seen.add(key)
-            out.append(str(disc_root))
+            out.append((str(disc_root), key))
             return True
 
         # Fallback: extracted/looser layouts; let resolve_input() canonicalize.
@@ -127,14 +144,13 @@ def scan_for_disc_inputs(root: Path, max_depth: int = 4) -> list[str]:
         if key in seen:
             return True
         seen.add(key)
-        out.append(str(ri.original))
+        out.append((str(ri.original), key))
         return True
 
-    for dirpath, dirnames, _filenames in os.walk(root):
-        try:
-            depth = len(Path(dirpath).resolve().relative_to(root).parts)
-        except Exception:
-            depth = 0
+    for dirpath, dirnames, _filenames in os.walk(root_str):
+        # os.walk does not follow symlinks, so dirpath is always a textual child of root.
+        rel = dirpath[len(root_str):].strip(os.sep)
+        depth = rel.count(os.sep) + 1 if rel else 0
         if depth > max_depth:
             dirnames[:] = []
             continue
@@ -186,21 +202,139 @@ def scan_for_disc_inputs(root: Path, max_depth: int = 4) -> list[str]:
         except Exception:
             pass
 
-    out.sort(key=lambda s: s.lower())
+    out.sort(key=lambda t: t[0].lower())
     return out
 
 
-def _is_expected_base(idx: DiscIndex) -> bool:
-    # On some discs, PRODUCT_CODE is just "00011" even though the title ID is BCES00011.
-    code = (idx.product_code or "").strip().upper()
-    desc = (idx.product_desc or "").strip().upper()
-    if code in {"BCES00011", "00011"}:
-        return True
-    if "BCES00011" in desc:
-        return True
+def _probe_available_outdir(parent: str, name: str) -> str:
+    """First non-existing <parent>/<name>[_N] (not cached: folders change under us)."""
+    cand = os.path.join(parent, name)
+    if not os.path.exists(cand):
+        return cand
+    i = 2
+    while True:
+        cand2 = os.path.join(parent, f"{name}_{i}")
+        if not os.path.exists(cand2):
+            return cand2
+        i += 1
+
+
+def _classify_path(p: str) -> Tuple[bool, bool]:
+    """(exists, is_dir) for *p* from a single stat (not cached: folders change under us)."""
+    try:
+        st = os.stat(p)
+    except (OSError, ValueError):
+        return False, False
+    return True, stat.S_ISDIR(st.st_mode)
+
+
+_EMPTY_IDS: frozenset = frozenset()
+
+
+def _song_id_of(s: SongAgg) -> int:
+    return s.song_id
+
+
+def _has_melody(song_dir: str) -> bool:
+    """True if *song_dir* contains a melody_*.xml file (one scandir pass, early exit).
+
+    Names are compared through os.path.normcase, so matching follows the platform's
+    case rules like the glob it replaces (MELODY_1.XML counts on Windows).
+    """
+    try:
+        with os.scandir(song_dir) as it:
+            for e in it:
+                n = os.path.normcase(e.name)
+                if n.startswith("melody_") and n.endswith(".xml") and e.is_file():
+                    return True
+    except OSError:
+        return False
     return False
 
 
+def _now_ts() -> str:
+    """Local time as "YYYY-MM-DD HH:MM:SS" (integer formatting, no strftime)."""
+    now = datetime.now()
+    return f"{now.year:04d}-{now.month:02d}-{now.day:02d} {now.hour:02d}:{now.minute:02d}:{now.second:02d}"
+
+
+# Build report JSON is machine-read by default; set True for indented output.
+_BUILD_REPORT_PRETTY = False
+
+# Max queue messages handled per drain before yielding back to the Tk event loop.
+_QUEUE_DRAIN_BATCH = 64
+
+# Conflict scans: below this many melody_1.xml files hash serially. A background scan
+# over at least _CONFLICT_HASH_PROCESS_MIN selected ids hashes uncached files in a
+# process pool (decided once per scan, never on the Tk thread).
+_CONFLICT_HASH_POOL_MIN = 8
+_CONFLICT_HASH_PROCESS_MIN = 256
+_CONFLICT_HASH_WORKERS = os.cpu_count() or 1
+
+# Background validation scans/streams conflicts this many selected song ids at a time.
+_VALIDATE_BATCH = 64
+
+# Status panel line order (keys of SPCDBGui._status_parts).
+_STATUS_ORDER = ("base", "included", "conflicts", "output")
+
+
+@dataclass(slots=True)
+class _PreflightSnapshot:
+    """Routing info captured by preflight at build start (read by the build report)."""
+
+    provider: Dict[int, str] = field(default_factory=dict)
+    dupe_ids: List[int] = field(default_factory=list)
+    needed_donors: List[str] = field(default_factory=list)
+    prefer: Dict[int, str] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class _BuildReportInputs:
+    """UI state the build report needs, copied on the Tk thread at build start."""
+
+    preflight: _PreflightSnapshot
+    base_idx: Optional[DiscIndex]
+    sources: List[Tuple[str, DiscIndex]]  # (label, index) in GUI order
+    selected_ids: Set[int]
+    conflicts: Dict[int, List[SongOccur]]
+    conflict_choices: Dict[int, str]
+    titles: Dict[int, Tuple[str, str]]  # selected song id -> (title, artist)
+    session_log_path: str
+
+
+class _LazyDiscMaps:
+    """label -> frozenset of song ids, loading each disc's song map on first access."""
+
+    def __init__(self, label_to_idx: Dict[str, DiscIndex], loader: Callable[[DiscIndex], Dict[int, Tuple[str, str]]]) -> None:
+        self._l2i = label_to_idx
+        self._loader = loader
+        self._cache: Dict[str, frozenset] = {}
+
+    def __getitem__(self, label: str) -> frozenset:
+        ids = self._cache.get(label)
+        if ids is None:
+            idx = self._l2i[label]  # KeyError for unknown labels
+            try:
+                ids = frozenset(self._loader(idx))
+            except Exception:
+                ids = _EMPTY_IDS
+            self._cache[label] = ids
+        return ids
+
+    def get(self, label: str, default: Optional[frozenset] = None) -> Optional[frozenset]:
+        try:
+            return self[label]
+        except KeyError:
+            return default
+
+    def peek(self, label: str) -> Optional[frozenset]:
+        """Id set for *label* if it was already read; never triggers a load."""
+        return self._cache.get(label)
+
+
+# Sources tree columns (values tuples passed to _src_insert/_src_set_values follow this order).
+_SRC_COLS = ("label", "product", "banks", "songs", "status", "path")
+
 
 class _Tooltip:
     """Simple hover tooltip for Tkinter widgets."""
@@ -284,6 +418,10 @@ class SPCDBGui(tk.Tk):
         super().__init__()
         self.title(f"SingStar Disc Builder v{__version__}")
 
+        # Log line buffer, flushed to the log view/session file by _flush_logs
+        self._log_buf: "deque[str]" = deque(maxlen=5000)
+        self._log_flush_pending = False
+
         # App icon (best-effort; png works on Tk 8.6+)
         try:
             icon_path = Path(__file__).resolve().parent / 'branding' / 'spcdb_icon.png'
@@ -293,8 +431,15 @@ class SPCDBGui(tk.Tk):
         except Exception:
             pass
 
-        # Settings (portable, stored alongside the tool)
+        # Settings (portable, stored alongside the tool). Kept in memory; writes go through
+        # _mark_settings_dirty / _flush_settings.
         _s = _load_settings()
+        if not isinstance(_s, dict):
+            _s = {}
+        self._settings_cache: dict = _s
+        self._settings_saved_blob: Optional[bytes] = None
+        self._settings_dirty = False
+        self._settings_flush_job: Optional[str] = None
 
         # UI theme
         self._dark_mode_var = tk.BooleanVar(value=bool(_s.get("dark_mode", True)))
@@ -308,10 +453,16 @@ class SPCDBGui(tk.Tk):
 
         # Persistence debounce
         self._persist_job = None
+        self._persist_dirty = False
 
-        self._queue: "queue.Queue[tuple[str, object]]" = queue.Queue()
+        self._queue_wake_pending = False
+        self._queue: "queue.SimpleQueue[tuple[str, object]]" = queue.SimpleQueue()
         self._src_counter = 0
         self._src_labels: Dict[str, str] = {}
+        # Shadow copy of Sources tree cell values (row_iid -> {col: value}); reads avoid Tcl round-trips.
+        self._src_row_data: Dict[str, Dict[str, str]] = {}
+        self._src_dirty_iids: Set[str] = set()  # rows with shadow edits not yet pushed (_tree_set)
+        self._tree_flush_scheduled = False
 
         self.base_path_var = tk.StringVar(value=str(_s.get("base_path", "")) or "")
         self.base_info_var = tk.StringVar(value="Base: not set")
@@ -330,12 +481,8 @@ class SPCDBGui(tk.Tk):
                 det = detect_default_extractor_exe()
                 if det is not None and det.exists():
                     self.extractor_exe_var.set(str(det))
-                    try:
-                        s2 = _load_settings() or {}
-                        s2["extractor_exe_path"] = str(det)
-                        _save_settings(s2)
-                    except Exception:
-                        pass
+                    self._settings_cache["extractor_exe_path"] = str(det)
+                    self._flush_settings()
         except Exception:
             pass
 
@@ -388,14 +535,17 @@ class SPCDBGui(tk.Tk):
         try:
             lb = _s.get("last_build", {})
             if isinstance(lb, dict):
+                # The file may have moved since: re-check it once on the first UI refresh.
+                lb.pop("report_exists", None)
                 self._last_build = lb
         except Exception:
             self._last_build = {}
         self._build_started_ts = None
         self._build_overall_pct = 0.0
         self._build_overall_last_phase = None
+        self._refresh_ui_pending = False  # _refresh_last_build_ui coalescing
 
-        self._last_preflight = {}
+        self._last_preflight: Optional[_PreflightSnapshot] = None
 
         # Job activity tracking (for safe auto-refresh)
         self._active_index_jobs = 0
@@ -416,6 +566,24 @@ class SPCDBGui(tk.Tk):
         self._startup_index_inflight = False
         self._startup_current = None  # tuple(kind, row_iid, input_path)
 
+        # Scan auto-index fan-out: index_disc runs in worker processes so several
+        # discs can be parsed at once (the GIL serialises threads on XML parsing).
+        self._index_pool: Optional[concurrent.futures.Executor] = None
+        self._index_pool_workers = max(1, min(8, os.cpu_count() or 1))
+        self._cache_writer: Optional[concurrent.futures.ThreadPoolExecutor] = None  # index cache writes
+        self._hash_pool: Optional[concurrent.futures.ProcessPoolExecutor] = None  # large conflict scans
+        self._hash_pool_lock = threading.Lock()
+        self._scan_index_queue = []  # list[(kind, input_path, row_iid)]
+        self._scan_index_inflight = 0
+        self._scan_current: Dict[str, tuple] = {}  # row_iid -> (kind, row_iid, input_path)
+
+        # Completion hooks for the auto-index queues; each returns early when its queue is idle.
+        self._index_done_hooks: List[Callable[[str, Optional[str], str], None]] = [
+            self._startup_note_index_done,
+            self._scan_note_index_done,
+            self._stale_note_index_done,
+        ]
+
         # Index cancellation (v0.5.8e3)
         self._index_cancel_requested = False
         self.cancel_index_btn = None
@@ -449,15 +617,29 @@ class SPCDBGui(tk.Tk):
 
         # songs model
         self._songs: List[SongAgg] = []
+        self._songs_partial_by_id: Dict[int, SongAgg] = {}  # streamed batches during a refresh
         self._selected_song_ids: Set[int] = set()
         # Songs tree view state (v0.5.6a)
         self._song_group_open_state: Dict[str, bool] = {}
-        self._song_tree_last_focus: Optional[str] = None
+        self._song_tree_last_focus: Optional[str] = None  # song iid or group label
+        self._song_group_label_by_iid: Dict[str, str] = {}
         # conflict detection/resolution
         self._conflicts: Dict[int, List[SongOccur]] = {}
         self._conflict_choices: Dict[int, str] = {}
+        # _compute_conflicts memo; bump the generation via _invalidate_conflicts_cache()
+        self._conflicts_cache: Dict[tuple, Dict[int, List[SongOccur]]] = {}
+        self._conflicts_cache_gen = 0
+        # background validation: cancel token of the current run + conflicts streamed so far
+        self._validate_cancel: Optional[threading.Event] = None
+        self._validate_partial: Dict[int, List[SongOccur]] = {}
+        # Status panel lines (see _update_status_from_validation) + debounced output stat
+        self._status_parts: Dict[str, str] = {}
+        self._status_output_job: Optional[str] = None
+        self._status_resolve_state: Optional[str] = None
         # per-disc song metadata cache: input_path -> {song_id: (title, artist)}
         self._disc_song_cache: Dict[str, Dict[int, Tuple[str, str]]] = {}
+        self._disc_song_lock = threading.Lock()
+        self._disc_song_key_locks: Dict[str, threading.Lock] = {}
 
         # Persistent cache stale tracking (v0.5.8d)
         self._base_index_stale = False
@@ -468,7 +650,12 @@ class SPCDBGui(tk.Tk):
 
         # Per-disc song ID sets (for selected/total counts in Sources)
         self._disc_song_ids_by_label: Dict[str, Set[int]] = {}
+        self._disc_map_hash: Optional[int] = None  # content hash of the last songs_ok disc map
         self._base_song_ids: Set[int] = set()
+        # Selected-song count per disc label, kept in step with _selected_song_ids
+        self._sel_counts_by_label: Dict[str, int] = {}
+        self._sel_counts_valid = False
+        self._labels_by_sid: Optional[Dict[int, List[str]]] = None  # reverse of _disc_song_ids_by_label
         self._base_product_display: str = '(unknown)'
 
         # filters
@@ -477,6 +664,9 @@ class SPCDBGui(tk.Tk):
         self.filter_selected_only_var = tk.BooleanVar(value=bool(_s.get("filter_selected_only", False)))
 
         self._filter_job: Optional[str] = None
+        self._validation_job: Optional[str] = None
+        self._counts_job: Optional[str] = None
+        self._last_render_key: Optional[tuple] = None
         self._search_entry = None
 
         self._build_ui()
@@ -524,6 +714,31 @@ class SPCDBGui(tk.Tk):
         self._bind_shortcuts()
         self.protocol("WM_DELETE_WINDOW", self._on_close)
 
+        # Worker -> UI message dispatch (status -> handler(*payload)).
+        self._queue_handlers: Dict[str, Callable[..., None]] = {
+            "index_ok": self._on_index_ok,
+            "index_err": self._on_index_err,
+            "scan_ok": self._on_scan_ok,
+            "scan_err": self._on_scan_err,
+            "songs_partial": self._on_songs_partial,
+            "songs_ok": self._on_songs_ok,
+            "songs_err": self._on_songs_err,
+            "build_log": self._on_build_log,
+            "build_ok": self._on_build_ok,
+            "build_cancel": self._on_build_cancel,
+            "build_err": self._on_build_err,
+            "preflight_validate_report": self._on_preflight_validate_report,
+            "disc_validate_log": self._on_disc_validate_log,
+            "disc_validate_done": self._on_disc_validate_done,
+            "disc_validate_err": self._on_disc_validate_err,
+            "extract_ok": self._on_extract_ok,
+            "extract_err": self._on_extract_err,
+            "validate_partial": self._on_validate_partial,
+            "validate_ok": self._on_validate_ok,
+            "validate_err": self._on_validate_err,
+        }
+
+        self.bind("<<QueueReady>>", lambda _e: self._drain_queue())
         self.after(100, self._poll_queue)
 
 
@@ -539,8 +754,8 @@ class SPCDBGui(tk.Tk):
             if hasattr(self, "src_tree") and self.src_tree is not None:
                 for iid in self.src_tree.get_children():
                     try:
-                        path = str(self.src_tree.set(iid, "path") or "").strip()
-                        label = str(self.src_tree.set(iid, "label") or "").strip()
+                        path = str(self._src_get(iid, "path") or "").strip()
+                        label = str(self._src_get(iid, "label") or "").strip()
                     except Exception:
                         continue
                     if not path:
@@ -567,21 +782,59 @@ class SPCDBGui(tk.Tk):
         }
 
     def _debounced_persist_gui_state(self) -> None:
+        # Dirty flag + single pending timer: bursts (scan inserts, typing) coalesce into one
+        # write without an after_cancel/after round-trip per call.
+        self._persist_dirty = True
+        if self._persist_job is None:
+            self._persist_job = self.after(500, self._persist_gui_state_pending)
+
+    def _persist_gui_state_pending(self) -> None:
+        self._persist_job = None
+        if self._persist_dirty:
+            self._persist_gui_state_now()
+
+    def _persist_gui_state_now(self) -> None:
+        # Called directly on close too: drop any pending write.
         try:
             if self._persist_job is not None:
                 self.after_cancel(self._persist_job)
         except Exception:
             pass
-        self._persist_job = self.after(280, self._persist_gui_state_now)
-
-    def _persist_gui_state_now(self) -> None:
         self._persist_job = None
+        self._persist_dirty = False
+        try:
+            self._settings_cache.update(self._collect_gui_settings())
+        except Exception:
+            pass
+        self._flush_settings()
+
+    def _mark_settings_dirty(self) -> None:
+        # Debounced flush of the in-memory settings cache.
+        self._settings_dirty = True
+        if self._settings_flush_job is None:
+            try:
+                self._settings_flush_job = self.after(500, self._flush_settings)
+            except Exception:
+                self._flush_settings()
+
+    def _flush_settings(self) -> None:
+        """Write the settings cache now (atomic replace); skipped when nothing changed."""
         try:
-            s = _load_settings()
-            s.update(self._collect_gui_settings())
-            _save_settings(s)
+            if self._settings_flush_job is not None:
+                self.after_cancel(self._settings_flush_job)
         except Exception:
             pass
+        self._settings_flush_job = None
+        self._settings_dirty = False
+        try:
+            blob = _settings_bytes(self._settings_cache)
+        except Exception:
+            return
+        if blob == self._settings_saved_blob:
+            return
+        # Only a successful write counts as saved; a failed one is retried on the next flush.
+        if _write_settings_bytes(blob):
+            self._settings_saved_blob = blob
 
     def _restore_saved_sources(self) -> None:
         try:
@@ -590,11 +843,11 @@ class SPCDBGui(tk.Tk):
             existing = set()
             for iid in self.src_tree.get_children():
                 try:
-                    existing.add(str(self.src_tree.set(iid, "path") or "").strip())
+                    existing.add(str(self._src_get(iid, "path") or "").strip())
                 except Exception:
                     pass
 
-            s = _load_settings()
+            s = self._settings_cache
             raw = s.get("sources", [])
             if not isinstance(raw, list):
                 return
@@ -618,7 +871,7 @@ class SPCDBGui(tk.Tk):
                 status = "not indexed"
                 if path and not Path(path).exists():
                     status = "missing"
-                self.src_tree.insert("", "end", iid=iid, values=(label, "(saved)", "", "", status, path))
+                self._src_insert(iid, (label, "(saved)", "", "", status, path))
                 self._src_labels[iid] = label
                 existing.add(path)
         except Exception:
@@ -648,9 +901,7 @@ class SPCDBGui(tk.Tk):
                 try:
                     idx, songs, stale, reason = _load_index_cache(base_path)
                     if idx is not None:
-                        product = idx.product_desc or idx.product_code or '(unknown)'
-                        if idx.product_code and idx.product_desc:
-                            product = f"{idx.product_desc} [{idx.product_code}]"
+                        product = idx.display_product
                         self._base_idx = idx
                         self._base_product_display = product
                         total = len(songs) if songs else int(idx.song_count or 0)
@@ -661,6 +912,7 @@ class SPCDBGui(tk.Tk):
                                 self._disc_song_cache[idx.input_path] = songs
                                 sids = set(songs.keys())
                                 self._disc_song_ids_by_label['Base'] = sids
+                                self._invalidate_sel_counts(disc_map_changed=True)
                                 self._base_song_ids = set(sids)
                             except Exception:
                                 pass
@@ -677,7 +929,7 @@ class SPCDBGui(tk.Tk):
         try:
             for iid in self.src_tree.get_children(''):
                 try:
-                    folder = str(self.src_tree.set(iid, 'path') or '').strip()
+                    folder = str(self._src_get(iid, 'path') or '').strip()
                 except Exception:
                     folder = ''
                 if not folder:
@@ -689,27 +941,25 @@ class SPCDBGui(tk.Tk):
                 try:
                     idx, songs, stale, reason = _load_index_cache(folder)
                     if idx is not None:
-                        product = idx.product_desc or idx.product_code or '(unknown)'
-                        if idx.product_code and idx.product_desc:
-                            product = f"{idx.product_desc} [{idx.product_code}]"
+                        product = idx.display_product
 
                         self._src_indexes[iid] = idx
                         label = None
                         try:
-                            label = self.src_tree.set(iid, 'label') or Path(folder).name
+                            label = self._src_get(iid, 'label') or Path(folder).name
                         except Exception:
                             label = Path(folder).name
                         self._src_labels[iid] = label
 
                         total = len(songs) if songs else int(idx.song_count or 0)
                         try:
-                            self.src_tree.item(iid, values=(label, product, str(idx.max_bank), f"0/{total}", 'OK (cached)', folder))
+                            self._src_set_values(iid, (label, product, str(idx.max_bank), f"0/{total}", 'OK (cached)', folder))
                         except Exception:
                             try:
-                                self.src_tree.set(iid, 'status', 'OK (cached)')
-                                self.src_tree.set(iid, 'product', product)
-                                self.src_tree.set(iid, 'banks', str(idx.max_bank))
-                                self.src_tree.set(iid, 'songs', f"0/{total}")
+                                self._src_set(iid, 'status', 'OK (cached)')
+                                self._src_set(iid, 'product', product)
+                                self._src_set(iid, 'banks', str(idx.max_bank))
+                                self._src_set(iid, 'songs', f"0/{total}")
                             except Exception:
                                 pass
 
@@ -717,12 +967,13 @@ class SPCDBGui(tk.Tk):
                             try:
                                 self._disc_song_cache[idx.input_path] = songs
                                 self._disc_song_ids_by_label[label] = set(songs.keys())
+                                self._invalidate_sel_counts(disc_map_changed=True)
                             except Exception:
                                 pass
                     elif stale:
                         self._stale_source_iids.add(iid)
                         try:
-                            self.src_tree.set(iid, 'status', 'INDEX STALE')
+                            self._src_set(iid, 'status', 'INDEX STALE')
                         except Exception:
                             pass
                         if reason:
@@ -773,7 +1024,7 @@ class SPCDBGui(tk.Tk):
 
         stale_count = 0
         try:
-            if bool(getattr(self, "_base_index_stale", False)):
+            if self._base_index_stale:
                 stale_count += 1
         except Exception:
             pass
@@ -800,11 +1051,8 @@ class SPCDBGui(tk.Tk):
 
     def _index_activity(self) -> bool:
         # Index running or queued (startup/scan/stale/manual).
-        try:
-            if int(getattr(self, '_active_index_jobs', 0) or 0) > 0:
-                return True
-        except Exception:
-            pass
+        if self._active_index_jobs > 0:
+            return True
         try:
             if bool(getattr(self, '_startup_index_inflight', False)) or bool(getattr(self, '_startup_index_queue', []) or []):
                 return True
@@ -831,7 +1079,7 @@ class SPCDBGui(tk.Tk):
             active = self._index_activity()
         except Exception:
             active = False
-        canceling = bool(getattr(self, '_index_cancel_requested', False))
+        canceling = self._index_cancel_requested
         if canceling and active:
             try:
                 btn.configure(text='Cancelling...', state='disabled')
@@ -850,7 +1098,7 @@ class SPCDBGui(tk.Tk):
                 pass
 
     def _maybe_finish_index_cancel(self) -> None:
-        if not bool(getattr(self, '_index_cancel_requested', False)):
+        if not self._index_cancel_requested:
             return
         try:
             if self._index_activity():
@@ -936,11 +1184,8 @@ class SPCDBGui(tk.Tk):
     # ---- Extraction cancellation (v0.5.8e4) ----
 
     def _extract_activity(self) -> bool:
-        try:
-            if int(getattr(self, '_active_extract_jobs', 0) or 0) > 0:
-                return True
-        except Exception:
-            pass
+        if self._active_extract_jobs > 0:
+            return True
         try:
             if bool(getattr(self, '_extract_queue', []) or []):
                 return True
@@ -957,7 +1202,7 @@ class SPCDBGui(tk.Tk):
             active = self._extract_activity()
         except Exception:
             active = False
-        canceling = bool(getattr(self, '_extract_cancel_requested', False))
+        canceling = self._extract_cancel_requested
         if canceling and active:
             try:
                 btn.configure(text='Cancelling...', state='disabled')
@@ -976,7 +1221,7 @@ class SPCDBGui(tk.Tk):
                 pass
 
     def _maybe_finish_extract_cancel(self) -> None:
-        if not bool(getattr(self, '_extract_cancel_requested', False)):
+        if not self._extract_cancel_requested:
             return
         try:
             if self._extract_activity():
@@ -1015,8 +1260,8 @@ class SPCDBGui(tk.Tk):
         # Restore queued rows back to a neutral "needs extraction" state.
         for iid in queued_iids:
             try:
-                if str(self.src_tree.set(iid, 'status') or '').strip().lower() != 'extracting…':
-                    self.src_tree.set(iid, 'status', 'needs extraction')
+                if str(self._src_get(iid, 'status') or '').strip().lower() != 'extracting…':
+                    self._src_set(iid, 'status', 'needs extraction')
             except Exception:
                 pass
 
@@ -1057,7 +1302,7 @@ class SPCDBGui(tk.Tk):
         if btn is None:
             return
         running = bool(getattr(self, '_build_running', False))
-        canceling = bool(getattr(self, '_build_cancel_requested', False))
+        canceling = self._build_cancel_requested
         if running and canceling:
             try:
                 btn.configure(text='Cancelling...', state='disabled')
@@ -1078,7 +1323,7 @@ class SPCDBGui(tk.Tk):
     def _cancel_build(self) -> None:
         if not bool(getattr(self, '_build_running', False)):
             return
-        if bool(getattr(self, '_build_cancel_requested', False)):
+        if self._build_cancel_requested:
             return
         try:
             self._build_cancel_requested = True
@@ -1143,11 +1388,11 @@ class SPCDBGui(tk.Tk):
         if selected:
             for iid in selected:
                 try:
-                    label = str(self._src_labels.get(iid) or self.src_tree.set(iid, 'label') or 'Source').strip()
+                    label = str(self._src_labels.get(iid) or self._src_get(iid, 'label') or 'Source').strip()
                 except Exception:
                     label = 'Source'
                 try:
-                    pth = str(self.src_tree.set(iid, 'path') or '').strip()
+                    pth = str(self._src_get(iid, 'path') or '').strip()
                 except Exception:
                     pth = ''
                 if pth:
@@ -1163,11 +1408,11 @@ class SPCDBGui(tk.Tk):
             try:
                 for iid in self.src_tree.get_children():
                     try:
-                        label = str(self._src_labels.get(iid) or self.src_tree.set(iid, 'label') or 'Source').strip()
+                        label = str(self._src_labels.get(iid) or self._src_get(iid, 'label') or 'Source').strip()
                     except Exception:
                         label = 'Source'
                     try:
-                        pth = str(self.src_tree.set(iid, 'path') or '').strip()
+                        pth = str(self._src_get(iid, 'path') or '').strip()
                     except Exception:
                         pth = ''
                     if pth:
@@ -1228,33 +1473,53 @@ class SPCDBGui(tk.Tk):
         try:
             def _emit(line: str) -> None:
                 try:
-                    self._queue.put(('disc_validate_log', ('[validate] ' + str(line)).rstrip()))
+                    self._post('disc_validate_log', ('[validate] ' + str(line)).rstrip())
                 except Exception:
                     pass
 
             results, report_text = validate_discs(targets, log_cb=_emit)
-            self._queue.put(('disc_validate_done', (results, report_text)))
+            self._post('disc_validate_done', (results, report_text))
         except CancelledError as ce:
-            self._queue.put(('disc_validate_err', str(ce)))
+            self._post('disc_validate_err', str(ce))
         except Exception as e:
-            self._queue.put(('disc_validate_err', str(e)))
-    def _write_validate_report_file(self, report_text: str) -> str:
-        try:
-            out_dir = str(getattr(self, 'output_path_var', tk.StringVar(value='')).get() or '').strip()
-        except Exception:
-            out_dir = ''
+            self._post('disc_validate_err', str(e))
+    def _write_validate_report_file(self, report_text: str, out_dir: Optional[str] = None) -> str:
+        # out_dir must be passed when called off the UI thread (Tk variables are not thread-safe).
+        if out_dir is None:
+            try:
+                out_dir = str(getattr(self, 'output_path_var', tk.StringVar(value='')).get() or '').strip()
+            except Exception:
+                out_dir = ''
         if not out_dir:
             return ''
         try:
             od = Path(out_dir)
-            if not od.exists() or not od.is_dir():
+            if not od.is_dir():
                 return ''
             rp = od / 'validate_report.txt'
-            rp.write_text(str(report_text), encoding='utf-8')
+            tmp = od / 'validate_report.txt.tmp'
+            tmp.write_text(str(report_text), encoding='utf-8')
+            os.replace(tmp, rp)
             return str(rp)
         except Exception:
             return ''
 
+    def _write_validate_report_async(self, report_text: str, tag: str, note_skipped: bool = False) -> None:
+        """Write validate_report.txt on a worker thread and log the outcome via the queue."""
+        try:
+            out_dir = str(getattr(self, 'output_path_var', tk.StringVar(value='')).get() or '').strip()
+        except Exception:
+            out_dir = ''
+
+        def _bg_write_validate() -> None:
+            rp = self._write_validate_report_file(report_text, out_dir=out_dir)
+            if rp:
+                self._post("build_log", f"[{tag}] Wrote validate_report.txt: {rp}")
+            elif note_skipped:
+                self._post("build_log", f"[{tag}] Write report file is enabled, but Output folder is not set or does not exist. Skipping.")
+
+        threading.Thread(target=_bg_write_validate, daemon=True).start()
+
     def _handle_disc_validate_done(self, results: list[dict], report_text: str = '') -> None:
         try:
             self._disc_validate_running = False
@@ -1298,17 +1563,7 @@ class SPCDBGui(tk.Tk):
             write_on = False
 
         if write_on and str(report_text or '').strip():
-            rp = self._write_validate_report_file(str(report_text))
-            if rp:
-                try:
-                    self._log(f"[validate] Wrote validate_report.txt: {rp}")
-                except Exception:
-                    pass
-            else:
-                try:
-                    self._log('[validate] Write report file is enabled, but Output folder is not set or does not exist. Skipping.')
-                except Exception:
-                    pass
+            self._write_validate_report_async(str(report_text), "validate", note_skipped=True)
 
     def _handle_disc_validate_err(self, err: str) -> None:
         try:
@@ -1342,7 +1597,7 @@ class SPCDBGui(tk.Tk):
         # Base (if stale)
         base_path = str(getattr(self, "base_path_var", tk.StringVar(value="")).get() or "").strip()
         try:
-            if bool(getattr(self, "_base_index_stale", False)) and base_path:
+            if self._base_index_stale and base_path:
                 tasks.append(("base", base_path, None))
         except Exception:
             pass
@@ -1356,7 +1611,7 @@ class SPCDBGui(tk.Tk):
 
         for iid in stale_iids:
             try:
-                folder = str(self.src_tree.set(iid, "path") or "").strip()
+                folder = str(self._src_get(iid, "path") or "").strip()
             except Exception:
                 folder = ""
             if not folder:
@@ -1394,7 +1649,7 @@ class SPCDBGui(tk.Tk):
         q = list(getattr(self, "_stale_index_queue", []) or [])
         if not q:
             try:
-                if bool(getattr(self, "_index_cancel_requested", False)):
+                if self._index_cancel_requested:
                     self._log("Reindex stale: cancelled.")
                 else:
                     self._log("Reindex stale: complete.")
@@ -1441,9 +1696,9 @@ class SPCDBGui(tk.Tk):
             label = None
             try:
                 if row_iid is not None:
-                    label = self.src_tree.set(row_iid, "label") or Path(input_path).name
-                    self.src_tree.set(row_iid, "product", "(indexing...)")
-                    self.src_tree.set(row_iid, "status", "indexing…")
+                    label = self._src_get(row_iid, "label") or Path(input_path).name
+                    self._src_set(row_iid, "product", "(indexing...)")
+                    self._src_set(row_iid, "status", "indexing…")
             except Exception:
                 label = None
             try:
@@ -1457,6 +1712,13 @@ class SPCDBGui(tk.Tk):
 
         self._start_index_job(kind=kind, input_path=input_path, row_iid=row_iid)
 
+    def _notify_index_done(self, kind: str, row_iid: Optional[str], input_path: str) -> None:
+        for cb in self._index_done_hooks:
+            try:
+                cb(kind, row_iid, input_path)
+            except Exception:
+                pass
+
     def _stale_note_index_done(self, kind: str, row_iid: Optional[str], input_path: str) -> None:
         cur = getattr(self, "_stale_current", None)
         if not cur:
@@ -1497,7 +1759,7 @@ class SPCDBGui(tk.Tk):
         total = len(iids)
         for iid in iids:
             try:
-                st = str(self.src_tree.set(iid, "status") or "").strip().lower()
+                st = str(self._src_get(iid, "status") or "").strip().lower()
             except Exception:
                 st = ""
             if not st:
@@ -1553,6 +1815,25 @@ class SPCDBGui(tk.Tk):
 
     def _on_close(self) -> None:
         self._persist_gui_state_now()
+        self._flush_logs()
+        try:
+            if self._index_pool is not None:
+                self._index_pool.shutdown(wait=False, cancel_futures=True)
+        except Exception:
+            pass
+        try:
+            with self._hash_pool_lock:
+                pool, self._hash_pool = self._hash_pool, None
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+        except Exception:
+            pass
+        try:
+            # Let queued cache writes finish (small files) so the next start can use them.
+            if self._cache_writer is not None:
+                self._cache_writer.shutdown(wait=True)
+        except Exception:
+            pass
         try:
             self.destroy()
         except Exception:
@@ -1657,9 +1938,9 @@ class SPCDBGui(tk.Tk):
                 return True
             if getattr(self, "_songs_refresh_running", False):
                 return True
-            if int(getattr(self, "_active_index_jobs", 0) or 0) > 0:
+            if self._active_index_jobs > 0:
                 return True
-            if int(getattr(self, "_active_extract_jobs", 0) or 0) > 0:
+            if self._active_extract_jobs > 0:
                 return True
         except Exception:
             return False
@@ -1687,7 +1968,7 @@ class SPCDBGui(tk.Tk):
                 return
 
             # If base isn't indexed yet, wait a bit (unless base path is empty).
-            if getattr(self, "_base_idx", None) is None:
+            if self._base_idx is None:
                 if not str(getattr(self, "base_path_var", tk.StringVar(value="")).get()).strip():
                     self._pending_refresh_songs = False
                     return
@@ -1741,9 +2022,9 @@ class SPCDBGui(tk.Tk):
             else:
                 # If base was restored from cache (and is OK), don't auto-index it again.
                 try:
-                    if getattr(self, "_base_idx", None) is not None and not bool(getattr(self, "_base_index_stale", False)):
+                    if self._base_idx is not None and not self._base_index_stale:
                         pass
-                    elif bool(getattr(self, "_base_index_stale", False)):
+                    elif self._base_index_stale:
                         self._log("Startup: base cache is stale; leaving for manual reindex.")
                     else:
                         if self._needs_export(bp):
@@ -1767,7 +2048,7 @@ class SPCDBGui(tk.Tk):
         try:
             for iid in self.src_tree.get_children():
                 try:
-                    folder = str(self.src_tree.set(iid, "path") or "").strip()
+                    folder = str(self._src_get(iid, "path") or "").strip()
                 except Exception:
                     folder = ""
                 if not folder:
@@ -1775,7 +2056,7 @@ class SPCDBGui(tk.Tk):
                 fp = Path(folder)
                 if not fp.exists():
                     try:
-                        self.src_tree.set(iid, "status", "missing")
+                        self._src_set(iid, "status", "missing")
                     except Exception:
                         pass
                     continue
@@ -1792,7 +2073,7 @@ class SPCDBGui(tk.Tk):
                 try:
                     if self._needs_export(fp):
                         try:
-                            self.src_tree.set(iid, "status", "needs extraction")
+                            self._src_set(iid, "status", "needs extraction")
                         except Exception:
                             pass
                         continue
@@ -1815,7 +2096,7 @@ class SPCDBGui(tk.Tk):
             return
         q = list(getattr(self, "_startup_index_queue", []) or [])
         if not q:
-            if bool(getattr(self, "_index_cancel_requested", False)):
+            if self._index_cancel_requested:
                 self._log("Startup: auto-index cancelled.")
             else:
                 self._log("Startup: auto-index complete.")
@@ -1845,9 +2126,9 @@ class SPCDBGui(tk.Tk):
             label = None
             try:
                 if row_iid is not None:
-                    label = self.src_tree.set(row_iid, "label") or Path(input_path).name
-                    self.src_tree.set(row_iid, "product", "(indexing...)")
-                    self.src_tree.set(row_iid, "status", "indexing…")
+                    label = self._src_get(row_iid, "label") or Path(input_path).name
+                    self._src_set(row_iid, "product", "(indexing...)")
+                    self._src_set(row_iid, "status", "indexing…")
             except Exception:
                 label = None
             self._progress_update("Indexing", label or Path(input_path).name, indeterminate=True)
@@ -1983,10 +2264,7 @@ class SPCDBGui(tk.Tk):
         return "".join(cleaned).strip()
 
     def _start_extract_job(self, kind: str, input_path: str, row_iid: Optional[str]) -> None:
-        try:
-            self._active_extract_jobs = int(getattr(self, "_active_extract_jobs", 0) or 0) + 1
-        except Exception:
-            self._active_extract_jobs = 1
+        self._active_extract_jobs += 1
 
         try:
             self._update_cancel_extract_ui()
@@ -1994,7 +2272,7 @@ class SPCDBGui(tk.Tk):
             pass
 
         def _log(msg: str) -> None:
-            self._queue.put(("build_log", f"[extract] {msg}"))
+            self._post("build_log", f"[extract] {msg}")
 
         def _worker() -> None:
             try:
@@ -2006,7 +2284,7 @@ class SPCDBGui(tk.Tk):
 
                 # Controller-driven extraction (Block D / 0.5.10a5). Keep GUI semantics:
                 # do not interrupt an in-flight extraction when Cancel Extract is pressed.
-                token = CancelToken(lambda: bool(getattr(self, "_extract_cancel_requested", False)))
+                token = CancelToken(lambda: self._extract_cancel_requested)
                 extract_disc_pkds(
                     exe_p,
                     disc_root,
@@ -2017,19 +2295,15 @@ class SPCDBGui(tk.Tk):
 
                 verify = verify_disc_extraction(disc_root, log_cb=_log)
 
-                self._queue.put(("extract_ok", (kind, row_iid, str(disc_root), verify)))
+                self._post("extract_ok", (kind, row_iid, str(disc_root), verify))
             except Exception as e:
-                self._queue.put(("extract_err", (kind, row_iid, input_path, str(e))))
+                self._post("extract_err", (kind, row_iid, input_path, str(e)))
 
         t = threading.Thread(target=_worker, daemon=True)
         t.start()
 
     def _extract_base(self) -> None:
-        try:
-            if bool(getattr(self, '_extract_cancel_requested', False)):
-                self._extract_cancel_requested = False
-        except Exception:
-            pass
+        self._extract_cancel_requested = False
         try:
             self._update_cancel_extract_ui()
         except Exception:
@@ -2044,11 +2318,7 @@ class SPCDBGui(tk.Tk):
         self._start_extract_job("base", p, None)
 
     def _extract_selected_source(self) -> None:
-        try:
-            if bool(getattr(self, '_extract_cancel_requested', False)):
-                self._extract_cancel_requested = False
-        except Exception:
-            pass
+        self._extract_cancel_requested = False
         try:
             self._update_cancel_extract_ui()
         except Exception:
@@ -2071,7 +2341,7 @@ class SPCDBGui(tk.Tk):
         q_set = {iid for (iid, _p) in q}
 
         for iid in sel:
-            folder = str(self.src_tree.set(iid, "path") or "").strip()
+            folder = str(self._src_get(iid, "path") or "").strip()
             if not folder:
                 missing += 1
                 continue
@@ -2090,8 +2360,8 @@ class SPCDBGui(tk.Tk):
             queued += 1
             try:
                 # Light feedback while queued.
-                if str(self.src_tree.set(iid, "status") or "").strip().lower() != "extracting…":
-                    self.src_tree.set(iid, "status", "needs extraction")
+                if str(self._src_get(iid, "status") or "").strip().lower() != "extracting…":
+                    self._src_set(iid, "status", "needs extraction")
             except Exception:
                 pass
 
@@ -2123,11 +2393,8 @@ class SPCDBGui(tk.Tk):
 
     def _kick_next_extract_queue(self) -> None:
         """Start the next queued source extraction when no other extract is running."""
-        try:
-            if bool(getattr(self, '_extract_cancel_requested', False)):
-                return
-        except Exception:
-            pass
+        if self._extract_cancel_requested:
+            return
         try:
             if getattr(self, "_build_running", False):
                 # Avoid kicking extraction during a build.
@@ -2136,10 +2403,7 @@ class SPCDBGui(tk.Tk):
         except Exception:
             pass
 
-        try:
-            if int(getattr(self, "_active_extract_jobs", 0) or 0) > 0:
-                return
-        except Exception:
+        if self._active_extract_jobs > 0:
             return
 
         q: list[tuple[str, str]] = list(getattr(self, "_extract_queue", []) or [])
@@ -2159,8 +2423,8 @@ class SPCDBGui(tk.Tk):
 
         label = None
         try:
-            label = self.src_tree.set(iid, "label") or Path(folder).name
-            self.src_tree.set(iid, "status", "extracting…")
+            label = self._src_get(iid, "label") or Path(folder).name
+            self._src_set(iid, "status", "extracting…")
         except Exception:
             label = label or Path(folder).name
 
@@ -2173,15 +2437,15 @@ class SPCDBGui(tk.Tk):
             messagebox.showerror("Index source", "Select a source disc row first.")
             return
         iid = sel[0]
-        folder = self.src_tree.set(iid, "path")
+        folder = self._src_get(iid, "path")
         if not folder:
             messagebox.showerror("Index source", "Source disc path missing.")
             return
 
-        label = self.src_tree.set(iid, "label") or Path(folder).name
+        label = self._src_get(iid, "label") or Path(folder).name
         try:
-            self.src_tree.set(iid, "product", "(indexing...)")
-            self.src_tree.set(iid, "status", "indexing…")
+            self._src_set(iid, "product", "(indexing...)")
+            self._src_set(iid, "status", "indexing…")
         except Exception:
             pass
 
@@ -2191,14 +2455,10 @@ class SPCDBGui(tk.Tk):
                 exe = self.extractor_exe_var.get().strip()
                 if exe:
                     try:
-                        self.src_tree.set(iid, "status", "extracting…")
-                    except Exception:
-                        pass
-                    try:
-                        if bool(getattr(self, '_extract_cancel_requested', False)):
-                            self._extract_cancel_requested = False
+                        self._src_set(iid, "status", "extracting…")
                     except Exception:
                         pass
+                    self._extract_cancel_requested = False
                     try:
                         self._update_cancel_extract_ui()
                     except Exception:
@@ -2647,7 +2907,7 @@ class SPCDBGui(tk.Tk):
         src_frame = ttk.LabelFrame(parent, text="Source Discs (inputs)", padding=8)
         src_frame.pack(fill=tk.BOTH, expand=False)
 
-        cols = ("label", "product", "banks", "songs", "status", "path")
+        cols = _SRC_COLS
         # v0.5.8c: allow multi-select so users can extract multiple discs in one go.
         self.src_tree = ttk.Treeview(src_frame, columns=cols, show="headings", height=7, selectmode="extended")
         self.src_tree.heading("label", text="Label")
@@ -2766,6 +3026,7 @@ class SPCDBGui(tk.Tk):
                 pass
 
     def _copy_log(self) -> None:
+        self._flush_logs()
         try:
             data = self.log_text.get("1.0", tk.END)
         except Exception:
@@ -2784,6 +3045,7 @@ class SPCDBGui(tk.Tk):
         )
         if not path:
             return
+        self._flush_logs()
         try:
             data = self.log_text.get("1.0", tk.END)
             Path(path).write_text(data, encoding="utf-8")
@@ -2791,6 +3053,7 @@ class SPCDBGui(tk.Tk):
             messagebox.showerror("Save log", str(e))
 
     def _clear_log(self) -> None:
+        self._log_buf.clear()
         try:
             self.log_text.delete("1.0", tk.END)
         except Exception:
@@ -2964,10 +3227,7 @@ class SPCDBGui(tk.Tk):
             pct = 100.0
 
         # Monotonic clamp
-        try:
-            prev = float(getattr(self, "_build_overall_pct", 0.0) or 0.0)
-        except Exception:
-            prev = 0.0
+        prev = self._build_overall_pct
         pct = max(prev, float(pct))
         pct = max(0.0, min(100.0, pct))
         try:
@@ -3017,7 +3277,7 @@ class SPCDBGui(tk.Tk):
                 pct = None
             if pct is None:
                 try:
-                    pct = int(getattr(self, "_build_overall_pct", 0) or 0)
+                    pct = int(self._build_overall_pct)
                 except Exception:
                     pct = 0
 
@@ -3105,11 +3365,30 @@ class SPCDBGui(tk.Tk):
 
     def _log(self, msg: str) -> None:
         ts = datetime.now().strftime("%H:%M:%S")
-        line = f"[{ts}] {msg}"
+        # Buffered: lines are written to the Text widget and session log in batches (~30 Hz).
+        buf = self._log_buf
+        if len(buf) == buf.maxlen:
+            # A burst filled the buffer before the timer fired: flush now instead of
+            # letting the deque silently evict the oldest lines.
+            self._flush_logs()
+        buf.append(f"[{ts}] {msg}")
+        if not self._log_flush_pending:
+            self._log_flush_pending = True
+            try:
+                self.after(33, self._flush_logs)
+            except Exception:
+                self._flush_logs()
+
+    def _flush_logs(self) -> None:
+        self._log_flush_pending = False
+        if not self._log_buf:
+            return
+        block = "\n".join(self._log_buf) + "\n"
+        self._log_buf.clear()
 
-        # GUI log view
+        # GUI log view (one insert + one scroll per batch)
         try:
-            self.log_text.insert(tk.END, line + "\n")
+            self.log_text.insert(tk.END, block)
             if getattr(self, "_log_autoscroll", None) is None or bool(self._log_autoscroll.get()):
                 self.log_text.see(tk.END)
         except Exception:
@@ -3121,7 +3400,7 @@ class SPCDBGui(tk.Tk):
             if pth is not None:
                 Path(pth).parent.mkdir(parents=True, exist_ok=True)
                 with Path(pth).open("a", encoding="utf-8") as f:
-                    f.write(line + "\n")
+                    f.write(block)
         except Exception:
             pass
 
@@ -3210,7 +3489,7 @@ class SPCDBGui(tk.Tk):
         label = Path(folder).name
         self._src_counter += 1
         iid = f"src_{self._src_counter}"
-        self.src_tree.insert("", "end", iid=iid, values=(label, "(indexing...)", "", "", "indexing…", folder))
+        self._src_insert(iid, (label, "(indexing...)", "", "", "indexing…", folder))
         self._src_labels[iid] = label
         try:
             self._update_source_disc_count()
@@ -3223,14 +3502,10 @@ class SPCDBGui(tk.Tk):
                 exe = self.extractor_exe_var.get().strip()
                 if exe:
                     try:
-                        self.src_tree.set(iid, "status", "extracting…")
-                    except Exception:
-                        pass
-                    try:
-                        if bool(getattr(self, '_extract_cancel_requested', False)):
-                            self._extract_cancel_requested = False
+                        self._src_set(iid, "status", "extracting…")
                     except Exception:
                         pass
+                    self._extract_cancel_requested = False
                     try:
                         self._update_cancel_extract_ui()
                     except Exception:
@@ -3242,8 +3517,8 @@ class SPCDBGui(tk.Tk):
 
                 # No extractor configured: keep the row but mark it clearly.
                 try:
-                    self.src_tree.set(iid, "status", "needs extraction")
-                    self.src_tree.set(iid, "product", "(pending)")
+                    self._src_set(iid, "status", "needs extraction")
+                    self._src_set(iid, "product", "(pending)")
                 except Exception:
                     pass
                 try:
@@ -3280,9 +3555,9 @@ class SPCDBGui(tk.Tk):
         def _worker() -> None:
             try:
                 found = scan_for_disc_inputs(rp, max_depth=4)
-                self._queue.put(("scan_ok", (str(rp), found)))
+                self._post("scan_ok", (str(rp), found))
             except Exception as e:
-                self._queue.put(("scan_err", (str(rp), str(e))))
+                self._post("scan_err", (str(rp), str(e)))
 
         threading.Thread(target=_worker, daemon=True).start()
 
@@ -3291,14 +3566,14 @@ class SPCDBGui(tk.Tk):
         self._log(f"Scan error ({root_path}): {err}")
         messagebox.showerror("Scan folder", f"{root_path}\n\n{err}")
 
-    def _handle_scan_ok(self, root_path: str, found_paths: list[str]) -> None:
+    def _handle_scan_ok(self, root_path: str, found_paths: list[tuple[str, str]]) -> None:
         self._progress_reset()
 
         # Existing source paths (normalized)
         existing: set[str] = set()
         try:
             for iid in self.src_tree.get_children():
-                p = str(self.src_tree.set(iid, "path") or "").strip()
+                p = str(self._src_get(iid, "path") or "").strip()
                 if not p:
                     continue
                 try:
@@ -3311,21 +3586,11 @@ class SPCDBGui(tk.Tk):
         added_iids: list[str] = []
         index_tasks: list[tuple[str, str, str]] = []  # (kind, input_path, row_iid)
 
-        for p_str in (found_paths or []):
-            try:
-                p = self._get_disc_root_for_path(Path(p_str))
-            except Exception:
-                p = Path(p_str)
-
-            if not p.exists():
-                continue
-
-            try:
-                key = str(p.resolve())
-            except Exception:
-                key = str(p)
+        # The scanner already normalized each hit to an existing disc root and resolved it.
+        for p_str, key in (found_paths or []):
             if key in existing:
                 continue
+            p = Path(p_str)
 
             label = p.name
 
@@ -3339,7 +3604,7 @@ class SPCDBGui(tk.Tk):
             except Exception:
                 pass
 
-            self.src_tree.insert("", "end", iid=iid, values=(label, "(pending)", "", "", status, str(p)))
+            self._src_insert(iid, (label, "(pending)", "", "", status, str(p)))
             if not hasattr(self, "_src_labels"):
                 self._src_labels = {}
             self._src_labels[iid] = label
@@ -3358,21 +3623,29 @@ class SPCDBGui(tk.Tk):
 
         self._log(f"Scan complete: added {len(added_iids)} new source disc(s).")
 
-        # Auto-index newly added sources sequentially (similar to startup auto-index).
+        # Auto-index newly added sources (fanned out across the index pool).
         if index_tasks:
-            self._scan_index_queue = list(index_tasks)
-            self._scan_index_inflight = False
+            self._scan_index_queue = list(getattr(self, "_scan_index_queue", []) or []) + list(index_tasks)
             try:
                 self.after(100, self._scan_kick_next_index)
             except Exception:
                 self._scan_kick_next_index()
 
     def _scan_kick_next_index(self) -> None:
-        if getattr(self, "_scan_index_inflight", False):
-            return
+        inflight = int(getattr(self, "_scan_index_inflight", 0) or 0)
 
-        # Don't start if busy; try again soon.
-        if self._any_long_job_running():
+        # Don't start if busy (other than our own scan index jobs); try again soon.
+        busy = False
+        try:
+            if getattr(self, "_build_running", False) or getattr(self, "_songs_refresh_running", False):
+                busy = True
+            elif self._active_extract_jobs > 0:
+                busy = True
+            elif self._active_index_jobs > inflight:
+                busy = True
+        except Exception:
+            busy = False
+        if busy:
             try:
                 self.after(300, self._scan_kick_next_index)
             except Exception:
@@ -3381,7 +3654,9 @@ class SPCDBGui(tk.Tk):
 
         q = list(getattr(self, "_scan_index_queue", []) or [])
         if not q:
-            if bool(getattr(self, "_index_cancel_requested", False)):
+            if inflight > 0:
+                return
+            if self._index_cancel_requested:
                 self._log("Scan: auto-index cancelled.")
             else:
                 self._log("Scan: auto-index complete.")
@@ -3396,52 +3671,104 @@ class SPCDBGui(tk.Tk):
                 pass
             return
 
-        kind, input_path, row_iid = q.pop(0)
-        self._scan_index_queue = q
-        self._scan_index_inflight = True
-        self._scan_current = (kind, row_iid, input_path)
+        # Fan out up to the pool size; completions re-kick to fill free slots.
+        cap = int(getattr(self, "_index_pool_workers", 1) or 1)
+        while q and inflight < cap:
+            kind, input_path, row_iid = q.pop(0)
+            inflight += 1
+            self._scan_index_queue = q
+            self._scan_index_inflight = inflight
+            self._scan_current[str(row_iid)] = (kind, row_iid, input_path)
 
-        label = None
-        try:
-            if row_iid is not None:
-                label = self.src_tree.set(row_iid, "label") or Path(input_path).name
-                self.src_tree.set(row_iid, "product", "(indexing...)")
-                self.src_tree.set(row_iid, "status", "indexing…")
-        except Exception:
             label = None
+            try:
+                if row_iid is not None:
+                    label = self._src_get(row_iid, "label") or Path(input_path).name
+                    self._src_set(row_iid, "product", "(indexing...)")
+                    self._src_set(row_iid, "status", "indexing…")
+            except Exception:
+                label = None
 
-        self._progress_update("Indexing", label or Path(input_path).name, indeterminate=True)
-        self._log(f"Scan: indexing source: {input_path}")
-        self._start_index_job(kind=kind, input_path=input_path, row_iid=row_iid)
+            self._progress_update("Indexing", label or Path(input_path).name, indeterminate=True)
+            self._log(f"Scan: indexing source: {input_path}")
+            self._start_index_job(kind=kind, input_path=input_path, row_iid=row_iid)
 
     def _scan_note_index_done(self, kind: str, row_iid: Optional[str], input_path: str) -> None:
-        cur = getattr(self, "_scan_current", None)
-        if not cur:
-            return
-        ck, ciid, cpath = cur
-        try:
-            if ck != kind:
-                return
-            if ciid != row_iid:
-                return
-            if str(Path(cpath).resolve()) != str(Path(input_path).resolve()):
-                return
-        except Exception:
+        # Inflight scan jobs are keyed by row iid, which already identifies the disc;
+        # no need to resolve() and compare paths on every completion.
+        cur = self._scan_current.get(str(row_iid))
+        if not cur or cur[0] != kind:
             return
 
-        self._scan_current = None
-        self._scan_index_inflight = False
+        self._scan_current.pop(str(row_iid), None)
+        self._scan_index_inflight = max(0, int(getattr(self, "_scan_index_inflight", 0) or 0) - 1)
         try:
             self.after(60, self._scan_kick_next_index)
         except Exception:
             self._scan_kick_next_index()
 
+    # -------- Sources tree cell access (shadowed) --------
+
+    def _src_insert(self, iid: str, values: tuple) -> None:
+        self.src_tree.insert("", "end", iid=iid, values=values)
+        self._src_row_data[iid] = {c: str(v) for c, v in zip(_SRC_COLS, values)}
+
+    def _src_get(self, iid: str, col: str) -> str:
+        row = self._src_row_data.get(iid)
+        if row is None:
+            # Not inserted through _src_insert: fall back to the widget (raises for unknown rows).
+            return self.src_tree.set(iid, col)
+        return row.get(col, "")
+
+    def _src_set(self, iid: str, col: str, value) -> None:
+        self.src_tree.set(iid, col, value)
+        row = self._src_row_data.get(iid)
+        if row is not None:
+            row[col] = str(value)
+
+    def _src_set_values(self, iid: str, values: tuple) -> None:
+        self.src_tree.item(iid, values=values)
+        self._src_row_data[iid] = {c: str(v) for c, v in zip(_SRC_COLS, values)}
+
+    def _src_delete(self, iid: str) -> None:
+        self.src_tree.delete(iid)
+        self._src_row_data.pop(iid, None)
+        self._src_dirty_iids.discard(iid)
+
+    def _tree_set(self, iid: str, col: str, value) -> None:
+        """Deferred cell write: update the shadow now, push dirty rows to Tk once on idle."""
+        row = self._src_row_data.get(iid)
+        if row is None:
+            self._src_set(iid, col, value)
+            return
+        v = str(value)
+        if row.get(col) == v:
+            return
+        row[col] = v
+        self._src_dirty_iids.add(iid)
+        if not self._tree_flush_scheduled:
+            self._tree_flush_scheduled = True
+            self.after_idle(self._flush_tree)
+
+    def _flush_tree(self) -> None:
+        self._tree_flush_scheduled = False
+        dirty, self._src_dirty_iids = self._src_dirty_iids, set()
+        for iid in dirty:
+            row = self._src_row_data.get(iid)
+            if row is None:
+                continue
+            try:
+                # One item(values=...) per row instead of one set() per cell.
+                self.src_tree.item(iid, values=tuple(row.get(c, "") for c in _SRC_COLS))
+            except Exception:
+                pass
+
     def _remove_selected(self) -> None:
         sel = self.src_tree.selection()
         if not sel:
             return
         for iid in sel:
-            self.src_tree.delete(iid)
+            self._src_delete(iid)
             if iid in self._src_indexes:
                 idx = self._src_indexes[iid]
                 del self._src_indexes[iid]
@@ -3451,6 +3778,7 @@ class SPCDBGui(tk.Tk):
                 # drop cached song map
                 if getattr(self, '_disc_song_cache', None) is not None:
                     self._disc_song_cache.pop(idx.input_path, None)
+        self._invalidate_conflicts_cache()
         # keep songs list as-is until refresh
         self._debounced_persist_gui_state()
         try:
@@ -3459,10 +3787,7 @@ class SPCDBGui(tk.Tk):
             pass
 
     def _start_index_job(self, kind: str, input_path: str, row_iid: Optional[str], job_id: Optional[str] = None) -> None:
-        try:
-            self._active_index_jobs = int(getattr(self, "_active_index_jobs", 0) or 0) + 1
-        except Exception:
-            self._active_index_jobs = 1
+        self._active_index_jobs += 1
 
         try:
             self._update_cancel_index_ui()
@@ -3478,7 +3803,7 @@ class SPCDBGui(tk.Tk):
                     target = Path(input_path).name
                     if row_iid is not None:
                         try:
-                            target = self.src_tree.set(row_iid, 'label') or target
+                            target = self._src_get(row_iid, 'label') or target
                         except Exception:
                             pass
                 job_id = self._job_add('Index', target, status='Running')
@@ -3490,15 +3815,44 @@ class SPCDBGui(tk.Tk):
             except Exception:
                 pass
 
-        def _worker() -> None:
+        def _done(fut: concurrent.futures.Future) -> None:
+            # Runs on an executor thread: only hand the result to the UI queue.
             try:
-                idx = index_disc(input_path)
-                self._queue.put(("index_ok", (kind, row_iid, idx, job_id)))
+                idx = fut.result()
+                self._post("index_ok", (kind, row_iid, idx, job_id))
             except Exception as e:
-                self._queue.put(("index_err", (kind, row_iid, input_path, str(e), job_id)))
+                self._post("index_err", (kind, row_iid, input_path, str(e), job_id))
 
-        t = threading.Thread(target=_worker, daemon=True)
-        t.start()
+        try:
+            fut = self._get_index_pool().submit(index_disc, input_path)
+        except Exception:
+            # Pool unavailable (e.g. broken by a crashed worker): run inline on a thread.
+            self._index_pool = None
+            fut = concurrent.futures.Future()
+
+            def _worker() -> None:
+                try:
+                    fut.set_result(index_disc(input_path))
+                except Exception as e:
+                    fut.set_exception(e)
+
+            threading.Thread(target=_worker, daemon=True).start()
+        fut.add_done_callback(_done)
+
+    def _get_index_pool(self) -> concurrent.futures.Executor:
+        pool = getattr(self, "_index_pool", None)
+        if pool is None:
+            workers = int(getattr(self, "_index_pool_workers", 1) or 1)
+            try:
+                # spawn (not fork): the parent holds a live Tk interpreter and threads.
+                pool = concurrent.futures.ProcessPoolExecutor(
+                    max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+                )
+            except Exception:
+                # No multiprocessing support (restricted/frozen environments).
+                pool = concurrent.futures.ThreadPoolExecutor(max_workers=workers)
+            self._index_pool = pool
+        return pool
 
     # -------- Songs tab --------
 
@@ -3567,8 +3921,9 @@ class SPCDBGui(tk.Tk):
         yscroll.grid(row=0, column=1, sticky="ns")
 
         self.songs_tree.bind("<Button-1>", self._on_song_click)
-        self.songs_tree.bind("<<TreeviewOpen>>", self._on_song_group_toggle)
-        self.songs_tree.bind("<<TreeviewClose>>", self._on_song_group_toggle)
+        self.songs_tree.bind("<<TreeviewOpen>>", lambda e: self._on_song_group_toggle(e, True))
+        self.songs_tree.bind("<<TreeviewClose>>", lambda e: self._on_song_group_toggle(e, False))
+        self.songs_tree.bind("<<TreeviewSelect>>", self._on_song_tree_select)
 
         bottom = ttk.Frame(parent)
         bottom.pack(fill=tk.X, pady=(6, 0))
@@ -3583,14 +3938,13 @@ class SPCDBGui(tk.Tk):
         ttk.Label(parent, text="Tip: Click the ✓ column to toggle a song. Click a disc header to collapse/expand.", foreground=tip_fg).pack(anchor="w", pady=(6, 0))
 
     def _set_sources_dropdown(self) -> None:
-        values = ["All", "Base"]
-        # source labels
-        for iid in self.src_tree.get_children():
-            label = self.src_tree.set(iid, "label")
-            if label and label not in values:
-                values.append(label)
-        self.source_combo["values"] = tuple(values)
-        if self.filter_source_var.get() not in values:
+        # Source labels in row order, deduped in one pass (dict keeps insertion order).
+        labels = dict.fromkeys(["All", "Base"])
+        labels.update(dict.fromkeys(self._src_get(iid, "label") for iid in self.src_tree.get_children()))
+        labels.pop("", None)
+        values = tuple(labels)
+        self.source_combo["values"] = values
+        if self.filter_source_var.get() not in labels:
             self.filter_source_var.set("All")
 
     def _refresh_songs(self) -> None:
@@ -3602,6 +3956,7 @@ class SPCDBGui(tk.Tk):
             return
 
         self._songs_refresh_running = True
+        self._songs_partial_by_id = {}
 
         self._progress_update("Indexing songs", "Building song list…", indeterminate=True)
         self._log("Refreshing songs list (this can take a few seconds on large libraries)...")
@@ -3609,6 +3964,9 @@ class SPCDBGui(tk.Tk):
         self._update_disc_selection_counts()
         self._set_sources_dropdown()
         self._run_validation_async()
+        # Per-disc id sets are rebuilt from the streamed batches.
+        self._disc_song_ids_by_label = {}
+        self._invalidate_sel_counts(disc_map_changed=True)
 
         base_idx = self._base_idx
         src_indexes = dict(self._src_indexes)  # snapshot
@@ -3621,15 +3979,25 @@ class SPCDBGui(tk.Tk):
                     label = Path(di.input_path).name
                     # keep the user-facing label from treeview if present
                     try:
-                        label = self.src_tree.set(iid, "label") or label
+                        label = self._src_get(iid, "label") or label
                     except Exception:
                         pass
                     discs.append((label, di, False))
 
-                songs_out, disc_song_ids_by_label = build_song_catalog(discs)
-                self._queue.put(("songs_ok", (songs_out, disc_song_ids_by_label)))
+                # Stream one batch per disc so the table fills in while later discs load.
+                by_id: Dict[int, SongAgg] = {}
+                disc_song_ids_by_label: Dict[str, Set[int]] = {}
+                for label, batch, ids in iter_song_catalog(discs):
+                    disc_song_ids_by_label.setdefault(label, set()).update(ids)
+                    for s in batch:
+                        by_id[s.song_id] = s
+                    self._post("songs_partial", (label, batch, ids))
+                songs_out = [by_id[sid] for sid in sorted(by_id)]
+                # Content hash so the UI can skip rebuilding an unchanged per-disc map.
+                disc_map_hash = hash(tuple(sorted((k, frozenset(v)) for k, v in disc_song_ids_by_label.items())))
+                self._post("songs_ok", (songs_out, disc_song_ids_by_label, disc_map_hash))
             except Exception as e:
-                self._queue.put(("songs_err", str(e)))
+                self._post("songs_err", str(e))
 
         threading.Thread(target=_worker, daemon=True).start()
 
@@ -3659,71 +4027,42 @@ class SPCDBGui(tk.Tk):
             return True
 
         visible = [s for s in self._songs if match(s)]
-        self._render_songs_table(visible)
+        # Skip the Treeview rebuild when rows (incl. metadata) and selection marks are unchanged.
+        render_key = (
+            src,
+            hash(tuple(visible)),
+            hash(frozenset(self._selected_song_ids)),
+        )
+        if render_key != self._last_render_key:
+            self._render_songs_table(visible)
+            self._last_render_key = render_key
         self.songs_status_var.set(
             f"Songs: {len(self._songs)} | Visible: {len(visible)} | Selected: {len(self._selected_song_ids)}"
         )
         self._update_output_suggestion()
-        self._update_disc_selection_counts()
-        self._run_validation_async()
+        self._request_counts_update()
+        self._request_validation()
 
     def _render_songs_table(self, rows: List[SongAgg]) -> None:
         # Collapsible groups by disc (v0.5.6a: preserve group open state + scroll + selection)
+        # Group open state and the focused row are tracked by the tree event handlers,
+        # so nothing is read back from the widget here apart from the scroll position.
         yview = None
-        open_by_group: Dict[str, bool] = dict(getattr(self, "_song_group_open_state", {}) or {})
+        open_by_group: Dict[str, bool] = self._song_group_open_state
+        last_focus = self._song_tree_last_focus
         focus_item: Optional[str] = None
         focus_group_label: Optional[str] = None
-        sel_item: Optional[str] = None
-        sel_group_label: Optional[str] = None
+        if last_focus:
+            if last_focus.startswith("song_"):
+                focus_item = last_focus
+            else:
+                focus_group_label = last_focus
 
         try:
             yview = self.songs_tree.yview()
         except Exception:
             yview = None
 
-        # Capture current group open/close state + selection/focus before we clear the tree.
-        try:
-            for gid in self.songs_tree.get_children(""):
-                try:
-                    txt = str(self.songs_tree.item(gid, "text") or "")
-                    label = (txt.split("  (", 1)[0] if "  (" in txt else txt).strip()
-                    if label:
-                        open_by_group[label] = bool(self.songs_tree.item(gid, "open"))
-                except Exception:
-                    continue
-            self._song_group_open_state = open_by_group
-        except Exception:
-            pass
-
-        try:
-            f = str(self.songs_tree.focus() or "")
-            if f:
-                if f.startswith("song_"):
-                    focus_item = f
-                else:
-                    try:
-                        txt = str(self.songs_tree.item(f, "text") or "")
-                        focus_group_label = (txt.split("  (", 1)[0] if "  (" in txt else txt).strip() or None
-                    except Exception:
-                        focus_group_label = None
-        except Exception:
-            pass
-
-        try:
-            sels = [str(i) for i in (self.songs_tree.selection() or ())]
-            for s in sels:
-                if s.startswith("song_"):
-                    sel_item = s
-                    break
-            if sel_item is None and sels:
-                try:
-                    txt = str(self.songs_tree.item(sels[0], "text") or "")
-                    sel_group_label = (txt.split("  (", 1)[0] if "  (" in txt else txt).strip() or None
-                except Exception:
-                    sel_group_label = None
-        except Exception:
-            pass
-
         try:
             self.songs_tree.delete(*self.songs_tree.get_children())
         except Exception:
@@ -3749,6 +4088,8 @@ class SPCDBGui(tk.Tk):
 
         gnum = 0
         group_iid_by_label: Dict[str, str] = {}
+        group_label_by_iid: Dict[str, str] = {}
+        self._song_group_label_by_iid = group_label_by_iid
         for gkey in ordered:
             songs = groups.get(gkey) or []
             if not songs:
@@ -3760,6 +4101,7 @@ class SPCDBGui(tk.Tk):
             open_state = bool(open_by_group.get(gkey, True))
             self.songs_tree.insert("", "end", iid=gid, text=header, values=("", "", "", ""), open=open_state, tags=("group",))
             group_iid_by_label[gkey] = gid
+            group_label_by_iid[gid] = gkey
 
             for s in sorted(songs, key=lambda x: x.song_id):
                 iid = f"song_{s.song_id}"
@@ -3779,12 +4121,8 @@ class SPCDBGui(tk.Tk):
         # Restore focus/selection (do not force-scroll; keep user's scroll position)
         try:
             target: Optional[str] = None
-            if sel_item and self.songs_tree.exists(sel_item):
-                target = sel_item
-            elif focus_item and self.songs_tree.exists(focus_item):
+            if focus_item and self.songs_tree.exists(focus_item):
                 target = focus_item
-            elif sel_group_label and sel_group_label in group_iid_by_label:
-                target = group_iid_by_label[sel_group_label]
             elif focus_group_label and focus_group_label in group_iid_by_label:
                 target = group_iid_by_label[focus_group_label]
             if target:
@@ -3806,8 +4144,10 @@ class SPCDBGui(tk.Tk):
             pass
 
 
-    def _on_song_group_toggle(self, _event=None) -> None:
+    def _on_song_group_toggle(self, _event=None, open_: bool = True) -> None:
         """Track disc group expand/collapse so refresh/filter keeps it stable (v0.5.6a)."""
+        # <<TreeviewOpen>>/<<TreeviewClose>> fire before the item flips, so the new
+        # state comes from the binding rather than from item(iid, "open").
         try:
             iid = str(self.songs_tree.focus() or "")
             if not iid:
@@ -3817,14 +4157,27 @@ class SPCDBGui(tk.Tk):
                     iid = str(self.songs_tree.parent(iid) or iid)
                 except Exception:
                     return
-            txt = str(self.songs_tree.item(iid, "text") or "")
-            label = (txt.split("  (", 1)[0] if "  (" in txt else txt).strip()
+            label = self._song_group_label_by_iid.get(iid)
             if not label:
                 return
-            self._song_group_open_state[label] = bool(self.songs_tree.item(iid, "open"))
+            self._song_group_open_state[label] = bool(open_)
         except Exception:
             pass
 
+    def _on_song_tree_select(self, _event=None) -> None:
+        """Remember the selected row (song iid or group label) for the next re-render."""
+        try:
+            sels = [str(i) for i in (self.songs_tree.selection() or ())]
+        except Exception:
+            return
+        if not sels:
+            return
+        for iid in sels:
+            if iid.startswith("song_"):
+                self._song_tree_last_focus = iid
+                return
+        self._song_tree_last_focus = self._song_group_label_by_iid.get(sels[0]) or self._song_tree_last_focus
+
 
     def _on_song_click(self, event) -> None:
         region = self.songs_tree.identify("region", event.x, event.y)
@@ -3842,10 +4195,7 @@ class SPCDBGui(tk.Tk):
         except ValueError:
             return
 
-        if sid in self._selected_song_ids:
-            self._selected_song_ids.remove(sid)
-        else:
-            self._selected_song_ids.add(sid)
+        self._sel_toggle(sid)
 
         # update row
         vals = list(self.songs_tree.item(row, "values"))
@@ -3856,6 +4206,47 @@ class SPCDBGui(tk.Tk):
         # Update group header counts (cheap: re-render visible set)
         self._apply_filter()
 
+    # -------- Per-disc selected counts (maintained incrementally) --------
+
+    def _invalidate_sel_counts(self, disc_map_changed: bool = False) -> None:
+        """Force a full recount on next read (bulk selection edits, new disc id sets)."""
+        self._sel_counts_valid = False
+        if disc_map_changed:
+            self._labels_by_sid = None
+
+    def _sel_toggle(self, sid: int) -> None:
+        """Flip one song's selection and apply the +/-1 delta to each disc holding it."""
+        if sid in self._selected_song_ids:
+            self._selected_song_ids.remove(sid)
+            delta = -1
+        else:
+            self._selected_song_ids.add(sid)
+            delta = 1
+        if not self._sel_counts_valid:
+            return
+        if self._labels_by_sid is None:
+            by_sid: Dict[int, List[str]] = {}
+            for label, ids in self._disc_song_ids_by_label.items():
+                for x in ids:
+                    by_sid.setdefault(x, []).append(label)
+            self._labels_by_sid = by_sid
+        counts = self._sel_counts_by_label
+        for label in self._labels_by_sid.get(sid, ()):
+            counts[label] = counts.get(label, 0) + delta
+
+    def _selection_counts(self) -> Dict[str, int]:
+        if not self._sel_counts_valid:
+            sel = self._selected_song_ids
+            if not sel:
+                self._sel_counts_by_label = dict.fromkeys(self._disc_song_ids_by_label, 0)
+            else:
+                # set & set walks the smaller operand in C; no per-label copies are made.
+                self._sel_counts_by_label = {
+                    label: len(sel & ids) for label, ids in self._disc_song_ids_by_label.items()
+                }
+            self._sel_counts_valid = True
+        return self._sel_counts_by_label
+
     def _bulk_select_all(self, mode: str) -> None:
         sids = [s.song_id for s in self._songs]
         if mode == "select":
@@ -3867,6 +4258,7 @@ class SPCDBGui(tk.Tk):
             self._selected_song_ids = set(sids).difference(cur)
         else:
             return
+        self._invalidate_sel_counts()
         self._apply_filter()
 
     def _bulk_select(self, mode: str) -> None:
@@ -3895,12 +4287,16 @@ class SPCDBGui(tk.Tk):
         else:
             return
 
+        self._invalidate_sel_counts()
         self._apply_filter()
 
     def _set_all_song_groups_open(self, open_: bool) -> None:
         try:
             for gid in list(self.songs_tree.get_children("")):
                 self.songs_tree.item(gid, open=bool(open_))
+                label = self._song_group_label_by_iid.get(str(gid))
+                if label:
+                    self._song_group_open_state[label] = bool(open_)
         except Exception:
             pass
 
@@ -3916,7 +4312,7 @@ class SPCDBGui(tk.Tk):
         if not path:
             return
         data = {"selected_song_ids": sorted(self._selected_song_ids)}
-        Path(path).write_text(json.dumps(data, indent=2), encoding="utf-8")
+        Path(path).write_bytes(json_dumps_bytes(data, pretty=True))
         messagebox.showinfo("Save selection", f"Saved {len(self._selected_song_ids)} songs.")
 
     def _load_selection(self) -> None:
@@ -3927,7 +4323,7 @@ class SPCDBGui(tk.Tk):
         if not path:
             return
         try:
-            data = json.loads(Path(path).read_text(encoding="utf-8"))
+            data = json_loads(Path(path).read_bytes())
             ids = data.get("selected_song_ids", [])
             new_sel: Set[int] = set()
             for x in ids:
@@ -3936,6 +4332,7 @@ class SPCDBGui(tk.Tk):
                 except Exception:
                     continue
             self._selected_song_ids = new_sel
+            self._invalidate_sel_counts()
             self._apply_filter()
             self._update_disc_selection_counts()
             messagebox.showinfo("Load selection", f"Loaded {len(self._selected_song_ids)} selected songs.")
@@ -3944,282 +4341,347 @@ class SPCDBGui(tk.Tk):
 
     # -------- Queue handlers --------
 
-    def _poll_queue(self) -> None:
+    def _post(self, status: str, payload: object = None) -> None:
+        """Hand a message to the UI thread (safe from any thread) and wake the Tk loop."""
+        self._queue.put((status, payload))
+        self._notify_queue()
+
+    def _notify_queue(self) -> None:
+        """Wake the Tk loop to drain the queue; one <<QueueReady>> per burst."""
+        if self._queue_wake_pending:
+            return
+        self._queue_wake_pending = True
         try:
-            while True:
+            self.event_generate("<<QueueReady>>", when="tail")
+        except Exception:
+            # Non-threaded Tcl or window gone: the fallback poll picks the message up.
+            self._queue_wake_pending = False
+
+    def _drain_queue(self) -> None:
+        # Clear before draining so a put racing with the drain always re-arms a wakeup.
+        self._queue_wake_pending = False
+        handlers = self._queue_handlers
+        # Bounded drain: handle at most one batch, then yield so Tk can repaint under bursts.
+        for _ in range(_QUEUE_DRAIN_BATCH):
+            try:
                 status, payload = self._queue.get_nowait()
-                if status == "index_ok":
-                    try:
-                        self._active_index_jobs = max(0, int(getattr(self, "_active_index_jobs", 0) or 0) - 1)
-                    except Exception:
-                        self._active_index_jobs = 0
-                    job_id = None
-                    try:
-                        if isinstance(payload, tuple) and len(payload) == 4:
-                            kind, row_iid, idx, job_id = payload  # type: ignore[misc]
-                        else:
-                            kind, row_iid, idx = payload  # type: ignore[misc]
-                    except Exception:
-                        kind, row_iid, idx = payload  # type: ignore[misc]
-                    try:
-                        self._job_set_status(job_id, 'Done')
-                    except Exception:
-                        pass
-                    self._handle_index_ok(kind, row_iid, idx)
-                    try:
-                        self._update_cancel_index_ui()
-                    except Exception:
-                        pass
-                    try:
-                        # Defer cancel completion slightly so any queue "cancelled/complete" logs can run first.
-                        self.after(180, self._maybe_finish_index_cancel)
-                    except Exception:
-                        pass
-                elif status == "index_err":
-                    try:
-                        self._active_index_jobs = max(0, int(getattr(self, "_active_index_jobs", 0) or 0) - 1)
-                    except Exception:
-                        self._active_index_jobs = 0
-                    job_id = None
-                    try:
-                        if isinstance(payload, tuple) and len(payload) == 5:
-                            kind, row_iid, input_path, err, job_id = payload  # type: ignore[misc]
-                        else:
-                            kind, row_iid, input_path, err = payload  # type: ignore[misc]
-                    except Exception:
-                        kind, row_iid, input_path, err = payload  # type: ignore[misc]
-                    try:
-                        self._job_set_status(job_id, 'Failed')
-                    except Exception:
-                        pass
-                    self._handle_index_err(kind, row_iid, input_path, err)
-                    try:
-                        self._update_cancel_index_ui()
-                    except Exception:
-                        pass
-                    try:
-                        # Defer cancel completion slightly so any queue "cancelled/complete" logs can run first.
-                        self.after(180, self._maybe_finish_index_cancel)
-                    except Exception:
-                        pass
-                elif status == "scan_ok":
-                    root_path, found_paths = payload  # type: ignore[misc]
-                    self._handle_scan_ok(str(root_path), list(found_paths or []))
-                elif status == "scan_err":
-                    root_path, err = payload  # type: ignore[misc]
-                    self._handle_scan_err(str(root_path), str(err))
-                elif status == "songs_ok":
-                    try:
-                        self._songs_refresh_running = False
-                    except Exception:
-                        pass
-                    disc_map = None
-                    songs_out = payload
-                    if isinstance(payload, tuple) and len(payload) == 2:
-                        songs_out, disc_map = payload
-                    self._handle_songs_ok(songs_out, disc_map)
-                elif status == "songs_err":
-                    try:
-                        self._songs_refresh_running = False
-                    except Exception:
-                        pass
-                    err = payload  # type: ignore[assignment]
-                    self._handle_songs_err(err)
-                elif status == "build_log":
-                    msg = payload  # type: ignore[assignment]
-                    s = str(msg)
-                    if not self._maybe_handle_progress_line(s):
-                        self._log(s)
-                elif status == "build_ok":
-                    outp = payload  # type: ignore[assignment]
-                    self._handle_build_ok(str(outp))
-                elif status == "build_cancel":
-                    outp, msg = payload  # type: ignore[misc]
-                    self._handle_build_cancel(str(outp), str(msg))
-                elif status == "build_err":
-                    err = payload  # type: ignore[assignment]
-                    self._handle_build_err(str(err))
-
-                elif status == "preflight_validate_report":
-                    report_text = str(payload or '')
-                    try:
-                        self._last_validate_report_text = report_text
-                    except Exception:
-                        pass
-                    try:
-                        self._update_validate_ui()
-                    except Exception:
-                        pass
-                    # Optional: also write validate_report.txt (uses the existing Validate setting)
-                    write_on = False
-                    try:
-                        write_on = bool(getattr(self, 'validate_write_report_var', tk.BooleanVar(value=False)).get())
-                    except Exception:
-                        write_on = False
-                    if write_on and report_text.strip():
-                        rp = self._write_validate_report_file(report_text)
-                        if rp:
-                            try:
-                                self._log(f"[preflight] Wrote validate_report.txt: {rp}")
-                            except Exception:
-                                pass
+            except queue.Empty:
+                return
+            handler = handlers.get(status)
+            if handler is None:
+                continue
+            # Tuple payloads are positional args; optional trailing fields use defaults.
+            if type(payload) is tuple:
+                handler(*payload)
+            else:
+                handler(payload)
+        # Batch exhausted with messages possibly left: continue on the next idle pass.
+        self._queue_wake_pending = True
+        try:
+            self.after_idle(self._drain_queue)
+        except Exception:
+            self._queue_wake_pending = False
 
-                elif status == "disc_validate_log":
-                    msg = payload  # type: ignore[assignment]
-                    self._log(str(msg))
-                elif status == "disc_validate_done":
-                    results = payload  # type: ignore[assignment]
-                    report_text = ''
-                    if isinstance(payload, tuple) and len(payload) >= 2:
-                        results = payload[0]
-                        report_text = str(payload[1] or '')
-                    try:
-                        self._handle_disc_validate_done(list(results or []), report_text=report_text)
-                    except Exception:
-                        self._handle_disc_validate_done([], report_text=report_text)
-                elif status == "disc_validate_err":
-                    err = payload  # type: ignore[assignment]
-                    self._handle_disc_validate_err(str(err))
+    def _poll_queue(self) -> None:
+        # Messages are normally drained on <<QueueReady>>; this slow poll is only a watchdog.
+        self._drain_queue()
+        self.after(500, self._poll_queue)
 
+    # -------- Queue message handlers (dispatched from _poll_queue) --------
 
-                elif status == "extract_ok":
-                    try:
-                        self._active_extract_jobs = max(0, int(getattr(self, "_active_extract_jobs", 0) or 0) - 1)
-                    except Exception:
-                        self._active_extract_jobs = 0
-                    try:
-                        self._update_cancel_extract_ui()
-                    except Exception:
-                        pass
-                    verify = {}
-                    try:
-                        if isinstance(payload, tuple) and len(payload) >= 4:
-                            kind, row_iid, disc_root, verify = payload  # type: ignore[misc]
-                        else:
-                            kind, row_iid, disc_root = payload  # type: ignore[misc]
-                    except Exception:
-                        kind, row_iid, disc_root = payload  # type: ignore[misc]
-                        verify = {}
+    def _on_index_ok(self, kind: str, row_iid: Optional[str], idx: DiscIndex, job_id: Optional[str] = None) -> None:
+        self._active_index_jobs = max(0, self._active_index_jobs - 1)
+        try:
+            self._job_set_status(job_id, 'Done')
+        except Exception:
+            pass
+        self._handle_index_ok(kind, row_iid, idx)
+        try:
+            self._update_cancel_index_ui()
+        except Exception:
+            pass
+        try:
+            # Defer cancel completion slightly so any queue "cancelled/complete" logs can run first.
+            self.after(180, self._maybe_finish_index_cancel)
+        except Exception:
+            pass
 
-                    try:
-                        if isinstance(verify, dict) and verify:
-                            if bool(verify.get("ok")):
-                                self._log(f"[verify] OK: {disc_root}")
-                            else:
-                                errs = verify.get("errors") or []
-                                if errs:
-                                    self._log(f"[verify] FAIL: {disc_root}: {errs[0]}")
-                                else:
-                                    self._log(f"[verify] FAIL: {disc_root} (see log)")
-                    except Exception:
-                        pass
+    def _on_index_err(self, kind: str, row_iid: Optional[str], input_path: str, err: str, job_id: Optional[str] = None) -> None:
+        self._active_index_jobs = max(0, self._active_index_jobs - 1)
+        try:
+            self._job_set_status(job_id, 'Failed')
+        except Exception:
+            pass
+        self._handle_index_err(kind, row_iid, input_path, err)
+        try:
+            self._update_cancel_index_ui()
+        except Exception:
+            pass
+        try:
+            # Defer cancel completion slightly so any queue "cancelled/complete" logs can run first.
+            self.after(180, self._maybe_finish_index_cancel)
+        except Exception:
+            pass
 
-                    # Offer cleanup (move Pack*.pkd_out into _spcdb_trash) only if verification passed.
-                    try:
-                        if isinstance(verify, dict) and bool(verify.get("ok")):
-                            arts = verify.get("artifacts") or {}
-                            pkd_out_dirs = list(arts.get("pkd_out_dirs", []) or [])
-                            pkd_files = list(arts.get("pkd_files", []) or [])
-                            if pkd_out_dirs or pkd_files:
-                                if messagebox.askyesno(
-                                    "Cleanup extraction artifacts?",
-                                    "Extraction verified.\n\n"
-                                    "Clean up legacy extraction artifacts now?\n"
-                                    "This will MOVE Pack*.pkd_out folders into:\n"
-                                    "<discs_folder>/_spcdb_trash/<timestamp>/<disc_folder>/\n\n"
-                                    "This is destructive (but recoverable from _spcdb_trash).",
-                                ):
-                                    def _cleanup_worker() -> None:
-                                        try:
-                                            cleanup_extraction_artifacts(
-                                                Path(disc_root),
-                                                include_pkd_out_dirs=True,
-                                                include_pkd_files=False,
-                                                log_cb=lambda m: self._queue.put(("build_log", str(m))),
-                                            )
-                                        except Exception as e:
-                                            self._queue.put(("build_log", f"[cleanup] ERROR: {e}"))
-
-                                    threading.Thread(target=_cleanup_worker, daemon=True).start()
-                    except Exception:
-                        pass
+    def _on_scan_ok(self, root_path: str, found_paths: list) -> None:
+        self._handle_scan_ok(str(root_path), list(found_paths or []))
+
+    def _on_scan_err(self, root_path: str, err: str) -> None:
+        self._handle_scan_err(str(root_path), str(err))
+
+    def _on_songs_ok(self, songs_out: List[SongAgg], disc_map=None, disc_map_hash: Optional[int] = None) -> None:
+        try:
+            self._songs_refresh_running = False
+        except Exception:
+            pass
+        self._songs_partial_by_id = {}
+        self._handle_songs_ok(songs_out, disc_map, disc_map_hash)
+
+    def _on_songs_partial(self, label: str, batch: List[SongAgg], ids: Set[int]) -> None:
+        by_id = self._songs_partial_by_id
+        # First batch of a refresh: the previous list is replaced, not extended.
+        songs = self._songs if by_id else []
+        added: Dict[int, SongAgg] = {}
+        replaced = False
+        for s in batch:
+            sid = s.song_id
+            if sid in by_id and sid not in added:
+                replaced = True
+            else:
+                added[sid] = s
+            by_id[sid] = s
+        self._disc_song_ids_by_label.setdefault(str(label), set()).update(ids)
+        self._invalidate_sel_counts(disc_map_changed=True)
+        if label == "Base":
+            self._base_song_ids = self._disc_song_ids_by_label["Base"]
+        # _songs stays sorted by song id: swap in replaced entries, then merge only the
+        # new (sorted) ones instead of re-sorting every song on each batch.
+        if replaced:
+            songs = [by_id[s.song_id] for s in songs]
+        if added:
+            songs = list(heapq.merge(songs, (added[sid] for sid in sorted(added)), key=_song_id_of))
+        self._songs = songs
+        # Throttled by the filter debounce; the final songs_ok does the full refresh.
+        self._debounced_apply_filter()
+
+    def _on_songs_err(self, err: str) -> None:
+        try:
+            self._songs_refresh_running = False
+        except Exception:
+            pass
+        self._handle_songs_err(err)
+
+    def _on_build_log(self, msg: str) -> None:
+        s = str(msg)
+        if not self._maybe_handle_progress_line(s):
+            self._log(s)
+
+    def _on_build_ok(self, outp: str, report_path: Optional[str] = None) -> None:
+        self._handle_build_ok(str(outp), report_path)
+
+    def _on_build_cancel(self, outp: str, msg: str, report_path: Optional[str] = None) -> None:
+        self._handle_build_cancel(str(outp), str(msg), report_path)
+
+    def _on_build_err(self, err: str) -> None:
+        self._handle_build_err(str(err))
+
+    def _on_preflight_validate_report(self, report_text: str) -> None:
+        report_text = str(report_text or '')
+        try:
+            self._last_validate_report_text = report_text
+        except Exception:
+            pass
+        try:
+            self._update_validate_ui()
+        except Exception:
+            pass
+        # Optional: also write validate_report.txt (uses the existing Validate setting)
+        write_on = False
+        try:
+            write_on = bool(getattr(self, 'validate_write_report_var', tk.BooleanVar(value=False)).get())
+        except Exception:
+            write_on = False
+        if write_on and report_text.strip():
+            self._write_validate_report_async(report_text, "preflight")
 
-                    self._log(f"[extract] Done: {disc_root}. Re-indexing...")
-                    # Re-index the same input path (use disc_root to be safe)
-                    if kind == "base":
-                        self._set_base_badge("INDEXING…", "neutral")
-                        self._start_index_job("base", disc_root, None)
+    def _on_disc_validate_log(self, msg: str) -> None:
+        self._log(str(msg))
+
+    def _on_disc_validate_done(self, results: list, report_text: str = '') -> None:
+        report_text = str(report_text or '')
+        try:
+            self._handle_disc_validate_done(list(results or []), report_text=report_text)
+        except Exception:
+            self._handle_disc_validate_done([], report_text=report_text)
+
+    def _on_disc_validate_err(self, err: str) -> None:
+        self._handle_disc_validate_err(str(err))
+
+    def _on_extract_ok(self, kind: str, row_iid: Optional[str], disc_root: str, verify: Optional[dict] = None) -> None:
+        self._active_extract_jobs = max(0, self._active_extract_jobs - 1)
+        try:
+            self._update_cancel_extract_ui()
+        except Exception:
+            pass
+
+        try:
+            if isinstance(verify, dict) and verify:
+                if bool(verify.get("ok")):
+                    self._log(f"[verify] OK: {disc_root}")
+                else:
+                    errs = verify.get("errors") or []
+                    if errs:
+                        self._log(f"[verify] FAIL: {disc_root}: {errs[0]}")
                     else:
-                        # update displayed path to disc_root for consistency
-                        if row_iid is not None:
-                            self.src_tree.set(row_iid, "path", disc_root)
-                            try:
-                                self.src_tree.set(row_iid, "status", "indexing…")
-                            except Exception:
-                                pass
-                        self._debounced_persist_gui_state()
-                        self._start_index_job("source", disc_root, row_iid)
+                        self._log(f"[verify] FAIL: {disc_root} (see log)")
+        except Exception:
+            pass
 
-                    # v0.5.8c: if multiple extracts were queued, kick the next one (unless cancelling).
-                    try:
-                        if not bool(getattr(self, '_extract_cancel_requested', False)):
-                            self._kick_next_extract_queue()
-                    except Exception:
-                        pass
-                    try:
-                        # Defer cancel completion slightly so any follow-up logs run first.
-                        self.after(180, self._maybe_finish_extract_cancel)
-                    except Exception:
-                        pass
-                elif status == "extract_err":
-                    try:
-                        self._active_extract_jobs = max(0, int(getattr(self, "_active_extract_jobs", 0) or 0) - 1)
-                    except Exception:
-                        self._active_extract_jobs = 0
-                    try:
-                        self._update_cancel_extract_ui()
-                    except Exception:
-                        pass
-                    self._progress_reset()
-                    kind, row_iid, input_path, err = payload  # type: ignore[misc]
-                    messagebox.showerror("Extraction failed", f"{input_path}\n\n{err}")
-                    if kind == "base":
-                        self._set_base_badge("FAILED", "err")
-                    self._log(f"[extract] ERROR: {input_path}: {err}")
+        # Offer cleanup (move Pack*.pkd_out into _spcdb_trash) only if verification passed.
+        try:
+            if isinstance(verify, dict) and bool(verify.get("ok")):
+                arts = verify.get("artifacts") or {}
+                pkd_out_dirs = list(arts.get("pkd_out_dirs", []) or [])
+                pkd_files = list(arts.get("pkd_files", []) or [])
+                if pkd_out_dirs or pkd_files:
+                    def _cleanup_worker() -> None:
+                        try:
+                            cleanup_extraction_artifacts(
+                                Path(disc_root),
+                                include_pkd_out_dirs=True,
+                                include_pkd_files=False,
+                                log_cb=lambda m: self._post("build_log", str(m)),
+                                max_workers=8,
+                            )
+                        except Exception as e:
+                            self._post("build_log", f"[cleanup] ERROR: {e}")
+
+                    # Non-modal prompt: queue handling (logs, other extract jobs) keeps running meanwhile.
+                    self._ask_yes_no_async(
+                        "Cleanup extraction artifacts?",
+                        f"Extraction verified:\n{disc_root}\n\n"
+                        "Clean up legacy extraction artifacts now?\n"
+                        "This will MOVE Pack*.pkd_out folders into:\n"
+                        "<discs_folder>/_spcdb_trash/<timestamp>/<disc_folder>/\n\n"
+                        "This is destructive (but recoverable from _spcdb_trash).",
+                        on_yes=lambda: threading.Thread(target=_cleanup_worker, daemon=True).start(),
+                    )
+        except Exception:
+            pass
+
+        self._log(f"[extract] Done: {disc_root}. Re-indexing...")
+        # Re-index the same input path (use disc_root to be safe)
+        if kind == "base":
+            self._set_base_badge("INDEXING…", "neutral")
+            self._start_index_job("base", disc_root, None)
+        else:
+            # update displayed path to disc_root for consistency
+            if row_iid is not None:
+                self._tree_set(row_iid, "path", disc_root)
+                try:
+                    self._tree_set(row_iid, "status", "indexing…")
+                except Exception:
+                    pass
+            self._debounced_persist_gui_state()
+            self._start_index_job("source", disc_root, row_iid)
 
-                    # v0.5.8c: continue any queued extractions (unless cancelling).
-                    try:
-                        if not bool(getattr(self, '_extract_cancel_requested', False)):
-                            self._kick_next_extract_queue()
-                    except Exception:
-                        pass
-                    try:
-                        # Defer cancel completion slightly so any follow-up logs run first.
-                        self.after(180, self._maybe_finish_extract_cancel)
-                    except Exception:
-                        pass
+        # v0.5.8c: if multiple extracts were queued, kick the next one (unless cancelling).
+        try:
+            if not self._extract_cancel_requested:
+                self._kick_next_extract_queue()
+        except Exception:
+            pass
+        try:
+            # Defer cancel completion slightly so any follow-up logs run first.
+            self.after(180, self._maybe_finish_extract_cancel)
+        except Exception:
+            pass
+
+    def _ask_yes_no_async(self, title: str, message: str, on_yes: Callable[[], None]) -> None:
+        """Show a non-modal Yes/No prompt; on_yes runs only if the user clicks Yes."""
+        dlg = tk.Toplevel(self)
+        try:
+            colors = getattr(self, '_theme_colors', None)
+            if colors:
+                dlg.configure(background=colors['bg'])
+        except Exception:
+            pass
+        dlg.title(title)
+        dlg.transient(self)
+        dlg.resizable(False, False)
 
-                elif status == "validate_ok":
-                    conflicts = payload  # type: ignore[assignment]
-                    self._conflicts = conflicts
-                    # ensure choices contain only valid labels
-                    for sid in list(self._conflict_choices.keys()):
-                        if sid not in self._conflicts:
-                            self._conflict_choices.pop(sid, None)
-                    self._update_status_from_validation()
-                elif status == "validate_err":
-                    err = payload  # type: ignore[assignment]
-                    self._log(f"Validation error: {err}")
-                    self._update_status_from_validation()
-        except queue.Empty:
-            pass
-        self.after(120, self._poll_queue)
+        frm = ttk.Frame(dlg, padding=12)
+        frm.pack(fill=tk.BOTH, expand=True)
+        ttk.Label(frm, text=message, justify="left").pack(anchor="w")
+
+        def _answer(yes: bool) -> None:
+            try:
+                dlg.destroy()
+            except Exception:
+                pass
+            if yes:
+                on_yes()
+
+        btns = ttk.Frame(frm)
+        btns.pack(fill=tk.X, pady=(12, 0))
+        ttk.Button(btns, text="No", command=lambda: _answer(False)).pack(side=tk.RIGHT)
+        ttk.Button(btns, text="Yes", command=lambda: _answer(True)).pack(side=tk.RIGHT, padx=(0, 6))
+        dlg.protocol("WM_DELETE_WINDOW", lambda: _answer(False))
+        dlg.bind("<Escape>", lambda _e: _answer(False))
+
+    def _on_extract_err(self, kind: str, row_iid: Optional[str], input_path: str, err: str) -> None:
+        self._active_extract_jobs = max(0, self._active_extract_jobs - 1)
+        try:
+            self._update_cancel_extract_ui()
+        except Exception:
+            pass
+        self._progress_reset()
+        messagebox.showerror("Extraction failed", f"{input_path}\n\n{err}")
+        if kind == "base":
+            self._set_base_badge("FAILED", "err")
+        self._log(f"[extract] ERROR: {input_path}: {err}")
+
+        # v0.5.8c: continue any queued extractions (unless cancelling).
+        try:
+            if not self._extract_cancel_requested:
+                self._kick_next_extract_queue()
+        except Exception:
+            pass
+        try:
+            # Defer cancel completion slightly so any follow-up logs run first.
+            self.after(180, self._maybe_finish_extract_cancel)
+        except Exception:
+            pass
+
+    def _on_validate_partial(self, part: Dict[int, List[SongOccur]], cancel: Optional[threading.Event] = None) -> None:
+        if cancel is not self._validate_cancel or (cancel is not None and cancel.is_set()):
+            return  # superseded run
+        # Show conflicts found so far; the final validate_ok replaces this.
+        self._validate_partial.update(part)
+        self._conflicts = dict(self._validate_partial)
+        self._update_status_from_validation()
+
+    def _on_validate_ok(self, conflicts: Dict[int, List[SongOccur]], cancel: Optional[threading.Event] = None) -> None:
+        if cancel is not None and (cancel is not self._validate_cancel or cancel.is_set()):
+            return  # superseded run
+        self._validate_partial = {}
+        self._conflicts = conflicts
+        # ensure choices contain only valid labels
+        for sid in list(self._conflict_choices.keys()):
+            if sid not in self._conflicts:
+                self._conflict_choices.pop(sid, None)
+        self._update_status_from_validation()
+
+    def _on_validate_err(self, err: str) -> None:
+        self._log(f"Validation error: {err}")
+        self._update_status_from_validation()
 
     def _handle_index_ok(self, kind: str, row_iid: Optional[str], idx: DiscIndex) -> None:
         self._progress_reset()
-        product = idx.product_desc or idx.product_code or "(unknown)"
-        if idx.product_code and idx.product_desc:
-            product = f"{idx.product_desc} [{idx.product_code}]"
+        product = idx.display_product
+        self._invalidate_conflicts_cache()
+        if kind == "base" or row_iid is not None:
+            self._warm_disc_song_map(idx)
 
         if kind == "base":
             self._base_idx = idx
@@ -4227,7 +4689,7 @@ class SPCDBGui(tk.Tk):
             self.base_info_var.set(f"Base: {product} | max bank {idx.max_bank} | sel 0/{idx.song_count}")
             self._set_base_badge("OK", "ok")
             self._update_disc_selection_counts()
-            if not _is_expected_base(idx):
+            if not idx.is_expected_base:
                 self._log(
                     f"Warning: Base appears to be '{idx.product_desc or idx.product_code}'. "
                     "Tested baseline is SingStar [BCES00011]."
@@ -4236,15 +4698,18 @@ class SPCDBGui(tk.Tk):
             if row_iid is None:
                 return
             self._src_indexes[row_iid] = idx
-            label = self.src_tree.set(row_iid, "label")
+            label = self._src_get(row_iid, "label")
             self._src_labels[row_iid] = label
-            path = self.src_tree.set(row_iid, "path")
-            self.src_tree.item(row_iid, values=(label, product, str(idx.max_bank), f"0/{idx.song_count}", "OK", path))
+            path = self._src_get(row_iid, "path")
+            self._src_set_values(row_iid, (label, product, str(idx.max_bank), f"0/{idx.song_count}", "OK", path))
 
 
         # v0.5.8d: refresh persistent index cache record and clear stale markers.
+        # The write (signature stats + JSON encode + disk) runs on a single background writer.
         try:
-            _write_index_cache(idx, songs=None)
+            if self._cache_writer is None:
+                self._cache_writer = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+            self._cache_writer.submit(_write_index_cache, idx, None)
         except Exception:
             pass
         try:
@@ -4276,23 +4741,8 @@ class SPCDBGui(tk.Tk):
         # Safe auto-refresh of songs list after indexing changes
         self.request_refresh_songs("index")
 
-        # If this index was started by startup auto-index, advance the queue
-        try:
-            self._startup_note_index_done(kind, row_iid, idx.input_path)
-        except Exception:
-            pass
-
-        # If this index was started by Scan Folder auto-index, advance that queue too.
-        try:
-            self._scan_note_index_done(kind, row_iid, idx.input_path)
-        except Exception:
-            pass
-
-        # If this index was started by Reindex stale, advance that queue too.
-        try:
-            self._stale_note_index_done(kind, row_iid, idx.input_path)
-        except Exception:
-            pass
+        # Advance whichever auto-index queue (startup/scan/stale) started this job.
+        self._notify_index_done(kind, row_iid, idx.input_path)
 
         try:
             self._update_source_disc_count()
@@ -4303,6 +4753,7 @@ class SPCDBGui(tk.Tk):
     def _handle_index_err(self, kind: str, row_iid: Optional[str], input_path: str, err: str) -> None:
         self._progress_reset()
         needs_extract = "Could not locate an Export root" in err
+        self._invalidate_conflicts_cache()
         if kind == "base":
             self._base_idx = None
             if needs_extract:
@@ -4320,14 +4771,14 @@ class SPCDBGui(tk.Tk):
             if row_iid is not None:
                 if needs_extract:
                     try:
-                        self.src_tree.set(row_iid, "status", "needs extraction")
+                        self._tree_set(row_iid, "status", "needs extraction")
                     except Exception:
                         pass
                 else:
                     # Keep the row (safer) and just mark it failed so the user can retry.
                     try:
-                        self.src_tree.set(row_iid, "status", "failed")
-                        self.src_tree.set(row_iid, "product", "(failed)")
+                        self._tree_set(row_iid, "status", "failed")
+                        self._tree_set(row_iid, "product", "(failed)")
                     except Exception:
                         pass
                     self._src_indexes.pop(row_iid, None)
@@ -4340,23 +4791,8 @@ class SPCDBGui(tk.Tk):
             else:
                 messagebox.showerror("Source disc indexing failed", f"{input_path}\n\n{err}")
 
-        # If this index was started by startup auto-index, advance the queue
-        try:
-            self._startup_note_index_done(kind, row_iid, input_path)
-        except Exception:
-            pass
-
-        # If this index was started by Scan Folder auto-index, advance that queue too.
-        try:
-            self._scan_note_index_done(kind, row_iid, input_path)
-        except Exception:
-            pass
-
-        # If this index was started by Reindex stale, advance that queue too.
-        try:
-            self._stale_note_index_done(kind, row_iid, input_path)
-        except Exception:
-            pass
+        # Advance whichever auto-index queue (startup/scan/stale) started this job.
+        self._notify_index_done(kind, row_iid, input_path)
 
         self._log(f"ERROR indexing {input_path}: {err}")
 
@@ -4369,22 +4805,22 @@ class SPCDBGui(tk.Tk):
     def _update_disc_selection_counts(self) -> None:
         """Update Sel/Total counts for Base + each Source disc."""
         try:
-            selected = set(self._selected_song_ids)
+            sel_counts = self._selection_counts()
         except Exception:
-            selected = set()
+            sel_counts = {}
 
         # Base totals
         base_ids = set()
         try:
-            base_ids = set(getattr(self, "_disc_song_ids_by_label", {}).get("Base", set()))
+            base_ids = getattr(self, "_disc_song_ids_by_label", {}).get("Base", set())
         except Exception:
             base_ids = set()
 
         if base_ids:
             base_total = len(base_ids)
-            base_sel = len(selected.intersection(base_ids))
+            base_sel = sel_counts.get("Base", 0)
         else:
-            base_total = int(getattr(getattr(self, "_base_idx", None), "song_count", 0) or 0)
+            base_total = (int(self._base_idx.song_count or 0) if self._base_idx is not None else 0)
             base_sel = 0
 
         # Update Base info line
@@ -4406,15 +4842,15 @@ class SPCDBGui(tk.Tk):
             for iid in self.src_tree.get_children(""):
                 label = ""
                 try:
-                    label = self.src_tree.set(iid, "label") or ""
+                    label = self._src_get(iid, "label") or ""
                 except Exception:
                     pass
-                ids = set(disc_map.get(label, set())) if label else set()
+                ids = disc_map.get(label) if label else None
                 if ids:
                     total = len(ids)
-                    selc = len(selected.intersection(ids))
+                    selc = sel_counts.get(label, 0)
                     try:
-                        self.src_tree.set(iid, "songs", f"{selc}/{total}")
+                        self._tree_set(iid, "songs", f"{selc}/{total}")
                     except Exception:
                         pass
         except Exception:
@@ -4427,73 +4863,58 @@ class SPCDBGui(tk.Tk):
 
 
 
-    def _handle_songs_ok(self, songs_out: List[SongAgg], disc_song_ids_by_label=None) -> None:
+    def _handle_songs_ok(self, songs_out: List[SongAgg], disc_song_ids_by_label=None, disc_map_hash: Optional[int] = None) -> None:
         self._songs = songs_out
-        try:
-            if disc_song_ids_by_label is None:
+        # A refresh re-reads the discs; don't serve conflicts computed before it.
+        self._invalidate_conflicts_cache()
+        if (
+            disc_map_hash is not None
+            and disc_map_hash == self._disc_map_hash
+            and self._disc_song_ids_by_label
+        ):
+            # Same per-disc map as the last refresh and the streamed batches already rebuilt
+            # it: keep the current sets (and the selection counts derived from them).
+            pass
+        else:
+            self._disc_map_hash = disc_map_hash
+            try:
+                if disc_song_ids_by_label is None:
+                    self._disc_song_ids_by_label = {}
+                else:
+                    # Ensure plain sets (some payloads may be lists/tuples); worker-built sets are
+                    # handed over from the finished worker, so reuse them instead of copying.
+                    self._disc_song_ids_by_label = {
+                        k: (v if isinstance(v, set) else set(v)) for k, v in dict(disc_song_ids_by_label).items()
+                    }
+                self._base_song_ids = self._disc_song_ids_by_label.get('Base', set())
+            except Exception:
                 self._disc_song_ids_by_label = {}
-            else:
-                # Ensure plain sets (some payloads may be lists/tuples)
-                self._disc_song_ids_by_label = {k: set(v) for k, v in dict(disc_song_ids_by_label).items()}
-            self._base_song_ids = set(self._disc_song_ids_by_label.get('Base', set()))
-        except Exception:
-            self._disc_song_ids_by_label = {}
-            self._base_song_ids = set()
+                self._base_song_ids = set()
+            self._invalidate_sel_counts(disc_map_changed=True)
 
         self._progress_reset()
         self._log(f"Songs list ready: {len(self._songs)} songs indexed.")
-        self._update_disc_selection_counts()
         self._update_output_suggestion()
-        self._run_validation_async()
-        self._update_disc_selection_counts()
+        self._request_counts_update()
+        self._request_validation()
         self._apply_filter()
-        self._run_validation_async()
 
     
-    def _handle_build_ok(self, out_dir: str) -> None:
-        self._build_running = False
-        self._progress_reset()
-        try:
-            self.build_btn.configure(state="normal")
-        except Exception:
-            pass
-
-        dur = None
-        try:
-            st = getattr(self, "_build_started_ts", None)
-            if isinstance(st, (int, float)):
-                dur = float(time.time() - float(st))
-        except Exception:
-            dur = None
-        try:
-            self._build_started_ts = None
-        except Exception:
-            pass
-        try:
-            self._build_overall_pct = 0.0
-            self._build_overall_last_phase = None
-        except Exception:
-            pass
-
-        report_path = self._write_build_report(out_dir=out_dir, ok=True, duration_s=dur)
-
-        self._set_last_build_record(ok=True, out_dir=out_dir, duration_s=dur, report_path=report_path)
-        self._update_build_panels()
-
-        messagebox.showinfo("Build subset", f"Subset build complete:\n{out_dir}")
-        self._log(f"Subset build complete: {out_dir}")
-
-
-    
-
-
+    def _finalize_build(
+        self,
+        *,
+        ok: bool,
+        out_dir: str,
+        err: str = "",
+        write_report: bool = True,
+        report_path: Optional[str] = None,
+    ) -> None:
+        """Shared end-of-build bookkeeping: reset build state/UI, write report, record last build.
 
-    def _handle_build_cancel(self, out_dir: str, msg: str = "Cancelled") -> None:
+        report_path is passed when the build worker already wrote the report.
+        """
         self._build_running = False
-        try:
-            self._build_cancel_requested = False
-        except Exception:
-            pass
+        self._build_cancel_requested = False
         try:
             self.build_btn.configure(state="normal")
         except Exception:
@@ -4503,85 +4924,44 @@ class SPCDBGui(tk.Tk):
         except Exception:
             pass
 
-        dur = None
-        try:
-            st = getattr(self, "_build_started_ts", None)
-            if isinstance(st, (int, float)):
-                dur = float(time.time() - float(st))
-        except Exception:
-            dur = None
-        try:
-            self._build_started_ts = None
-        except Exception:
-            pass
-        try:
-            self._build_overall_pct = 0.0
-            self._build_overall_last_phase = None
-        except Exception:
-            pass
-
+        st = self._build_started_ts
+        dur = float(time.time() - float(st)) if isinstance(st, (int, float)) else None
+        self._build_started_ts = None
+        self._build_overall_pct = 0.0
+        self._build_overall_last_phase = None
         self._progress_reset()
 
-        report_path = ""
-        try:
-            report_path = self._write_build_report(out_dir=out_dir, ok=False, duration_s=dur, err="Cancelled")
-        except Exception:
+        if report_path is None:
             report_path = ""
-        self._set_last_build_record(ok=False, out_dir=str(out_dir or ""), err="Cancelled", duration_s=dur, report_path=report_path)
+            if write_report:
+                try:
+                    report_path = self._write_build_report(out_dir=out_dir, ok=ok, duration_s=dur, err=err)
+                except Exception:
+                    report_path = ""
+        self._set_last_build_record(ok=ok, out_dir=out_dir, err=err, duration_s=dur, report_path=report_path)
         self._update_build_panels()
 
-        try:
-            self._log(f"Build cancelled: {out_dir}")
-        except Exception:
-            pass
-    def _handle_build_err(self, err: str) -> None:
-        self._build_running = False
-        try:
-            self._build_cancel_requested = False
-        except Exception:
-            pass
-        try:
-            self.build_btn.configure(state="normal")
-        except Exception:
-            pass
-        try:
-            self._update_cancel_build_ui()
-        except Exception:
-            pass
+    def _handle_build_ok(self, out_dir: str, report_path: Optional[str] = None) -> None:
+        self._finalize_build(ok=True, out_dir=out_dir, report_path=report_path)
+        messagebox.showinfo("Build subset", f"Subset build complete:\n{out_dir}")
+        self._log(f"Subset build complete: {out_dir}")
 
-        dur = None
+    def _handle_build_cancel(self, out_dir: str, msg: str = "Cancelled", report_path: Optional[str] = None) -> None:
+        self._finalize_build(ok=False, out_dir=str(out_dir or ""), err="Cancelled", report_path=report_path)
         try:
-            st = getattr(self, "_build_started_ts", None)
-            if isinstance(st, (int, float)):
-                dur = float(time.time() - float(st))
-        except Exception:
-            dur = None
-        try:
-            self._build_started_ts = None
-        except Exception:
-            pass
-        try:
-            self._build_overall_pct = 0.0
-            self._build_overall_last_phase = None
+            self._log(f"Build cancelled: {out_dir}")
         except Exception:
             pass
 
+    def _handle_build_err(self, err: str) -> None:
+        self._finalize_build(ok=False, out_dir=str(self.output_path_var.get() or ""), err=err, write_report=False)
         hint = ""
         if "non-identical duplicates" in err.lower() or "duplicates across sources" in err.lower():
             hint = "\n\nHint: Use \'Resolve Conflicts...\' in the Status panel to pick which source to use."
-        self._progress_reset()
-
-        self._set_last_build_record(ok=False, out_dir=str(self.output_path_var.get() or ""), err=err, duration_s=dur)
-        self._update_build_panels()
-
         messagebox.showerror("Build subset failed", err + hint)
         self._log(f"ERROR build subset: {err}")
 
 
-
-    
-
-
     def _handle_songs_err(self, err: str) -> None:
         self._progress_reset()
         self.songs_status_var.set("Songs: failed")
@@ -4595,16 +4975,8 @@ class SPCDBGui(tk.Tk):
         n = len(self._selected_song_ids)
         return f"SPCDB_Subset_{n}songs"
 
-    def _first_available_outdir(self, parent: Path, name: str) -> Path:
-        cand = parent / name
-        if not cand.exists():
-            return cand
-        i = 2
-        while True:
-            cand2 = parent / f"{name}_{i}"
-            if not cand2.exists():
-                return cand2
-            i += 1
+    def _first_available_outdir(self, parent: str, name: str) -> str:
+        return _probe_available_outdir(parent, name)
 
     def _mark_output_path_user_set(self) -> None:
         self._output_path_user_set = True
@@ -4616,12 +4988,12 @@ class SPCDBGui(tk.Tk):
         if not base:
             return
         try:
-            parent = Path(base).parent
+            parent = os.path.dirname(os.path.normpath(base))
         except Exception:
             return
         name = self._suggest_output_name()
         outp = self._first_available_outdir(parent, name)
-        self.output_path_var.set(str(outp))
+        self.output_path_var.set(outp)
         self._debounced_persist_gui_state()
         self._update_build_panels()
 
@@ -4634,10 +5006,10 @@ class SPCDBGui(tk.Tk):
             return
         try:
             target = Path(p)
-            if target.exists() and target.is_dir():
+            if _classify_path(str(target))[1]:
                 open_path = target
             else:
-                open_path = target.parent if target.parent.exists() else target
+                open_path = target.parent if _classify_path(str(target.parent))[0] else target
         except Exception:
             open_path = None
 
@@ -4674,10 +5046,24 @@ class SPCDBGui(tk.Tk):
 
 
     def _refresh_last_build_ui(self) -> None:
+        # Coalesced: bursts of build-finish updates render the summary/buttons once on idle.
+        if self._refresh_ui_pending:
+            return
+        self._refresh_ui_pending = True
+        try:
+            self.after_idle(self._do_refresh_last_build_ui_and_clear)
+        except Exception:
+            self._do_refresh_last_build_ui_and_clear()
+
+    def _do_refresh_last_build_ui_and_clear(self) -> None:
+        self._refresh_ui_pending = False
+        self._do_refresh_last_build_ui()
+
+    def _do_refresh_last_build_ui(self) -> None:
         # Render last build summary + enable/disable buttons.
         lb = {}
         try:
-            lb = dict(getattr(self, "_last_build", {}) or {})
+            lb = getattr(self, "_last_build", None) or {}
         except Exception:
             lb = {}
 
@@ -4715,47 +5101,58 @@ class SPCDBGui(tk.Tk):
 
         # Report button: build report JSON is written next to the built disc folder (v0.8g)
         report_path = str(lb.get("report_path") or "").strip()
+        if lb.get("report_exists") is None:
+            # Record loaded from settings (or older format): resolve the path once.
+            try:
+                if (not report_path) and out_dir:
+                    disc_dir = Path(out_dir)
+                    rp_new = disc_dir.parent / f"{disc_dir.name or 'disc'}_build_report.json"
+                    if rp_new.exists():
+                        report_path = str(rp_new)
+                    else:
+                        # Back-compat
+                        rp_old = disc_dir / "build_report.json"
+                        if rp_old.exists():
+                            report_path = str(rp_old)
+            except Exception:
+                pass
+            if lb:
+                lb["report_path"] = report_path
+        # One stat per refresh: the report may have been moved or deleted since it was written.
         try:
-            if (not report_path) and out_dir:
-                disc_dir = Path(out_dir)
-                rp_new = disc_dir.parent / f"{disc_dir.name or 'disc'}_build_report.json"
-                if rp_new.exists():
-                    report_path = str(rp_new)
-                else:
-                    # Back-compat
-                    rp_old = disc_dir / "build_report.json"
-                    if rp_old.exists():
-                        report_path = str(rp_old)
+            report_exists = bool(report_path) and os.path.exists(report_path)
         except Exception:
-            report_path = report_path
+            report_exists = False
+        if lb:
+            lb["report_exists"] = report_exists
 
+        self._safe_configure("open_last_build_btn", state=("normal" if out_dir else "disabled"))
+        self._safe_configure("copy_last_build_btn", state=("normal" if out_dir else "disabled"))
+        self._safe_configure("log_last_build_btn", state=("normal" if log_path else "disabled"))
+        self._safe_configure("report_last_build_btn", state=("normal" if report_exists else "disabled"))
+
+    def _safe_configure(self, name: str, **kw) -> None:
+        """configure() the widget stored as self.<name>, if it exists (best-effort)."""
+        w = getattr(self, name, None)
+        if w is None:
+            return
         try:
-            self.open_last_build_btn.configure(state=("normal" if out_dir else "disabled"))
-        except Exception:
-            pass
-        try:
-            self.copy_last_build_btn.configure(state=("normal" if out_dir else "disabled"))
-        except Exception:
-            pass
-        try:
-            self.log_last_build_btn.configure(state=("normal" if log_path else "disabled"))
-        except Exception:
-            pass
-        try:
-            if hasattr(self, "report_last_build_btn") and self.report_last_build_btn is not None:
-                ok2 = False
-                if report_path:
-                    try:
-                        ok2 = Path(report_path).exists()
-                    except Exception:
-                        ok2 = False
-                self.report_last_build_btn.configure(state=("normal" if ok2 else "disabled"))
+            w.configure(**kw)
         except Exception:
             pass
 
-    def _set_last_build_record(self, *, ok: bool, out_dir: str = "", err: str = "", duration_s: Optional[float] = None, report_path: str = "") -> None:
+    def _set_last_build_record(
+        self,
+        *,
+        ok: bool,
+        out_dir: str = "",
+        err: str = "",
+        duration_s: Optional[float] = None,
+        report_path: str = "",
+        report_exists: Optional[bool] = None,
+    ) -> None:
         # Persist last build info into settings.
-        ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        ts = _now_ts()
         rec = {
             "ts": ts,
             "ok": bool(ok),
@@ -4764,6 +5161,8 @@ class SPCDBGui(tk.Tk):
             "duration_s": float(duration_s) if duration_s is not None else None,
             "err": str(err or ""),
             "report_path": str(report_path or ""),
+            # The writer only returns a path after writing the file; refreshes re-check it.
+            "report_exists": bool(report_path) if report_exists is None else bool(report_exists),
         }
         try:
             pth = getattr(self, "_session_log_path", None)
@@ -4773,29 +5172,36 @@ class SPCDBGui(tk.Tk):
             pass
 
         self._last_build = rec
-        try:
-            s = _load_settings()
-            s["last_build"] = rec
-            _save_settings(s)
-        except Exception:
-            pass
+        self._settings_cache["last_build"] = rec
+        self._mark_settings_dirty()
         self._refresh_last_build_ui()
 
 
-    def _format_duration(self, seconds: float) -> str:
-        try:
-            s = int(round(float(seconds)))
-        except Exception:
+    def _format_duration(self, seconds: Optional[float]) -> str:
+        # Integer math only; the one caller already guards non-numeric values.
+        if seconds is None:
             return "—"
+        s = int(seconds + 0.5)
         m, sec = divmod(s, 60)
         h, m = divmod(m, 60)
         if h:
             return f"{h:d}:{m:02d}:{sec:02d}"
         return f"{m:d}:{sec:02d}"
 
-    def _write_build_report(self, *, out_dir: str, ok: bool, duration_s: Optional[float], err: str = "") -> str:
+    def _write_build_report(
+        self,
+        *,
+        out_dir: str,
+        ok: bool,
+        duration_s: Optional[float],
+        err: str = "",
+        inputs: Optional[_BuildReportInputs] = None,
+    ) -> str:
         """Write a build report JSON next to the built disc folder (v0.8g).
 
+        The build worker passes *inputs* captured on the UI thread at build start, so no
+        UI-owned state is read off-thread; UI-thread callers may omit it.
+
         Returns the report path string on success, or "" on failure.
         """
         try:
@@ -4805,15 +5211,18 @@ class SPCDBGui(tk.Tk):
         except Exception:
             return ""
 
-        # Pull preflight routing info captured at build start (best-effort).
-        pre = dict(getattr(self, "_last_preflight", {}) or {})
-        provider = pre.get("provider") if isinstance(pre.get("provider"), dict) else {}
-        dupe_ids = pre.get("dupe_ids") if isinstance(pre.get("dupe_ids"), list) else []
-        needed_donors = pre.get("needed_donors") if isinstance(pre.get("needed_donors"), list) else []
-        prefer = pre.get("prefer") if isinstance(pre.get("prefer"), dict) else {}
+        if inputs is None:
+            inputs = self._build_report_inputs()
+
+        # Preflight routing info captured at build start.
+        pre = inputs.preflight
+        provider = pre.provider
+        dupe_ids = pre.dupe_ids
+        needed_donors = pre.needed_donors
+        prefer = pre.prefer
 
         # Base + sources info
-        base_idx = getattr(self, "_base_idx", None)
+        base_idx = inputs.base_idx
         sources: List[dict] = []
         try:
             if base_idx is not None:
@@ -4832,8 +5241,7 @@ class SPCDBGui(tk.Tk):
 
         used_set = set(["Base"] + [str(x) for x in needed_donors])
         try:
-            for row_iid, idx in getattr(self, "_src_indexes", {}).items():
-                lab = self._src_labels.get(row_iid, self.src_tree.set(row_iid, "label") or "Source")
+            for lab, idx in inputs.sources:
                 sources.append({
                     "label": str(lab),
                     "input_path": str(idx.input_path),
@@ -4847,20 +5255,16 @@ class SPCDBGui(tk.Tk):
         except Exception:
             pass
 
-        selected_ids = sorted(set(getattr(self, "_selected_song_ids", set()) or set()))
-        conflict_count = 0
-        try:
-            conflict_count = int(len(getattr(self, "_conflicts", {}) or {}))
-        except Exception:
-            conflict_count = 0
+        selected_ids = sorted(inputs.selected_ids)
+        conflict_count = len(inputs.conflicts)
 
         # Conflicts detail (small but useful)
         conflicts_detail: List[dict] = []
         try:
-            for sid, occs in (getattr(self, "_conflicts", {}) or {}).items():
+            for sid, occs in inputs.conflicts.items():
                 item = {
                     "song_id": int(sid),
-                    "chosen": str((getattr(self, "_conflict_choices", {}) or {}).get(int(sid), "")),
+                    "chosen": str(inputs.conflict_choices.get(int(sid), "")),
                     "occurrences": [],
                 }
                 for o in occs:
@@ -4877,13 +5281,7 @@ class SPCDBGui(tk.Tk):
         # Include a compact song meta list for selected songs (id/title/artist/provider).
         song_meta: List[dict] = []
         try:
-            # Build id->(title,artist) from current songs list
-            meta_map = {}
-            for s in getattr(self, "_songs", []) or []:
-                try:
-                    meta_map[int(s.song_id)] = (str(s.title), str(s.artist))
-                except Exception:
-                    continue
+            meta_map = inputs.titles
             for sid in selected_ids:
                 t, a = meta_map.get(int(sid), ("", ""))
                 prov = provider.get(int(sid)) if isinstance(provider, dict) else None
@@ -4897,11 +5295,12 @@ class SPCDBGui(tk.Tk):
             song_meta = []
 
         # Count duplicates (song IDs present in >1 disc) and how many were auto-resolved.
-        dup_total = 0
+        dup_set: Set[int] = set()
         try:
-            dup_total = int(len(set(int(x) for x in dupe_ids)))
+            dup_set = {int(x) for x in dupe_ids}
         except Exception:
-            dup_total = 0
+            dup_set = set()
+        dup_total = len(dup_set)
         auto_resolved = max(0, dup_total - conflict_count)
 
         report = {
@@ -4912,18 +5311,19 @@ class SPCDBGui(tk.Tk):
             "result": {
                 "ok": bool(ok),
                 "error": str(err or ""),
-                "built_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                "built_at": _now_ts(),
                 "duration_s": float(duration_s) if isinstance(duration_s, (int, float)) else None,
             },
             "paths": {
                 "output_dir": str(out_dir),
                 "report_path": str((od.parent / f"{od.name or 'disc'}_build_report.json")),
-                "session_log_path": str(getattr(self, "_session_log_path", "") or ""),
+                "session_log_path": inputs.session_log_path,
             },
             "selection": {
                 "song_count": int(len(selected_ids)),
                 "song_ids": selected_ids,
-                "duplicates_song_ids": sorted(set(int(x) for x in dupe_ids))[:500],
+                # First 500 ids without sorting the whole set.
+                "duplicates_song_ids": heapq.nsmallest(500, dup_set),
                 "duplicates_count": int(dup_total),
                 "duplicates_auto_resolved_count": int(auto_resolved),
                 "conflicts_count": int(conflict_count),
@@ -4939,12 +5339,36 @@ class SPCDBGui(tk.Tk):
 
         try:
             rp = od.parent / f"{od.name or 'disc'}_build_report.json"
-            with rp.open("w", encoding="utf-8") as f:
-                json.dump(report, f, indent=2, ensure_ascii=False)
+            # Int-keyed routing maps are handled natively (OPT_NON_STR_KEYS); one write call.
+            rp.write_bytes(json_dumps_bytes(report, pretty=_BUILD_REPORT_PRETTY))
             return str(rp)
         except Exception:
             return ""
 
+    def _build_report_inputs(self) -> _BuildReportInputs:
+        """Copy what _write_build_report reads from the UI (call on the Tk thread)."""
+        sources: List[Tuple[str, DiscIndex]] = []
+        for row_iid, idx in self._src_indexes.items():
+            lab = self._src_labels.get(row_iid, self._src_get(row_iid, "label") or "Source")
+            sources.append((str(lab), idx))
+        selected = set(self._selected_song_ids)
+        # id -> (title, artist) for the selected songs only (the catalog can be far larger).
+        titles = {
+            s.song_id: (str(s.title), str(s.artist))
+            for s in (self._songs or [])
+            if s.song_id in selected
+        }
+        return _BuildReportInputs(
+            preflight=self._last_preflight or _PreflightSnapshot(),
+            base_idx=self._base_idx,
+            sources=sources,
+            selected_ids=selected,
+            conflicts={sid: list(occs) for sid, occs in (self._conflicts or {}).items()},
+            conflict_choices=dict(self._conflict_choices or {}),
+            titles=titles,
+            session_log_path=str(getattr(self, "_session_log_path", "") or ""),
+        )
+
     def _compute_build_blocker(self) -> Optional[str]:
         # Returns a short, actionable reason why Build is disabled, or None if ready.
         try:
@@ -4953,7 +5377,7 @@ class SPCDBGui(tk.Tk):
         except Exception:
             pass
 
-        if getattr(self, "_base_idx", None) is None:
+        if self._base_idx is None:
             return "Index the Base disc first"
 
         try:
@@ -5015,10 +5439,7 @@ class SPCDBGui(tk.Tk):
             pass
 
         # View issues button
-        try:
-            self.view_issues_btn.configure(state=("normal" if issues else "disabled"))
-        except Exception:
-            pass
+        self._safe_configure("view_issues_btn", state=("normal" if issues else "disabled"))
 
         
         # Hide the issues banner row entirely when empty (avoids blank orange bar)
@@ -5031,13 +5452,7 @@ class SPCDBGui(tk.Tk):
             pass
 
         # Build gating
-        try:
-            if getattr(self, "_build_running", False):
-                self.build_btn.configure(state="disabled")
-            else:
-                self.build_btn.configure(state=("normal" if ready else "disabled"))
-        except Exception:
-            pass
+        self._safe_configure("build_btn", state=("normal" if ready and not self._build_running else "disabled"))
 
         # Tooltip
         try:
@@ -5082,7 +5497,7 @@ class SPCDBGui(tk.Tk):
             messagebox.showerror("Open", f"Failed to open:\n{path}\n\n{e}")
 
     def _open_last_build_folder(self) -> None:
-        lb = dict(getattr(self, "_last_build", {}) or {})
+        lb = getattr(self, "_last_build", None) or {}
         out_dir = str(lb.get("out_dir") or "").strip()
         if not out_dir:
             messagebox.showwarning("Last build", "No last build output folder recorded yet.")
@@ -5093,7 +5508,7 @@ class SPCDBGui(tk.Tk):
         self._open_path_in_os(target)
 
     def _copy_last_build_path(self) -> None:
-        lb = dict(getattr(self, "_last_build", {}) or {})
+        lb = getattr(self, "_last_build", None) or {}
         out_dir = str(lb.get("out_dir") or "").strip()
         if not out_dir:
             messagebox.showwarning("Last build", "No last build output folder recorded yet.")
@@ -5106,7 +5521,7 @@ class SPCDBGui(tk.Tk):
             messagebox.showerror("Copy", f"Failed to copy to clipboard:\n{e}")
 
     def _open_last_build_log(self) -> None:
-        lb = dict(getattr(self, "_last_build", {}) or {})
+        lb = getattr(self, "_last_build", None) or {}
         log_path = str(lb.get("log_path") or "").strip()
         if not log_path:
             messagebox.showwarning("Last build log", "No log path recorded yet.")
@@ -5119,7 +5534,7 @@ class SPCDBGui(tk.Tk):
 
 
     def _open_last_build_report(self) -> None:
-        lb = dict(getattr(self, "_last_build", {}) or {})
+        lb = getattr(self, "_last_build", None) or {}
         report_path = str(lb.get("report_path") or "").strip()
         out_dir = str(lb.get("out_dir") or "").strip()
 
@@ -5141,6 +5556,7 @@ class SPCDBGui(tk.Tk):
             return
         if not p.exists():
             messagebox.showwarning("Build report", f"Build report not found:\n{p}")
+            self._refresh_last_build_ui()  # disables the button
             return
         self._open_path_in_os(p)
 
@@ -5151,10 +5567,9 @@ class SPCDBGui(tk.Tk):
         if not folder:
             return
         self._output_path_user_set = True
-        parent = Path(folder)
         name = self._suggest_output_name()
-        outp = self._first_available_outdir(parent, name)
-        self.output_path_var.set(str(outp))
+        outp = self._first_available_outdir(os.path.normpath(folder), name)
+        self.output_path_var.set(outp)
         self._debounced_persist_gui_state()
         self._update_build_panels()
 
@@ -5187,7 +5602,7 @@ class SPCDBGui(tk.Tk):
         except Exception as e:
             errors.append(f"Output path validation failed: {e}")
     
-        base_idx = getattr(self, "_base_idx", None)
+        base_idx = self._base_idx
         if base_idx is None:
             errors.append("Base disc is not indexed.")
             return set(), {}, [], errors
@@ -5196,21 +5611,14 @@ class SPCDBGui(tk.Tk):
         label_to_idx: Dict[str, DiscIndex] = {"Base": base_idx}
         try:
             for row_iid, idx in self._src_indexes.items():
-                lab = self._src_labels.get(row_iid, self.src_tree.set(row_iid, "label") or "Source")
+                lab = self._src_labels.get(row_iid, self._src_get(row_iid, "label") or "Source")
                 label_to_idx[lab] = idx
         except Exception:
             pass
     
-        # Load per-disc song maps (song_id -> (title, artist))
-        disc_song_maps: Dict[str, Dict[int, Tuple[str, str]]] = {}
-        for lab, idx in label_to_idx.items():
-            try:
-                disc_song_maps[lab] = self._get_disc_song_map(idx)
-            except Exception:
-                disc_song_maps[lab] = {}
-    
-        base_song_ids: Set[int] = set(disc_song_maps.get("Base", {}).keys())
-        explicit_donor: Set[int] = {sid for sid, lab in prefer.items() if lab != "Base"}
+        # Per-disc song id sets, loaded on first use: donors no selected song reaches are never parsed.
+        disc_id_sets = _LazyDiscMaps(label_to_idx, self._get_disc_song_map)
+        base_song_ids = disc_id_sets.get("Base", _EMPTY_IDS)
     
         # Preserve GUI source ordering for "first donor wins" implicit routing.
         donor_order: List[str] = [lab for lab, _p in src_label_paths]
@@ -5220,9 +5628,11 @@ class SPCDBGui(tk.Tk):
     
         for sid in sorted(set(getattr(self, "_selected_song_ids", set()) or set())):
             chosen: Optional[str] = None
+            # Explicit donor override: looked up per song instead of precomputing a set over prefer.
+            explicit_donor = sid in prefer and prefer[sid] != "Base"
     
             # 1) Explicit preferred source (conflict resolution)
-            if sid in prefer and prefer[sid] != "Base":
+            if explicit_donor:
                 pref = prefer[sid]
                 if pref in label_to_idx:
                     chosen = pref
@@ -5231,13 +5641,13 @@ class SPCDBGui(tk.Tk):
     
             # 2) Base provides unless explicitly overridden to a donor
             if chosen is None:
-                if sid in base_song_ids and sid not in explicit_donor:
+                if not explicit_donor and sid in base_song_ids:
                     chosen = "Base"
     
             # 3) Otherwise: first donor in GUI order that contains the song id
             if chosen is None:
                 for dlab in donor_order:
-                    if sid in disc_song_maps.get(dlab, {}):
+                    if sid in disc_id_sets.get(dlab, _EMPTY_IDS):
                         chosen = dlab
                         break
     
@@ -5249,64 +5659,59 @@ class SPCDBGui(tk.Tk):
             needed.add(chosen)
     
         # Disc-level required files for involved discs.
+        # Probes use os.path on plain strings: no Path allocation per stat.
         disc_covers_map: Dict[str, Dict[int, int]] = {}
-        disc_textures_dir: Dict[str, Path] = {}
+        disc_page_sets: Dict[str, Set[int]] = {}  # label -> texture page numbers present
+        disc_export_str: Dict[str, str] = {}
     
         for lab in sorted(needed, key=lambda x: (x != "Base", x)):
             idx = label_to_idx.get(lab)
             if idx is None:
                 continue
-            exp = Path(idx.export_root)
+            exp_str = str(idx.export_root)
     
-            if not exp.exists() or not exp.is_dir():
-                errors.append(f"{lab}: Export folder missing: {exp}")
+            if not os.path.isdir(exp_str):
+                errors.append(f"{lab}: Export folder missing: {exp_str}")
                 continue
+            disc_export_str[lab] = exp_str
     
-            cfg = exp / "config.xml"
-            if not cfg.exists():
+            if not os.path.exists(os.path.join(exp_str, "config.xml")):
                 errors.append(f"{lab}: missing Export/config.xml")
     
-            cov = exp / "covers.xml"
-            if not cov.exists():
+            if not os.path.exists(os.path.join(exp_str, "covers.xml")):
                 errors.append(f"{lab}: missing Export/covers.xml")
     
-            tex = exp / "textures"
-            if not tex.is_dir():
-                errors.append(f"{lab}: missing Export/textures folder: {tex}")
-            disc_textures_dir[lab] = tex
+            tex_str = os.path.join(exp_str, "textures")
+            if os.path.isdir(tex_str):
+                disc_page_sets[lab] = _texture_page_set(tex_str)
+            else:
+                errors.append(f"{lab}: missing Export/textures folder: {tex_str}")
     
-            if not idx.songs_xml or not Path(idx.songs_xml).exists():
+            if not idx.songs_xml or not os.path.exists(idx.songs_xml):
                 errors.append(f"{lab}: missing songs_<bank>_0.xml under Export (disc not indexed correctly).")
-            if not idx.acts_xml or not Path(idx.acts_xml).exists():
+            if not idx.acts_xml or not os.path.exists(idx.acts_xml):
                 errors.append(f"{lab}: missing acts_<bank>_0.xml under Export (disc not indexed correctly).")
     
             try:
                 bank = int(idx.chosen_bank)
-                sl = exp / f"songlists_{bank}.xml"
-                if not sl.exists():
+                if not os.path.exists(os.path.join(exp_str, f"songlists_{bank}.xml")):
                     errors.append(f"{lab}: missing Export/songlists_{bank}.xml")
             except Exception:
                 errors.append(f"{lab}: invalid chosen bank; re-index this disc.")
     
-            disc_covers_map[lab] = _covers_song_to_page(exp)
+            disc_covers_map[lab] = _covers_song_to_page(Path(exp_str))
     
         # Per-song checks on the chosen provider disc.
         for sid, lab in provider.items():
             idx = label_to_idx.get(lab)
             if idx is None:
                 continue
-            exp = Path(idx.export_root)
-            song_dir = exp / str(sid)
-            if not song_dir.is_dir():
+            song_dir = os.path.join(disc_export_str.get(lab) or str(idx.export_root), str(sid))
+            if not os.path.isdir(song_dir):
                 errors.append(f"Song {sid} ({lab}): missing song folder: {song_dir}")
                 continue
     
-            has_melody = False
-            try:
-                has_melody = any(song_dir.glob("melody_*.xml"))
-            except Exception:
-                has_melody = False
-            if not has_melody:
+            if not _has_melody(song_dir):
                 errors.append(f"Song {sid} ({lab}): no melody_*.xml found in {song_dir}")
     
             covmap = disc_covers_map.get(lab, {})
@@ -5314,9 +5719,9 @@ class SPCDBGui(tk.Tk):
                 errors.append(f"Song {sid} ({lab}): missing covers.xml entry (cover_{sid})")
             else:
                 page = covmap[sid]
-                texdir = disc_textures_dir.get(lab)
-                if texdir is not None and texdir.is_dir():
-                    if not _texture_page_exists(texdir, page):
+                page_set = disc_page_sets.get(lab)
+                if page_set is not None:
+                    if page not in page_set:
                         errors.append(f"Song {sid} ({lab}): covers.xml references page_{page} but file is missing in textures")
                 else:
                     errors.append(f"Song {sid} ({lab}): textures folder missing (cannot validate cover page)")
@@ -5325,14 +5730,25 @@ class SPCDBGui(tk.Tk):
         # Duplicate IDs (present in >1 disc) for the current selection (useful diagnostics).
         dupe_ids: List[int] = []
         try:
-            for sid in provider.keys():
-                present = 0
-                for lab in label_to_idx.keys():
-                    if sid in disc_song_maps.get(lab, {}):
-                        present += 1
-                        if present > 1:
-                            dupe_ids.append(int(sid))
-                            break
+            # Every disc counts, but none is parsed for this: use the id sets the GUI already
+            # holds (songs refresh, warmed song maps), else what routing read above.
+            held_ids = self._disc_song_ids_by_label
+            held_maps = self._disc_song_cache
+            id_sets: List[Collection[int]] = []
+            for lab, idx in label_to_idx.items():
+                ids: Optional[Collection[int]] = held_ids.get(lab)
+                if ids is None:
+                    ids = held_maps.get(idx.input_path)
+                if ids is None:
+                    ids = disc_id_sets.peek(lab)
+                if ids is not None:
+                    id_sets.append(ids)
+            # Stop at the second disc containing the id.
+            dupe_ids = [
+                int(sid)
+                for sid in provider
+                if len(list(islice((1 for ids in id_sets if sid in ids), 2))) > 1
+            ]
         except Exception:
             dupe_ids = []
 
@@ -5368,7 +5784,7 @@ class SPCDBGui(tk.Tk):
         # Resolve GUI sources in their current order (label, input_path).
         src_label_paths: List[Tuple[str, str]] = []
         for row_iid, idx in self._src_indexes.items():
-            lab = self._src_labels.get(row_iid, self.src_tree.set(row_iid, "label") or "Source")
+            lab = self._src_labels.get(row_iid, self._src_get(row_iid, "label") or "Source")
             src_label_paths.append((lab, idx.input_path))
     
         # Pre-build validation: detect non-identical duplicates across sources for selected IDs.
@@ -5413,15 +5829,12 @@ class SPCDBGui(tk.Tk):
     
 
         # Capture routing info for build_report.json (v0.5.7b)
-        try:
-            self._last_preflight = {
-                "provider": dict(provider) if isinstance(provider, dict) else {},
-                "dupe_ids": list(dupe_ids) if isinstance(dupe_ids, list) else [],
-                "needed_donors": sorted(list(needed_donors)) if isinstance(needed_donors, set) else [],
-                "prefer": dict(prefer) if isinstance(prefer, dict) else {},
-            }
-        except Exception:
-            self._last_preflight = {}
+        self._last_preflight = _PreflightSnapshot(
+            provider=provider,
+            dupe_ids=dupe_ids,
+            needed_donors=sorted(needed_donors),
+            prefer=prefer,
+        )
 
 
         # disable while running
@@ -5447,6 +5860,23 @@ class SPCDBGui(tk.Tk):
     
         self._progress_update("Build", "Starting…", indeterminate=True)
         self._log(f"Building subset: {len(self._selected_song_ids)} songs -> {out_dir}")
+
+        # Snapshots for the build report, which the worker writes before signalling completion.
+        started_ts = self._build_started_ts
+        report_inputs = self._build_report_inputs()
+        report_selected = report_inputs.selected_ids
+
+        def _write_report(ok: bool, err: str = "") -> str:
+            try:
+                return self._write_build_report(
+                    out_dir=str(out_dir),
+                    ok=ok,
+                    duration_s=time.time() - started_ts,
+                    err=err,
+                    inputs=report_inputs,
+                )
+            except Exception:
+                return ""
     
         def _worker() -> None:
             try:
@@ -5463,13 +5893,13 @@ class SPCDBGui(tk.Tk):
                 except Exception:
                     block_on_errors = False
 
-                cancel_token = CancelToken(check=lambda: bool(getattr(self, '_build_cancel_requested', False)))
+                cancel_token = CancelToken(check=lambda: self._build_cancel_requested)
 
                 def _log_cb(msg: str) -> None:
-                    self._queue.put(("build_log", str(msg)))
+                    self._post("build_log", str(msg))
 
                 def _report_cb(report_text: str) -> None:
-                    self._queue.put(("preflight_validate_report", str(report_text)))
+                    self._post("preflight_validate_report", str(report_text))
 
                 run_build_subset(
                     base_path=base_path,
@@ -5477,7 +5907,7 @@ class SPCDBGui(tk.Tk):
                     out_dir=out_dir,
                     allow_overwrite_output=bool(getattr(self, 'allow_overwrite_output_var', tk.BooleanVar(value=False)).get()),
                     keep_backup_of_existing_output=bool(getattr(self, 'keep_backup_of_existing_output_var', tk.BooleanVar(value=True)).get()),
-                    selected_song_ids=set(self._selected_song_ids),
+                    selected_song_ids=set(report_selected),
                     needed_donors=set(needed_donors),
                     preferred_source_by_song_id=dict(prefer),
                     preflight_validate=do_preflight,
@@ -5487,18 +5917,38 @@ class SPCDBGui(tk.Tk):
                     cancel_token=cancel_token,
                 )
 
-                self._queue.put(("build_ok", str(out_dir)))
+                self._post("build_ok", (str(out_dir), _write_report(True)))
 
             except BuildBlockedError as be:
-                self._queue.put(("build_err", str(be)))
+                self._post("build_err", str(be))
             except CancelledError as ce:
-                self._queue.put(("build_cancel", (str(out_dir), str(ce))))
+                self._post("build_cancel", (str(out_dir), str(ce), _write_report(False, "Cancelled")))
             except Exception as e:
-                self._queue.put(("build_err", str(e)))
+                self._post("build_err", str(e))
 
         threading.Thread(target=_worker, daemon=True).start()
     # -------- Validation / conflicts --------
 
+    def _request_validation(self) -> None:
+        """Coalesce validation kicks: many requests within 50 ms start one worker."""
+        if self._validation_job is not None:
+            return
+        self._validation_job = self.after(50, self._do_validation)
+
+    def _do_validation(self) -> None:
+        self._validation_job = None
+        self._run_validation_async()
+
+    def _request_counts_update(self) -> None:
+        """Coalesce Sel/Total refreshes into one pass on the next idle."""
+        if self._counts_job is not None:
+            return
+        self._counts_job = self.after_idle(self._do_counts_update)
+
+    def _do_counts_update(self) -> None:
+        self._counts_job = None
+        self._update_disc_selection_counts()
+
     def _run_validation_async(self) -> None:
         # Run a quick pre-build check in a worker thread (hashing melody_1.xml for selected IDs where needed).
         if self._build_running:
@@ -5507,105 +5957,301 @@ class SPCDBGui(tk.Tk):
         base_idx = self._base_idx
         selected = set(self._selected_song_ids)
 
+        # A newer run supersedes the old one: it stops at its next batch and its
+        # messages are ignored by the handlers.
+        if self._validate_cancel is not None:
+            self._validate_cancel.set()
+        cancel = threading.Event()
+        self._validate_cancel = cancel
+        self._validate_partial = {}
+
         def _worker() -> None:
             try:
-                conflicts = self._compute_conflicts(base_idx, selected)
-                self._queue.put(("validate_ok", conflicts))
+                if base_idx is None or not selected:
+                    self._post("validate_ok", ({}, cancel))
+                    return
+                sources = self._conflict_sources(base_idx)
+                key = self._conflicts_memo_key(sources, selected)
+                hit = self._conflicts_cache.get(key)
+                if hit is not None:
+                    self._post("validate_ok", (hit, cancel))
+                    return
+
+                # Scan in id batches and stream each batch's conflicts to the UI. The
+                # process-pool decision is made for the whole scan, not per batch.
+                out: Dict[int, List[SongOccur]] = {}
+                ids = sorted(selected)
+                use_processes = len(ids) >= _CONFLICT_HASH_PROCESS_MIN
+                for i in range(0, len(ids), _VALIDATE_BATCH):
+                    if cancel.is_set():
+                        return
+                    part = self._scan_conflicts(
+                        sources, set(ids[i:i + _VALIDATE_BATCH]), use_processes=use_processes
+                    )
+                    if part:
+                        out.update(part)
+                        self._post("validate_partial", (part, cancel))
+                _flush_file_digest_cache()
+                if cancel.is_set():
+                    return
+                self._store_conflicts_memo(key, out)
+                self._post("validate_ok", (out, cancel))
             except Exception as e:
-                self._queue.put(("validate_err", str(e)))
+                if not cancel.is_set():
+                    self._post("validate_err", str(e))
 
         threading.Thread(target=_worker, daemon=True).start()
 
-    def _compute_conflicts(self, base_idx: Optional[DiscIndex], selected: Set[int]) -> Dict[int, List[SongOccur]]:
-        out: Dict[int, List[SongOccur]] = {}
-        if base_idx is None or not selected:
-            return out
+    def _invalidate_conflicts_cache(self) -> None:
+        """Drop memoized conflict results (base/donor set or disc contents changed)."""
+        self._conflicts_cache_gen += 1
+        self._conflicts_cache.clear()
 
+    def _conflict_sources(self, base_idx: DiscIndex) -> List[Tuple[str, DiscIndex]]:
         # Build list of sources: base + donor discs
         sources: List[Tuple[str, DiscIndex]] = [("Base", base_idx)]
         for row_iid, idx in self._src_indexes.items():
             label = self._src_labels.get(row_iid, f"Source {row_iid}")
             sources.append((label, idx))
+        return sources
+
+    def _conflicts_memo_key(self, sources: List[Tuple[str, DiscIndex]], selected: Set[int]) -> tuple:
+        # Memoized per (generation, sources, selection). The generation is read
+        # before scanning so a result computed across an invalidation is never reused.
+        return (
+            self._conflicts_cache_gen,
+            tuple((label, idx.input_path) for label, idx in sources),
+            frozenset(selected),
+        )
+
+    def _store_conflicts_memo(self, key: tuple, out: Dict[int, List[SongOccur]]) -> None:
+        if len(self._conflicts_cache) >= 8:
+            self._conflicts_cache.clear()
+        self._conflicts_cache[key] = out
+
+    def _compute_conflicts(self, base_idx: Optional[DiscIndex], selected: Set[int]) -> Dict[int, List[SongOccur]]:
+        if base_idx is None or not selected:
+            return {}
+
+        sources = self._conflict_sources(base_idx)
+        key = self._conflicts_memo_key(sources, selected)
+        hit = self._conflicts_cache.get(key)
+        if hit is not None:
+            return hit
+        out = self._scan_conflicts(sources, selected)
+        _flush_file_digest_cache()
+        self._store_conflicts_memo(key, out)
+        return out
+
+    def _scan_conflicts(
+        self,
+        sources: List[Tuple[str, DiscIndex]],
+        selected: Set[int],
+        *,
+        use_processes: bool = False,
+    ) -> Dict[int, List[SongOccur]]:
+        out: Dict[int, List[SongOccur]] = {}
 
         # Load per-disc song maps (title/artist)
         disc_song_maps: Dict[str, Dict[int, Tuple[str, str]]] = {}
         for label, idx in sources:
             disc_song_maps[label] = self._get_disc_song_map(idx)
 
-        # For each selected song_id, see which sources contain it.
-        for sid in sorted(selected):
-            present: List[Tuple[str, DiscIndex]] = []
-            for label, idx in sources:
-                if sid in disc_song_maps[label]:
-                    present.append((label, idx))
+        # Invert the disc maps once (selected ids only): sid -> sources containing it.
+        present_by_sid: Dict[int, List[Tuple[str, DiscIndex]]] = {}
+        for label, idx in sources:
+            for sid in selected & disc_song_maps[label].keys():
+                present_by_sid.setdefault(sid, []).append((label, idx))
+
+        # Flat parallel columns (one row per melody_1.xml to hash); each song's rows are
+        # contiguous, recorded as (sid, lo, hi) spans.
+        # Plain string paths: no Path object per (song, source) row.
+        root_by_label = {label: str(idx.export_root) for label, idx in sources}
+        labels: List[str] = []
+        paths: List[str] = []
+        spans: List[Tuple[int, int, int]] = []
+        for sid in sorted(present_by_sid):
+            present = present_by_sid[sid]
             if len(present) <= 1:
                 continue
-
+            lo = len(paths)
+            sid_s = str(sid)
+            for label, _idx in present:
+                labels.append(label)
+                paths.append(os.path.join(root_by_label[label], sid_s, "melody_1.xml"))
+            spans.append((sid, lo, len(paths)))
+
+        digests = self._hash_conflict_paths(paths, use_processes=use_processes)
+
+        for sid, lo, hi in spans:
+            # Conflict if multiple distinct digests OR a missing digest (None) mixed with
+            # present ones -- both mean more than one distinct value in the span.
+            if len(set(digests[lo:hi])) <= 1:
+                continue
             occs: List[SongOccur] = []
-            sha_set: Set[str] = set()
-            sha_none = False
-            for label, idx in present:
+            for i in range(lo, hi):
+                label = labels[i]
                 title, artist = disc_song_maps[label].get(sid, ("", ""))
-                melody1 = Path(idx.export_root) / str(sid) / "melody_1.xml"
-                sha1 = _sha1_path(melody1)
-                if sha1 is None:
-                    sha_none = True
-                else:
-                    sha_set.add(sha1)
-                occs.append(SongOccur(song_id=sid, title=title, artist=artist, source_label=label, melody1_sha1=sha1, melody1_fp=None))
-
-            # conflict if multiple distinct sha1s OR any missing sha1 mixed with present
-            if len(sha_set) > 1 or (sha_none and len(sha_set) >= 1):
-                out[sid] = occs
+                occs.append(SongOccur(
+                    song_id=sid, title=title, artist=artist, source_label=label,
+                    melody1_sha1=_display_sha1(digests[i], paths[i]), melody1_fp=None,
+                ))
+            out[sid] = occs
 
         return out
 
+    def _hash_conflict_paths(self, paths: List[str], *, use_processes: bool = False) -> List[Optional[str]]:
+        # Hashing runs in C with the GIL released; spread it over a thread pool unless
+        # the batch is too small to pay for the thread startup.
+        if len(paths) < _CONFLICT_HASH_POOL_MIN:
+            return [_fingerprint_path(p) for p in paths]
+        if use_processes:
+            # Large background scans: cache hits are answered here; only the uncached
+            # files (plain path strings) go to worker processes, which skip the per-file
+            # Python overhead the threads still share under the GIL.
+            digests = [_peek_fingerprint_path(p) for p in paths]
+            todo = [i for i, d in enumerate(digests) if d is None]
+            if not todo:
+                return digests
+            if len(todo) >= _CONFLICT_HASH_POOL_MIN:
+                pool: Optional[concurrent.futures.ProcessPoolExecutor] = None
+                try:
+                    pool = self._get_hash_pool()
+                    results = list(pool.map(
+                        _fingerprint_file_task, [paths[i] for i in todo], chunksize=16
+                    ))
+                except Exception:
+                    # Broken/unavailable pool: shut it down, drop it, fall back to threads.
+                    if pool is not None:
+                        self._drop_hash_pool(pool)
+                else:
+                    for i, (mtime_ns, size, digest) in zip(todo, results):
+                        _remember_fingerprint(paths[i], mtime_ns, size, digest)
+                        digests[i] = digest
+                    return digests
+        workers = max(1, min(_CONFLICT_HASH_WORKERS, len(paths)))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as ex:
+            return list(ex.map(_fingerprint_path, paths))
+
+    def _get_hash_pool(self) -> concurrent.futures.ProcessPoolExecutor:
+        # Overlapping validation workers may both get here; create the pool only once.
+        with self._hash_pool_lock:
+            pool = self._hash_pool
+            if pool is None:
+                # spawn (not fork): the parent holds a live Tk interpreter and threads.
+                pool = concurrent.futures.ProcessPoolExecutor(
+                    max_workers=max(1, min(8, _CONFLICT_HASH_WORKERS)),
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+                self._hash_pool = pool
+            return pool
+
+    def _drop_hash_pool(self, pool: concurrent.futures.ProcessPoolExecutor) -> None:
+        with self._hash_pool_lock:
+            if self._hash_pool is pool:
+                self._hash_pool = None
+        try:
+            pool.shutdown(wait=False, cancel_futures=True)
+        except Exception:
+            pass
+
     def _get_disc_song_map(self, idx: DiscIndex) -> Dict[int, Tuple[str, str]]:
         # Cache by input_path (stable).
         key = idx.input_path
-        if key in self._disc_song_cache:
-            return self._disc_song_cache[key]
-        m = _load_songs_for_disc_cached(idx)
-        self._disc_song_cache[key] = m
+        m = self._disc_song_cache.get(key)
+        if m is not None:
+            return m
+        # Per-disc lock: a warm-up thread and a validation worker asking for the same
+        # disc load it once; different discs still load in parallel.
+        with self._disc_song_lock:
+            key_lock = self._disc_song_key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            m = self._disc_song_cache.get(key)
+            if m is None:
+                m = _load_songs_for_disc_cached(idx)
+                self._disc_song_cache[key] = m
         return m
 
-    def _update_status_from_validation(self) -> None:
-        # Compose a compact status block.
-        lines: List[str] = []
-        if self._base_idx is None:
-            lines.append("✗ Base disc: not set")
-        else:
-            lines.append("✓ Base disc: set")
+    def _warm_disc_song_map(self, idx: DiscIndex) -> None:
+        """Load a disc's song map in the background so validation finds it cached."""
+        if idx.input_path in self._disc_song_cache:
+            return
 
-        lines.append(f"✓ Included songs: {len(self._selected_song_ids)}" if self._selected_song_ids else "✗ Included songs: 0")
+        def _worker() -> None:
+            try:
+                self._get_disc_song_map(idx)
+            except Exception:
+                pass
 
-        if self._conflicts:
-            lines.append(f"✗ Conflicts: {len(self._conflicts)} song ID(s) need resolving")
-        else:
-            lines.append("✓ Conflicts: none")
+        threading.Thread(target=_worker, daemon=True).start()
 
+    def _update_status_from_validation(self) -> None:
+        # Compose a compact status block. Each line is cached in _status_parts and the
+        # label is only re-set when a line actually changed.
+        changed = self._set_status_part(
+            "base", "✗ Base disc: not set" if self._base_idx is None else "✓ Base disc: set"
+        )
+        changed |= self._set_status_part(
+            "included",
+            f"✓ Included songs: {len(self._selected_song_ids)}" if self._selected_song_ids else "✗ Included songs: 0",
+        )
+        changed |= self._set_status_part(
+            "conflicts",
+            f"✗ Conflicts: {len(self._conflicts)} song ID(s) need resolving" if self._conflicts else "✓ Conflicts: none",
+        )
+
+        # Output existence needs a stat: do it right away the first time or when the path is
+        # cleared, otherwise coalesce bursts of updates into one debounced check.
         outp = self.output_path_var.get().strip()
-        if not outp:
-            lines.append("✗ Output: not set")
+        if not outp or "output" not in self._status_parts:
+            changed |= self._set_status_part("output", self._status_output_line(outp))
         else:
-            out_dir = Path(outp)
-            if out_dir.exists():
-                lines.append("✗ Output: already exists")
-            else:
-                lines.append("✓ Output: OK")
+            self._schedule_status_output_check()
+
+        if changed:
+            self._render_status()
+
+        # Enable/disable resolve button
+        want = "normal" if self._conflicts else "disabled"
+        if want != self._status_resolve_state:
+            try:
+                self.resolve_btn.configure(state=want)
+                self._status_resolve_state = want
+            except Exception:
+                pass
 
+        self._update_build_panels()
+
+    def _set_status_part(self, key: str, line: str) -> bool:
+        if self._status_parts.get(key) == line:
+            return False
+        self._status_parts[key] = line
+        return True
+
+    def _render_status(self) -> None:
+        lines = [self._status_parts.get(k, "") for k in _STATUS_ORDER]
         # Reminder
         lines.append("Note: Recommended setup is SingStar updated to 6.00 and launched once.")
-
         self.status_var.set("\n".join(lines))
 
-        # Enable/disable resolve button
-        try:
-            self.resolve_btn.configure(state=("normal" if self._conflicts else "disabled"))
-        except Exception:
-            pass
+    @staticmethod
+    def _status_output_line(outp: str) -> str:
+        if not outp:
+            return "✗ Output: not set"
+        if Path(outp).exists():
+            return "✗ Output: already exists"
+        return "✓ Output: OK"
 
-        self._update_build_panels()
+    def _schedule_status_output_check(self) -> None:
+        if self._status_output_job is not None:
+            return
+        self._status_output_job = self.after(250, self._refresh_status_output)
+
+    def _refresh_status_output(self) -> None:
+        self._status_output_job = None
+        line = self._status_output_line(self.output_path_var.get().strip())
+        if self._set_status_part("output", line):
+            self._render_status()
 
     def _open_conflict_resolver(self) -> None:
         if not self._conflicts:
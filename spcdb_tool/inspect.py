@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import functools
+import os
 import re
 import xml.etree.ElementTree as ET
 from dataclasses import dataclass
@@ -13,6 +15,50 @@ NS = {"ss": "http://www.singstargame.com"}  # config uses default ns; we match v
 VERSION_RE = re.compile(r"^songs_(\d+)_0\.xml$")
 
 
+def _clark(xpath: str) -> str:
+    """Expand ss: prefixes to {ns} form once, so find() needs no namespaces mapping."""
+    return xpath.replace("ss:", "{%s}" % NS["ss"])
+
+
+# Compile-once query paths (ElementPath caches by path string; Clark form keeps the key cheap).
+_XP_PRODUCT_CODE = _clark(".//ss:PRODUCT_CODE")
+_XP_PRODUCT_DESC = _clark(".//ss:PRODUCT_DESC")
+_XP_COVERS_LIST = _clark(".//ss:COVERS/ss:LIST")
+_XP_OPTIONAL_FILES = (_clark(".//ss:GAME_CREDITS/ss:FILE"), _clark(".//ss:FILTERS/ss:FILE"))
+_XP_ERRATA_FILES = _clark(".//ss:ERRATA/ss:FILE")
+
+# VERSION refs: (parent tag, child tag) -> VersionRefs field, gathered in one walk.
+_VERSION_REF_FIELDS = {
+    (_clark("ss:SONGS"), _clark("ss:SONG_LIST")): "song_list",
+    (_clark("ss:SONGS"), _clark("ss:ACT_LIST")): "act_list",
+    (_clark("ss:SONG_LISTS"), _clark("ss:FILE")): "songlists",
+    (_clark("ss:MELODY_CACHE"), _clark("ss:FILE")): "melody_cache",
+}
+_VERSION_REF_PARENTS = frozenset(parent for parent, _child in _VERSION_REF_FIELDS)
+
+# _check_retail_xml_style needles (read size, and overlap carried across chunk boundaries).
+_XMLNS_SS_DECL = b'xmlns:ss="http://www.singstargame.com"'
+_SPACED_SELF_CLOSE = b" />"
+_RUN_ON_SUBSET = b"</SUBSET><SUBSET"
+_STYLE_CHUNK = 1 << 16
+
+# _parse_xml read size.
+_PARSE_CHUNK = 1 << 16
+_STYLE_OVERLAP = max(len(_XMLNS_SS_DECL), len(_SPACED_SELF_CLOSE), len(_RUN_ON_SUBSET)) - 1
+_STYLE_FLAG_NEEDLES = (b"\r", _XMLNS_SS_DECL, _SPACED_SELF_CLOSE)
+
+
+@functools.lru_cache(maxsize=16)
+def _style_re(found: frozenset[bytes], count_run_on: bool) -> Optional[re.Pattern[bytes]]:
+    """Alternation over the style needles still worth scanning for (None if nothing is left)."""
+    needles = [n for n in _STYLE_FLAG_NEEDLES if n not in found]
+    if count_run_on:
+        needles.append(_RUN_ON_SUBSET)
+    if not needles:
+        return None
+    return re.compile(b"|".join(re.escape(n) for n in needles))
+
+
 @dataclass
 class VersionRefs:
     version: int
@@ -39,43 +85,82 @@ class InspectReport:
 
 
 def _parse_xml(path: Path) -> ET.Element:
-    txt = path.read_bytes()
-    try:
-        return ET.fromstring(txt)
-    except ET.ParseError as e:
-        raise ValueError(f"XML parse failed for {path}: {e}") from e
+    # Feed the (C-accelerated) expat parser in chunks instead of materializing the whole file.
+    parser = ET.XMLParser()
+    with open(path, "rb") as f:
+        try:
+            while chunk := f.read(_PARSE_CHUNK):
+                parser.feed(chunk)
+            return parser.close()
+        except ET.ParseError as e:
+            raise ValueError(f"XML parse failed for {path}: {e}") from e
 
 
 
 def _check_retail_xml_style(path: Path, warnings: list[str], *, check_run_on_subset: bool = False) -> None:
     """Warn on common XML formatting drift that can affect brittle parsers."""
+    # Streamed in fixed-size chunks: songlists_*.xml can be several MB. Each chunk is
+    # scanned together with the tail of the previous one so matches spanning a boundary
+    # count; hits that end inside that tail were already seen and are skipped.
+    # One alternation regex finds every needle in a single pass; once a yes/no needle has
+    # been seen it is dropped from the pattern (CRLF files would otherwise match per line).
+    found: set[bytes] = set()
+    run_on = 0
+    prev = b""
     try:
-        data = path.read_bytes()
+        with open(path, "rb") as f:
+            while True:
+                chunk = f.read(_STYLE_CHUNK)
+                if not chunk:
+                    break
+                buf = prev + chunk
+                seen_upto = len(prev)
+                pos = 0
+                while True:
+                    pat = _style_re(frozenset(found), check_run_on_subset)
+                    if pat is None:
+                        break
+                    for m in pat.finditer(buf, pos):
+                        if m.end() <= seen_upto:
+                            continue
+                        tok = m.group()
+                        if tok == _RUN_ON_SUBSET:
+                            run_on += 1
+                        else:
+                            found.add(tok)
+                            pos = m.end()
+                            break  # pattern shrinks; resume after this hit
+                    else:
+                        break
+                prev = buf[-_STYLE_OVERLAP:]
     except Exception:
         return
+    has_cr = b"\r" in found
+    has_ns_decl = _XMLNS_SS_DECL in found
+    has_spaced_close = _SPACED_SELF_CLOSE in found
 
     name = path.name
 
     # 1) Line endings
-    if b"\r" in data:
+    if has_cr:
         warnings.append(f"{name}: contains CR characters (expected LF-only).")
 
     # 2) Namespace declaration drift
-    if b"xmlns:ss=\"http://www.singstargame.com\"" not in data:
+    if not has_ns_decl:
         warnings.append(f"{name}: missing xmlns:ss declaration (retail exports often include it).")
 
     # 3) Self-closing tag style drift
-    if b" />" in data:
+    if has_spaced_close:
         warnings.append(f"{name}: contains ' />' self-closing style (retail typically uses '/>').")
 
     # 4) Run-on subset tags (songlists)
-    if check_run_on_subset:
-        n = data.count(b"</SUBSET><SUBSET")
-        if n:
-            warnings.append(f"{name}: contains {n} run-on '</SUBSET><SUBSET' occurrences (expected 0).")
+    if check_run_on_subset and run_on:
+        warnings.append(f"{name}: contains {run_on} run-on '</SUBSET><SUBSET' occurrences (expected 0).")
+
 
 def _find_text(el: ET.Element, xpath: str) -> Optional[str]:
-    found = el.find(xpath, namespaces=NS)
+    # xpath is expected in Clark form (see _clark / the _XP_* constants).
+    found = el.find(xpath)
     if found is None or found.text is None:
         return None
     return found.text.strip()
@@ -102,39 +187,50 @@ def _collect_version_refs(v_el: ET.Element) -> VersionRefs:
         raise ValueError("VERSION element missing 'version' attribute.")
     v = int(ver_attr)
 
-    song_list = _find_text(v_el, ".//ss:SONGS/ss:SONG_LIST")
-    act_list = _find_text(v_el, ".//ss:SONGS/ss:ACT_LIST")
-    songlists = _find_text(v_el, ".//ss:SONG_LISTS/ss:FILE")
-    melody_cache = _find_text(v_el, ".//ss:MELODY_CACHE/ss:FILE")
-
-    return VersionRefs(version=v, song_list=song_list, act_list=act_list, songlists=songlists, melody_cache=melody_cache)
+    # One walk instead of four .// searches; first match in document order wins, as with find().
+    refs: dict[str, Optional[str]] = {}
+    for parent in v_el.iter():
+        if parent.tag not in _VERSION_REF_PARENTS:
+            continue
+        for child in parent:
+            field = _VERSION_REF_FIELDS.get((parent.tag, child.tag))
+            if field is None or field in refs:
+                continue
+            refs[field] = child.text.strip() if child.text is not None else None
+        if len(refs) == len(_VERSION_REF_FIELDS):
+            break
+
+    return VersionRefs(
+        version=v,
+        song_list=refs.get("song_list"),
+        act_list=refs.get("act_list"),
+        songlists=refs.get("songlists"),
+        melody_cache=refs.get("melody_cache"),
+    )
 
 
 def _collect_common_refs(cfg_root: ET.Element) -> list[str]:
     refs: list[str] = []
     # covers
-    covers_list = _find_text(cfg_root, ".//ss:COVERS/ss:LIST")
+    covers_list = _find_text(cfg_root, _XP_COVERS_LIST)
     if covers_list:
         refs.append(covers_list)
 
     # optional files
-    for xp in [
-        ".//ss:GAME_CREDITS/ss:FILE",
-        ".//ss:FILTERS/ss:FILE",
-    ]:
+    for xp in _XP_OPTIONAL_FILES:
         t = _find_text(cfg_root, xp)
         if t:
             refs.append(t)
 
     # errata refs
-    for err in cfg_root.findall(".//ss:ERRATA/ss:FILE", namespaces=NS):
+    for err in cfg_root.iterfind(_XP_ERRATA_FILES):
         if err.text:
             refs.append(err.text.strip())
 
     return refs
 
 
-def _resolve_ref_to_paths(export_root: Path, ref: str) -> list[Path]:
+def _resolve_ref_to_paths(export_root: Path, ref: str, bases: Optional[tuple[str, str]] = None) -> list[str]:
     # Config often stores "FileSystem/Export/<file>" even when we're inspecting a loose export folder.
     # Try a few interpretations:
     #  1) treat as relative to resolved_root parent of FileSystem (i.e. .../USRDIR or .../ ??) -> can't easily from export_root
@@ -142,42 +238,61 @@ def _resolve_ref_to_paths(export_root: Path, ref: str) -> list[Path]:
     #  3) if it starts with "Export/", strip and resolve under export_root
     #  4) treat as relative to export_root.parent.parent (FileSystem) (for disc_folder kind)
 
+    # bases: _resolved_bases(export_root) computed once by the caller for a batch of refs.
+    if bases is None:
+        bases = _resolved_bases(export_root)
+    return list(_ref_candidates(bases, ref))
+
+
+def _resolved_bases(export_root: Path) -> tuple[str, str]:
+    """(resolved export_root, resolved folder containing FileSystem); one resolve() each.
+
+    Not cached across calls: the result depends on the cwd and on links that may change.
+    """
+    # export_root is .../FileSystem/Export; discish is maybe .../USRDIR or the disc root
+    return str(export_root.resolve()), str(export_root.parent.parent.resolve())
+
+
+def _ref_candidates(bases: tuple[str, str], ref: str) -> tuple[str, ...]:
+    # Candidates are plain strings joined onto pre-resolved bases (no Path per candidate);
+    # every candidate goes through normpath, which folds "..", "." and doubled
+    # separators so equal paths de-dupe.
+    # (Symlinks inside the ref are left to os.path.exists(), which follows them.)
+    export_root, discish = bases
     ref_norm = relpath_posix(ref).lstrip("/")
-    paths: list[Path] = []
+    paths: list[str] = []
 
     # a) disc-like: relative to the folder that contains FileSystem
-    # export_root is .../FileSystem/Export
-    filesystem_root = export_root.parent  # .../FileSystem
-    discish = filesystem_root.parent  # maybe .../USRDIR or the disc root
-    paths.append(discish / ref_norm)
+    paths.append(os.path.join(discish, ref_norm))
 
     # b) strip common prefixes
     for prefix in ["FileSystem/Export/", "Export/"]:
         if ref_norm.startswith(prefix):
-            paths.append(export_root / ref_norm[len(prefix):])
+            paths.append(os.path.join(export_root, ref_norm[len(prefix):]))
 
     # c) if ref is just a filename, try export_root directly
     if "/" not in ref_norm:
-        paths.append(export_root / ref_norm)
+        paths.append(os.path.join(export_root, ref_norm))
 
     # d) if ref includes FileSystem/ at front, try under filesystem_root
     if ref_norm.startswith("FileSystem/"):
-        paths.append(discish / ref_norm)
+        paths.append(os.path.join(discish, ref_norm))
 
     # de-dupe while preserving order
-    out: list[Path] = []
-    seen: set[Path] = set()
-    for p in paths:
-        p = p.resolve()
-        if p in seen:
-            continue
-        seen.add(p)
-        out.append(p)
-    return out
+    return tuple(dict.fromkeys(os.path.normpath(p) for p in paths))
 
 
-def _exists_any(paths: list[Path]) -> bool:
-    return any(p.exists() for p in paths)
+def _exists_any(paths: list[str], stat_cache: Optional[dict[str, bool]] = None) -> bool:
+    """True if any candidate exists. stat_cache (path -> exists) lets one run stat each path once."""
+    if stat_cache is None:
+        return any(os.path.exists(p) for p in paths)
+    for p in paths:
+        hit = stat_cache.get(p)
+        if hit is None:
+            hit = stat_cache[p] = os.path.exists(p)
+        if hit:
+            return True
+    return False
 
 
 def inspect_export(export_root: Path, kind: str, input_path: str, warnings: list[str]) -> InspectReport:
@@ -188,8 +303,8 @@ def inspect_export(export_root: Path, kind: str, input_path: str, warnings: list
     _check_retail_xml_style(cfg_path, warnings)
     cfg_root = _parse_xml(cfg_path)
 
-    product_code = _find_text(cfg_root, ".//ss:PRODUCT_CODE")
-    product_desc = _find_text(cfg_root, ".//ss:PRODUCT_DESC")
+    product_code = _find_text(cfg_root, _XP_PRODUCT_CODE)
+    product_desc = _find_text(cfg_root, _XP_PRODUCT_DESC)
 
     version_els = _config_versions(cfg_root)
     version_refs: list[VersionRefs] = [_collect_version_refs(v) for v in version_els]
@@ -213,42 +328,66 @@ def inspect_export(export_root: Path, kind: str, input_path: str, warnings: list
 
     # existence checks
     existence_all: dict[str, bool] = {}
+    stat_cache: dict[str, bool] = {}  # refs share candidates; stat each path once per run
+    bases = _resolved_bases(export_root)  # resolved once per call, never reused across calls
     for ref in sorted(set(all_refs)):
-        candidates = _resolve_ref_to_paths(export_root, ref)
-        existence_all[ref] = _exists_any(candidates)
+        candidates = _resolve_ref_to_paths(export_root, ref, bases)
+        existence_all[ref] = _exists_any(candidates, stat_cache)
 
-    # counts / extra scanning
+    # counts / extra scanning: one directory sweep, dispatching on the entry name.
+    # Names are matched through os.path.normcase so the platform's case rules apply,
+    # as they did for the glob() calls this replaces.
     numeric_dirs = 0
+    songs_xmls: list[str] = []  # normcased names (only matched against VERSION_RE)
+    songlists_xmls: list[str] = []  # on-disk names (opened below)
+    chc_files = 0
     try:
-        for p in export_root.iterdir():
-            if p.is_dir() and is_probably_numeric_dir(p.name):
-                numeric_dirs += 1
-    except Exception:
+        with os.scandir(export_root) as it:
+            for e in it:
+                n = os.path.normcase(e.name)
+                if n.startswith("songs_"):
+                    if len(n) >= 12 and n.endswith("_0.xml"):  # songs_*_0.xml
+                        songs_xmls.append(n)
+                elif n.startswith("songlists_"):
+                    if n.endswith(".xml"):
+                        songlists_xmls.append(e.name)
+                elif n.startswith("melodies_"):
+                    if n.endswith(".chc"):
+                        chc_files += 1
+                elif is_probably_numeric_dir(n):
+                    try:
+                        if e.is_dir():
+                            numeric_dirs += 1
+                    except OSError:
+                        pass
+    except OSError:
         pass
 
     # Retail-style XML sanity checks (helps catch subtle serializer drift)
-    for p in sorted(export_root.glob("songlists_*.xml")):
-        _check_retail_xml_style(p, warnings, check_run_on_subset=True)
+    for n in sorted(songlists_xmls):
+        _check_retail_xml_style(export_root / n, warnings, check_run_on_subset=True)
 
-    songs_xmls = list(export_root.glob("songs_*_0.xml"))
     banks_from_files: Set[int] = set()
-    for f in songs_xmls:
-        m = VERSION_RE.match(f.name)
+    for n in songs_xmls:
+        m = VERSION_RE.match(n)
         if m:
             banks_from_files.add(int(m.group(1)))
 
-    chc_files = list(export_root.glob("melodies_*.chc"))
-
-    textures_dir = export_root / "textures"
     texture_pages = 0
-    if textures_dir.exists():
-        texture_pages = len(list(textures_dir.glob("page_*.jpg"))) + len(list(textures_dir.glob("Page_*.jpg")))
+    try:
+        with os.scandir(export_root / "textures") as it:
+            for e in it:
+                n = os.path.normcase(e.name)
+                if (n.startswith("page_") or n.startswith("Page_")) and n.endswith(".jpg"):
+                    texture_pages += 1
+    except OSError:
+        pass
 
     counts = {
         "numeric_song_folders": numeric_dirs,
         "songs_xml_files": len(songs_xmls),
         "banks_from_songs_xml": len(banks_from_files),
-        "melodies_chc_files": len(chc_files),
+        "melodies_chc_files": chc_files,
         "texture_pages": texture_pages,
     }
 
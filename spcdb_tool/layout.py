@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import os
 import tempfile
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional, Tuple
@@ -53,12 +55,58 @@ def _looks_like_export_root(export_root: Path) -> bool:
         return True
     if (export_root / "covers.xml").is_file():
         return True
-    for pat in ["songs_*_0.xml", "songs_*.xml", "acts_*_0.xml", "songlists_*.xml", "melodies_*.chc"]:
-        if list(export_root.glob(pat)):
-            return True
+    # One directory read instead of a glob per pattern:
+    # songs_*.xml (covers songs_*_0.xml), acts_*_0.xml, songlists_*.xml, melodies_*.chc
+    try:
+        with os.scandir(export_root) as it:
+            for e in it:
+                n = os.path.normcase(e.name)
+                if n.startswith("songs_"):
+                    if len(n) >= 10 and n.endswith(".xml"):
+                        return True
+                elif n.startswith("acts_"):
+                    if len(n) >= 11 and n.endswith("_0.xml"):
+                        return True
+                elif n.startswith("songlists_"):
+                    if len(n) >= 14 and n.endswith(".xml"):
+                        return True
+                elif n.startswith("melodies_"):
+                    if len(n) >= 13 and n.endswith(".chc"):
+                        return True
+    except OSError:
+        return False
     return False
 
 
+# Below this many members a thread pool costs more than it saves.
+_ZIP_PARALLEL_MIN_MEMBERS = 8
+
+
+def _extract_member(z: zipfile.ZipFile, zi: zipfile.ZipInfo, dest: str) -> None:
+    try:
+        z.extract(zi, dest)
+    except FileExistsError:
+        # Another worker created the same parent directory between zipfile's
+        # exists() check and makedirs(); the directory is there now, so retry.
+        z.extract(zi, dest)
+
+
+def _extract_zip(z: zipfile.ZipFile, dest: str) -> None:
+    """extractall() equivalent that inflates/writes members on a thread pool.
+
+    ZipFile serializes the shared file handle internally; zlib inflation and the
+    file writes release the GIL, so large archives extract on several cores.
+    """
+    members = z.infolist()
+    if len(members) < _ZIP_PARALLEL_MIN_MEMBERS:
+        z.extractall(dest)
+        return
+    workers = max(1, min(8, os.cpu_count() or 1))
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        # list() re-raises the first worker error here.
+        list(ex.map(lambda zi: _extract_member(z, zi, dest), members))
+
+
 def resolve_input(path: str) -> ResolvedInput:
     p = Path(path).expanduser()
 
@@ -66,7 +114,7 @@ def resolve_input(path: str) -> ResolvedInput:
         # Extract to temp and resolve as folder input
         td = tempfile.TemporaryDirectory(prefix="spcdb_zip_")
         with zipfile.ZipFile(p) as z:
-            z.extractall(td.name)
+            _extract_zip(z, td.name)
         extracted_root = Path(td.name)
         # Prefer if zip has a single top-level folder
         kids = [k for k in extracted_root.iterdir() if k.name not in {"__MACOSX"}]
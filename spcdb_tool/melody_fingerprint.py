@@ -1,13 +1,69 @@
 from __future__ import annotations
 
+import atexit
+import functools
 import hashlib
+import multiprocessing
+import os
 import re
-import xml.etree.ElementTree as ET
+import stat
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Iterable, Optional, Tuple, List
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, Optional, Sequence, Tuple, List
+from xml.parsers import expat
+
+from .file_utils import content_digest_file
+
+try:  # optional: SIMD tree hash, faster than SHA-1/BLAKE2 on long event streams
+    from blake3 import blake3 as _blake3
+except ImportError:  # pragma: no cover - depends on the environment
+    _blake3 = None
+
+# Digest-cache kind for persisted fingerprints; changes whenever the digest does.
+FINGERPRINT_KIND = "melody_fp_blake3" if _blake3 is not None else "melody_fp_blake2b"
+
+try:  # optional: libxml2 parser; with a tag filter only SENTENCE end-events reach Python
+    from lxml import etree as _LXML
+except ImportError:  # pragma: no cover - depends on the environment
+    _LXML = None
 
 
 _SS_NS = "http://www.singstargame.com"
+_TAG_NOTE = "{%s}NOTE" % _SS_NS
+_SPACED_HYPHEN_RE = re.compile(r"\s*-\s*")
+
+# One canonical event line: "rel_start,duration,midi,lyric\n" (%b: lyric pre-encoded).
+_EVENT_LINE = b"%d,%d,%d,%b\n"
+_HASH_CHUNK = 64 * 1024
+
+# melody_fingerprint_file memo: raw content digest -> semantic fingerprint (this process).
+_RAW_TO_SEMANTIC: Dict[str, str] = {}
+_RAW_TO_SEMANTIC_MAX = 20000
+
+# Unicode punctuation folded to ascii in lyrics, built once. Codepoints as ints to avoid
+# accidental non-ascii in source.
+_LYRIC_PUNCT_TRANS = {
+    0x2010: ord("-"),  # hyphen
+    0x2011: ord("-"),
+    0x2012: ord("-"),
+    0x2013: ord("-"),
+    0x2014: ord("-"),
+    0x2015: ord("-"),
+    0x2212: ord("-"),  # minus
+    0x2018: ord("'"),
+    0x2019: ord("'"),
+    0x201C: ord('"'),
+    0x201D: ord('"'),
+}
+
+# melody_fingerprint_many: below this many files, fingerprint in-process. Larger batches
+# share one lazily created pool, so interpreter startup is paid once per process.
+_MANY_POOL_MIN = 32
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
 
 
 def _strip_ns(tag: str) -> str:
@@ -47,8 +103,23 @@ def _to_int_maybe(v: object) -> Optional[int]:
         return None
     if isinstance(v, int):
         return int(v)
+    if isinstance(v, str):
+        return _str_to_int_maybe(v)
+    return _parse_int_text(str(v))
+
+
+@functools.lru_cache(maxsize=4096)
+def _str_to_int_maybe(s: str) -> Optional[int]:
+    # Attribute values repeat heavily (notes, common durations), hence the cache.
+    try:
+        return int(s)  # plain integer text: the usual MidiNote/Duration/Delay form
+    except ValueError:
+        return _parse_int_text(s)
+
+
+def _parse_int_text(s: str) -> Optional[int]:
     try:
-        s = str(v).strip()
+        s = s.strip()
         if not s:
             return None
         s = s.replace(",", "")
@@ -58,98 +129,193 @@ def _to_int_maybe(v: object) -> Optional[int]:
         return None
 
 
+@functools.lru_cache(maxsize=8192)
 def _norm_lyric(s: object) -> str:
+    # Cached: syllables repeat heavily within and across melodies.
     # lower + collapse whitespace + normalize common punctuation
     txt = str(s or "").strip().lower()
     if not txt:
         return ""
-    # translate a few unicode punctuation to ascii without embedding non-ascii literals
-    # (use codepoints as ints to avoid accidental non-ascii in source)
-    txt = txt.translate(
-        {
-            0x2010: ord("-"),  # hyphen
-            0x2011: ord("-"),
-            0x2012: ord("-"),
-            0x2013: ord("-"),
-            0x2014: ord("-"),
-            0x2015: ord("-"),
-            0x2212: ord("-"),  # minus
-            0x2018: ord("'"),
-            0x2019: ord("'"),
-            0x201C: ord('"'),
-            0x201D: ord('"'),
-        }
-    )
+    # translate a few unicode punctuation to ascii (only non-ascii text can contain them)
+    if not txt.isascii():
+        txt = txt.translate(_LYRIC_PUNCT_TRANS)
     # collapse whitespace
     txt = " ".join(txt.split())
     # normalize spaced hyphens (e.g. "Heart -" -> "heart-")
-    txt = re.sub(r"\s*-\s*", "-", txt)
+    if "-" in txt:
+        txt = _SPACED_HYPHEN_RE.sub("-", txt)
     return txt
 
 
-def iter_melody_events(melody_xml: Path) -> Iterable[Tuple[int, int, int, str]]:
+_Child = Tuple[Any, Any]  # (tag, attrib mapping) of one direct SENTENCE child
+_EXPAT_CHUNK = 64 * 1024
+_SNIFF_BYTES = 4096
+# Any of these (lower-cased) in the header keeps the file: the namespace URI, or a bare
+# MELODY/SENTENCE element from exports that omit the xmlns declaration.
+_SNIFF_MARKS = (b"singstargame.com", b"melody", b"sentence")
+
+# NOTE/LABEL attribute names read on the hot path. The identifier-like literals there are
+# already interned, so sys.intern() returns those same objects; seeding expat's intern
+# table with them makes the parser hand them out as attrs keys (dict hits on identity).
+_ATTR_KEYS = tuple(sys.intern(k) for k in ("MidiNote", "Duration", "Lyric", "Delay"))
+
+
+def _iter_sentences(f: BinaryIO) -> Iterator[List[_Child]]:
+    """Yield the (tag, attrib) children of each SENTENCE, in document order."""
+    if _LXML is not None:
+        # No tag= filter: it is case-sensitive, and SENTENCE must match like the expat path.
+        is_sentence: Dict[Any, bool] = {}
+        for _ev, el in _LXML.iterparse(f, events=("end",)):
+            tag = el.tag
+            hit = is_sentence.get(tag)
+            if hit is None:
+                hit = is_sentence[tag] = isinstance(tag, str) and _strip_ns(tag).upper() == "SENTENCE"
+            if not hit:
+                continue
+            yield [(ch.tag, ch.attrib) for ch in el]
+            el.clear()
+            # Drop already-processed siblings so memory stays flat on long melodies.
+            while el.getprevious() is not None:
+                del el.getparent()[0]
+        return
+    yield from _iter_sentences_expat(f)
+
+
+def _iter_sentences_expat(f: BinaryIO) -> Iterator[List[_Child]]:
+    # No lxml: drive expat directly with a start/end handler pair. Only SENTENCE children
+    # are kept (tag + attrs dict); no Element objects are built for the rest of the tree.
+    # Like iterparse, a SENTENCE counts once its end tag is seen; a parse error ends the
+    # stream after the sentences completed before it.
+    done: List[List[_Child]] = []
+    stack: List[Optional[List[_Child]]] = []  # per open element: child list if SENTENCE
+    is_sentence: Dict[str, bool] = {}
+
+    def _start(name: str, attrs: Dict[str, str]) -> None:
+        if stack:
+            kids = stack[-1]
+            if kids is not None:
+                kids.append((name, attrs))
+        hit = is_sentence.get(name)
+        if hit is None:
+            hit = is_sentence[name] = _strip_ns(name).upper() == "SENTENCE"
+        stack.append([] if hit else None)
+
+    def _end(name: str) -> None:
+        kids = stack.pop()
+        if kids is not None:
+            done.append(kids)
+
+    parser = expat.ParserCreate(namespace_separator="}", intern={k: k for k in _ATTR_KEYS})
+    parser.StartElementHandler = _start
+    parser.EndElementHandler = _end
+    while True:
+        chunk = f.read(_EXPAT_CHUNK)
+        failed = False
+        try:
+            parser.Parse(chunk, not chunk)
+        except expat.ExpatError:
+            failed = True
+        yield from done
+        done.clear()
+        if failed or not chunk:
+            return
+
+
+def iter_melody_events(melody_xml: str | Path) -> Iterable[Tuple[int, int, int, str]]:
     """Yield (start_tick, duration_tick, midi_note, lyric_norm) from a SingStar melody_*.xml.
 
     We treat the melody as a linear stream of events. Inside each SENTENCE, we:
     - advance time by any child element's Delay attribute (LABEL/MARKER/etc)
     - for NOTE elements, emit an event and advance by Duration
     This ignores non-timing metadata such as ADRS, schema versions, whitespace, etc.
+    Small files that mention neither the singstargame.com namespace nor a
+    MELODY/SENTENCE element are not melodies and yield nothing without being parsed.
     """
-    melody_xml = Path(melody_xml)
-    if not melody_xml.exists() or not melody_xml.is_file():
+    path = os.fspath(melody_xml)
+    try:
+        if not stat.S_ISREG(os.stat(path).st_mode):
+            return
+        f = open(path, "rb")
+    except OSError:
         return
 
     cur = 0
-    try:
-        # Streaming parse: process each SENTENCE at end, then clear it to keep memory low.
-        for ev, el in ET.iterparse(str(melody_xml), events=("end",)):
-            if _strip_ns(str(el.tag)).upper() != "SENTENCE":
-                continue
-
-            # iterate direct children in order
-            try:
-                children = list(el)
-            except Exception:
-                children = []
-
-            for ch in children:
-                tag = _strip_ns(str(ch.tag)).upper()
-                try:
-                    delay = _to_int_maybe(_get_attr_ci(ch.attrib, "Delay"))
-                except Exception:
-                    delay = None
-
-                # Delay on timeline elements advances the cursor.
-                if delay is not None and tag != "NOTE":
-                    cur += max(0, int(delay))
-                    continue
-
-                if tag == "NOTE":
-                    # NOTE may also (rarely) have a Delay attribute; treat it as a gap before the note.
-                    if delay is not None:
-                        cur += max(0, int(delay))
-
-                    midi = _to_int_maybe(_get_attr_ci(ch.attrib, "MidiNote"))
-                    dur = _to_int_maybe(_get_attr_ci(ch.attrib, "Duration"))
-                    lyr = _norm_lyric(_get_attr_ci(ch.attrib, "Lyric") or "")
-
-                    if midi is None or dur is None:
+    # Each distinct child tag is classified once (namespace/case-insensitive) per file.
+    is_note: Dict[Any, bool] = {_TAG_NOTE: True, _SS_NS + "}NOTE": True, "NOTE": True}
+    with f:
+        try:
+            # Fast reject before starting a parser (bulk scans may hand us any XML). Only
+            # conclusive when the whole file was read and is ascii-compatible (UTF-16/32
+            # text has NULs); a long prolog or another encoding gets the full parse.
+            head = f.read(_SNIFF_BYTES)
+            if len(head) < _SNIFF_BYTES and b"\x00" not in head:
+                low = head.lower()
+                if not any(m in low for m in _SNIFF_MARKS):
+                    return
+            f.seek(0)
+
+            # Streaming parse: process each SENTENCE at end, then clear it to keep memory low.
+            for children in _iter_sentences(f):
+                # direct children in order
+                for tag, a in children:
+                    note = is_note.get(tag)
+                    if note is None:
+                        note = is_note[tag] = _strip_ns(str(tag)).upper() == "NOTE"
+
+                    if note:
+                        # Hot path: SingStar writes MidiNote/Duration/Lyric/Delay in this exact
+                        # case. Each attribute falls back to the ci lookup on its own, but only
+                        # when the NOTE carries keys the canonical reads did not account for.
+                        midi_s = a.get("MidiNote")
+                        dur_s = a.get("Duration")
+                        lyr_s = a.get("Lyric")
+                        delay_s = a.get("Delay")
+                        found = (
+                            (midi_s is not None)
+                            + (dur_s is not None)
+                            + (lyr_s is not None)
+                            + (delay_s is not None)
+                        )
+                        if len(a) > found:
+                            if midi_s is None:
+                                midi_s = _get_attr_ci(a, "MidiNote")
+                            if dur_s is None:
+                                dur_s = _get_attr_ci(a, "Duration")
+                            if lyr_s is None:
+                                lyr_s = _get_attr_ci(a, "Lyric")
+                            if delay_s is None:
+                                delay_s = _get_attr_ci(a, "Delay")
+
+                        # NOTE may also (rarely) have a Delay attribute; treat it as a gap before the note.
+                        delay = _to_int_maybe(delay_s)
+                        if delay is not None and delay > 0:
+                            cur += delay
+
+                        midi = _to_int_maybe(midi_s)
+                        dur = _to_int_maybe(dur_s)
+                        lyr = _norm_lyric(lyr_s or "")
+
+                        if midi is None or dur is None:
+                            continue
+
+                        # _to_int_maybe already returned ints; only clamp negatives.
+                        dur_i = dur if dur > 0 else 0
+                        yield (cur, dur_i, midi, lyr)
+                        cur += dur_i
                         continue
 
-                    start = int(cur)
-                    dur_i = max(0, int(dur))
-                    yield (start, dur_i, int(midi), lyr)
-                    cur += dur_i
-
-            # free memory
-            el.clear()
-    except ET.ParseError:
-        return
-    except Exception:
-        return
+                    # Delay on timeline elements advances the cursor.
+                    delay_s = a.get("Delay")
+                    if delay_s is None and a:
+                        delay_s = _get_attr_ci(a, "Delay")
+                    delay = _to_int_maybe(delay_s)
+                    if delay is not None and delay > 0:
+                        cur += delay
+        except Exception:
+            return
 
 
-def melody_fingerprint_file(melody_xml: Path) -> Optional[str]:
+def melody_fingerprint_file(melody_xml: str | Path) -> Optional[str]:
     """Compute a semantic fingerprint for melody_*.xml based on note events.
 
     The fingerprint is stable against benign differences such as:
@@ -157,28 +323,121 @@ def melody_fingerprint_file(melody_xml: Path) -> Optional[str]:
     - schema metadata (m2xVersion, audioVersion, etc.)
     - ADRS blocks and other non-note metadata
 
-    Returns a SHA1 hex digest of a canonical event stream, or None if parsing fails / no notes.
+    Returns a 40-hex digest (BLAKE3 when installed, else BLAKE2b-160) of a canonical
+    event stream, or None if parsing fails / no notes. Only compare fingerprints
+    computed by the same installation.
     """
-    events: List[Tuple[int, int, int, str]] = []
-    for e in iter_melody_events(Path(melody_xml)):
-        events.append(e)
-
-    if not events:
+    # Byte-identical files (re-checks, copies across discs) share one semantic result:
+    # hashing the raw bytes is far cheaper than parsing the XML again.
+    raw = content_digest_file(melody_xml)
+    if raw is not None:
+        hit = _RAW_TO_SEMANTIC.get(raw)
+        if hit is not None:
+            return hit
+    fp = _fingerprint_events(melody_xml)
+    if raw is not None and fp is not None:
+        if len(_RAW_TO_SEMANTIC) >= _RAW_TO_SEMANTIC_MAX:
+            _RAW_TO_SEMANTIC.clear()
+        _RAW_TO_SEMANTIC[raw] = fp
+    return fp
+
+
+def _new_fingerprint_hasher() -> Any:
+    if _blake3 is not None:
+        return _blake3()
+    return hashlib.blake2b(digest_size=20)
+
+
+def _fingerprint_events(melody_xml: str | Path) -> Optional[str]:
+    # Parse and hash in one pass: event lines go straight into a bounded buffer that is
+    # fed to the hasher, so no per-event objects outlive their line.
+    h = _new_fingerprint_hasher()
+    buf = bytearray()
+    # Lyrics repeat a lot: encode each distinct one once rather than per event. Most are
+    # ascii after normalization; those skip the utf-8 encoder (same bytes either way).
+    lyr_bytes: Dict[str, bytes] = {}
+    base: Optional[int] = None
+    for start, dur, midi, lyr in iter_melody_events(melody_xml):
+        # normalize to remove leading constant offset; include rests (midi=0) since
+        # they affect timing.
+        if base is None:
+            base = start
+        lb = lyr_bytes.get(lyr)
+        if lb is None:
+            lb = lyr_bytes[lyr] = lyr.encode("ascii") if lyr.isascii() else lyr.encode("utf-8", errors="replace")
+        buf += _EVENT_LINE % (start - base, dur, midi, lb)
+        if len(buf) >= _HASH_CHUNK:
+            h.update(buf)
+            buf.clear()
+
+    if base is None:
         return None
-
-    # normalize to remove leading constant offset
-    base = int(events[0][0])
-    h = hashlib.sha1()
-    for (start, dur, midi, lyr) in events:
-        # include rests (midi=0) since they affect timing.
-        rel = int(start) - base
-        line = f"{rel},{int(dur)},{int(midi)},{lyr}\n"
-        h.update(line.encode("utf-8", errors="replace"))
-    return h.hexdigest()
+    h.update(buf)
+    return h.hexdigest()[:40]
 
 
-def melody_fingerprint_short(melody_xml: Path) -> Optional[str]:
+def melody_fingerprint_short(melody_xml: str | Path) -> Optional[str]:
     fp = melody_fingerprint_file(melody_xml)
     if not fp:
         return None
     return fp[:12]
+
+
+def melody_fingerprint_many(paths: Sequence[str | Path], workers: Optional[int] = None) -> Dict[Any, Optional[str]]:
+    """melody_fingerprint_file() for many files: path -> fingerprint.
+
+    Files are independent and parsing is interpreter-bound, so larger batches are
+    spread over a process pool (one GIL per worker).
+    """
+    paths = list(paths)
+    if workers is None:
+        workers = min(8, os.cpu_count() or 1)
+    if len(paths) >= _MANY_POOL_MIN and workers > 1:
+        pool: Optional[ProcessPoolExecutor] = None
+        try:
+            pool = _get_pool(workers)
+            return dict(zip(paths, pool.map(melody_fingerprint_file, paths, chunksize=16)))
+        except Exception:
+            # Broken pool or no multiprocessing support (restricted/frozen environments):
+            # drop the pool and run in-process.
+            if pool is not None:
+                _drop_pool(pool)
+    return {p: melody_fingerprint_file(p) for p in paths}
+
+
+def _get_pool(workers: int) -> ProcessPoolExecutor:
+    global _pool, _pool_workers
+    with _pool_lock:
+        pool = _pool
+        if pool is None or _pool_workers != workers:
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+            # spawn (not fork): callers may hold GUI state and threads.
+            pool = _pool = ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            )
+            _pool_workers = workers
+        return pool
+
+
+def _drop_pool(pool: ProcessPoolExecutor) -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    try:
+        pool.shutdown(wait=False, cancel_futures=True)
+    except Exception:
+        pass
+
+
+def _shutdown_pool() -> None:
+    """Shut down the shared melody_fingerprint_many pool (registered with atexit)."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+atexit.register(_shutdown_pool)
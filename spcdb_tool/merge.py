@@ -240,6 +240,23 @@ def _build_act_map(acts_root: ET.Element) -> Dict[int, Tuple[str, str]]:
     return out
 
 
+def _acts_by_id(acts_root: ET.Element) -> Dict[int, ET.Element]:
+    """ACT elements by ID (first in document order wins), for O(1) lookups while merging."""
+    out: Dict[int, ET.Element] = {}
+    for act in acts_root.iterfind(f".//{_ns_tag('ACT')}"):
+        aid = _parse_int_attr(act, "ID")
+        if aid is not None:
+            out.setdefault(aid, act)
+    return out
+
+
+def _clone_element(el: ET.Element) -> ET.Element:
+    """Detached deep copy of el (C-level copy instead of a serialize/parse round trip)."""
+    cloned = copy.deepcopy(el)
+    cloned.tail = None  # tostring/fromstring dropped the tail too
+    return cloned
+
+
 def _song_perf_key(song_el: ET.Element, act_map: Dict[int, Tuple[str, str]]) -> str:
     # Prefer PERFORMANCE_NAME_KEY, else performed_by->act NAME_KEY, else PERFORMANCE_NAME, else empty.
     pnk = song_el.find(f".//{_ns_tag('PERFORMANCE_NAME_KEY')}")
@@ -826,7 +843,7 @@ def _merge_songlists_union_by_name(base_tree: ET.ElementTree, donor_trees: List[
             target = subset_map.get(dname)
             if target is None:
                 # clone and append to Root group (flatten)
-                cloned = ET.fromstring(ET.tostring(dsub, encoding="utf-8"))
+                cloned = _clone_element(dsub)
                 # ensure unique subset ID if present
                 did = _parse_int_attr(cloned, "ID")
                 if did is not None and did in used_subset_ids:
@@ -936,6 +953,7 @@ def merge_build(
     base_songs = _collect_songs(base_songs_tree)
     base_song_ids = set(base_songs.keys())
     base_act_map_old = _build_act_map(base_acts_tree.getroot())
+    base_acts_by_id = _acts_by_id(base_acts_tree.getroot())
 
     # Start merged structures from base copies
     merged_songs: Dict[int, ET.Element] = dict(base_songs)
@@ -966,13 +984,9 @@ def merge_build(
             continue
         act_key_to_newid[key] = old_id
         # build act node (copy existing by finding in tree)
-        act_node = None
-        for a in base_acts_tree.getroot().findall(f".//{_ns_tag('ACT')}"):
-            if _parse_int_attr(a, "ID") == old_id:
-                act_node = ET.fromstring(ET.tostring(a, encoding="utf-8"))
-                break
-        if act_node is not None:
-            newid_to_actnode[old_id] = act_node
+        act_el = base_acts_by_id.get(old_id)
+        if act_el is not None:
+            newid_to_actnode[old_id] = _clone_element(act_el)
 
     def _next_act_id() -> int:
         return (max(newid_to_actnode.keys()) + 1) if newid_to_actnode else 1
@@ -1093,6 +1107,7 @@ def merge_build(
 
         # Merge acts: build mapping old_id -> canonical key from donor acts
         donor_act_map_old = _build_act_map(donor_acts_tree.getroot())
+        donor_acts_by_id = _acts_by_id(donor_acts_tree.getroot())
         donor_old_to_key: Dict[int, str] = {}
         for old_id, (name, name_key) in donor_act_map_old.items():
             key = _normalize_key(name_key or name)
@@ -1104,11 +1119,8 @@ def merge_build(
             new_id = _next_act_id()
             act_key_to_newid[key] = new_id
             # clone act node and set new ID
-            act_node = None
-            for a in donor_acts_tree.getroot().findall(f".//{_ns_tag('ACT')}"):
-                if _parse_int_attr(a, "ID") == old_id:
-                    act_node = ET.fromstring(ET.tostring(a, encoding="utf-8"))
-                    break
+            act_el = donor_acts_by_id.get(old_id)
+            act_node = _clone_element(act_el) if act_el is not None else None
             if act_node is None:
                 # synthesize
                 act_node = ET.Element(_ns_tag("ACT"), {"ID": str(new_id)})
@@ -14,8 +14,10 @@ from .melody_fingerprint import melody_fingerprint_file
 from .merge import (
     MergeError,
     CancelRequested,
+    _acts_by_id,
     _build_act_map,
     _build_config,
+    _clone_element,
     _collect_covers,
     _collect_songs,
     _ensure_lowercase_textures,
@@ -696,6 +698,7 @@ def build_subset(
 
     # Act merging setup (same logic as merge_build)
     base_act_map_old = _build_act_map(base_acts_tree.getroot())
+    base_acts_by_id = _acts_by_id(base_acts_tree.getroot())
     act_key_to_newid: Dict[str, int] = {}
     newid_to_actnode: Dict[int, ET.Element] = {}
 
@@ -706,13 +709,9 @@ def build_subset(
         if key in act_key_to_newid:
             continue
         act_key_to_newid[key] = old_id
-        act_node = None
-        for a in base_acts_tree.getroot().findall(f".//{_ns_tag('ACT')}"):
-            if _parse_int_attr(a, "ID") == old_id:
-                act_node = ET.fromstring(ET.tostring(a, encoding="utf-8"))
-                break
-        if act_node is not None:
-            newid_to_actnode[old_id] = act_node
+        act_el = base_acts_by_id.get(old_id)
+        if act_el is not None:
+            newid_to_actnode[old_id] = _clone_element(act_el)
 
     def _next_act_id() -> int:
         return (max(newid_to_actnode.keys()) + 1) if newid_to_actnode else 1
@@ -997,6 +996,7 @@ def build_subset(
 
         # Merge acts: build mapping old_id -> canonical key from donor acts
         donor_act_map_old = _build_act_map(donor_acts_tree.getroot())
+        donor_acts_by_id = _acts_by_id(donor_acts_tree.getroot())
         donor_old_to_key: Dict[int, str] = {}
         for old_id, (name, name_key) in donor_act_map_old.items():
             key = _normalize_key(name_key or name)
@@ -1007,11 +1007,8 @@ def build_subset(
                 continue
             new_id = _next_act_id()
             act_key_to_newid[key] = new_id
-            act_node = None
-            for a in donor_acts_tree.getroot().findall(f".//{_ns_tag('ACT')}"):
-                if _parse_int_attr(a, "ID") == old_id:
-                    act_node = ET.fromstring(ET.tostring(a, encoding="utf-8"))
-                    break
+            act_el = donor_acts_by_id.get(old_id)
+            act_node = _clone_element(act_el) if act_el is not None else None
             if act_node is None:
                 act_node = ET.Element(_ns_tag("ACT"), {"ID": str(new_id)})
                 ET.SubElement(act_node, _ns_tag("NAME")).text = name
@@ -8,12 +8,19 @@ from dataclasses import asdict, is_dataclass
 from pathlib import Path
 from typing import Any, cast
 
+try:  # Optional C-accelerated JSON; stdlib json is the fallback.
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None  # type: ignore[assignment]
+
 
 NUMERIC_DIR_RE = re.compile(r"^\d+$")
 
 
 def is_probably_numeric_dir(name: str) -> bool:
-    return bool(NUMERIC_DIR_RE.match(name))
+    # str.isdecimal() is the C-level equivalent of NUMERIC_DIR_RE (\d == Unicode Nd),
+    # without a regex match per directory entry.
+    return name.isdecimal()
 
 
 def to_jsonable(obj: Any) -> Any:
@@ -32,6 +39,29 @@ def dumps_pretty(obj: Any) -> str:
     return json.dumps(to_jsonable(obj), indent=2, sort_keys=True, ensure_ascii=False)
 
 
+def json_dumps_bytes(obj: Any, *, pretty: bool = False, sort_keys: bool = False) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes (orjson when available, else stdlib json)."""
+    if orjson is not None:
+        opts = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            opts |= orjson.OPT_INDENT_2
+        if sort_keys:
+            opts |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(obj, option=opts)
+        except TypeError:
+            # e.g. ints beyond 64 bits; stdlib json handles them.
+            pass
+    return json.dumps(obj, indent=2 if pretty else None, sort_keys=sort_keys, ensure_ascii=False).encode("utf-8")
+
+
+def json_loads(data: bytes | str) -> Any:
+    """Parse JSON from bytes or str (orjson when available, else stdlib json)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def relpath_posix(path: str) -> str:
     # normalize to forward-slash for matching config.xml style
     return path.replace("\\", "/")
@@ -2,10 +2,19 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import pytest
+
+import spcdb_tool.controller as ctl
 from spcdb_tool.controller import SongAgg, compute_song_id_conflicts
 from tests.conftest import make_export_root
 
 
+@pytest.fixture(autouse=True)
+def _isolated_digest_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    cache_dir = tmp_path / "_index_cache"
+    monkeypatch.setattr(ctl, "_index_cache_dir", lambda: cache_dir)
+
+
 def test_compute_song_id_conflicts_detects_sha_mismatch_and_fps(tmp_path: Path) -> None:
     # Same song_id exists in two sources; melody differs -> conflict.
     melodies_a = {
@@ -68,3 +77,22 @@ def test_compute_song_id_conflicts_includes_missing_melody(tmp_path: Path) -> No
     occs = {o.source_label: o for o in conflicts[2]}
     assert occs["Base"].melody1_fp is not None
     assert occs["Donor"].melody1_fp is None
+
+
+def test_file_digest_cache_persists_and_revalidates(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    f = tmp_path / "melody_1.xml"
+    f.write_bytes(b"<MELODY />")
+    first = ctl._sha1_path(f)
+    ctl._flush_file_digest_cache()
+    assert (tmp_path / "_index_cache" / ctl.FILE_DIGEST_CACHE_FILE).exists()
+
+    # Unchanged (mtime, size) -> served from cache without re-hashing.
+    calls: list[Path] = []
+    monkeypatch.setattr(ctl, "sha1_file", lambda p: calls.append(p) or "x")
+    assert ctl._sha1_path(f) == first
+    assert calls == []
+
+    # Content change -> stat key changes -> recomputed.
+    f.write_bytes(b"<MELODY></MELODY>")
+    assert ctl._sha1_path(f) == "x"
+    assert calls == [f]
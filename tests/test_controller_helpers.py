@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import ntpath
+import os
 import time
 from pathlib import Path
 
@@ -134,6 +136,23 @@ def test_covers_mapping_and_texture_page_exists(tmp_path: Path) -> None:
     assert ctl._texture_page_exists(tex, 0) is True
     assert ctl._texture_page_exists(tex, 1) is False
 
+    (tex / "page_3.png").write_bytes(b"")
+    (tex / "page_04.jpg").write_bytes(b"")
+    (tex / "page_5.txt").write_bytes(b"")
+    pages = ctl._texture_page_set(tex)
+    assert pages == {p for p in range(6) if ctl._texture_page_exists(tex, p)}
+    assert pages == {0, 3}
+    assert ctl._texture_page_set(tmp_path / "missing") == set()
+
+
+def test_texture_page_set_follows_platform_case_rules(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    tex = tmp_path / "textures"
+    tex.mkdir()
+    (tex / "Page_3.JPG").write_bytes(b"")
+
+    monkeypatch.setattr(os.path, "normcase", ntpath.normcase)
+    assert ctl._texture_page_set(tex) == {3}
+
 
 def test_sanitize_console_line_removes_ansi_and_control_chars() -> None:
     s = "\x1b[31mRed\x1b[0m\x00\tOK �\n"
@@ -151,3 +170,30 @@ def test_decode_bytes_uses_candidates_then_fallback() -> None:
     out = ctl._decode_bytes(b"\xff\xfe\xfa", ["utf-8"])
     assert isinstance(out, str)
     assert out
+
+
+def test_disc_index_display_product_and_expected_base() -> None:
+    def _idx(code, desc) -> DiscIndex:
+        return DiscIndex(
+            input_path="x",
+            export_root="x",
+            product_code=code,
+            product_desc=desc,
+            max_bank=1,
+            chosen_bank=1,
+            songs_xml=None,
+            acts_xml=None,
+            song_count=0,
+            warnings=[],
+        )
+
+    base = _idx("BCES00011", "SingStar")
+    assert base.display_product == "SingStar [BCES00011]"
+    assert base.is_expected_base is True
+    assert _idx("00011", None).is_expected_base is True
+    assert _idx(None, "Something BCES00011").is_expected_base is True
+
+    other = _idx(None, "SingStar Pop")
+    assert other.display_product == "SingStar Pop"
+    assert other.is_expected_base is False
+    assert _idx(None, None).display_product == "(unknown)"
@@ -6,7 +6,9 @@ from pathlib import Path
 import pytest
 
 import spcdb_tool.controller as ctl
+from spcdb_tool.melody_fingerprint import melody_fingerprint_file, melody_fingerprint_many
 
+from tests.conftest import write_melody_xml
 from tests.fixtures.fake_disc import make_fake_disc
 
 
@@ -19,6 +21,47 @@ def test_strip_ns_and_sha1_path(tmp_path: Path) -> None:
     got = ctl._sha1_path(f)
     assert got == hashlib.sha1(b"abc").hexdigest()
 
+    g = tmp_path / "y.txt"
+    g.write_bytes(b"abd")
+    assert ctl._fingerprint_path(f) == ctl._fingerprint_path(f)
+    assert ctl._fingerprint_path(f) != ctl._fingerprint_path(g)
+    assert ctl._fingerprint_path(tmp_path / "missing.txt") is None
+    assert ctl._display_sha1(ctl._fingerprint_path(f), f) == got
+
+
+def test_fingerprint_task_roundtrips_through_digest_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(ctl, "_index_cache_dir", lambda: tmp_path / "_index_cache")
+    f = tmp_path / "melody_1.xml"
+    f.write_bytes(b"<MELODY/>")
+    p = str(f)
+
+    assert ctl._peek_fingerprint_path(p) is None
+    mtime_ns, size, digest = ctl._fingerprint_file_task(p)
+    assert digest == ctl.content_digest_file(p)
+    ctl._remember_fingerprint(p, mtime_ns, size, digest)
+    assert ctl._peek_fingerprint_path(p) == digest
+
+    assert ctl._fingerprint_file_task(str(tmp_path / "missing.xml")) == (None, None, None)
+
+
+def test_melody_fp_paths_are_cached_by_mtime_and_size(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(ctl, "_index_cache_dir", lambda: tmp_path / "_index_cache")
+    f = tmp_path / "melody_1.xml"
+    write_melody_xml(f, body='<SENTENCE><NOTE MidiNote="60" Duration="100" Lyric="a" /></SENTENCE>')
+    missing = str(tmp_path / "missing.xml")
+
+    calls: list[list[str]] = []
+
+    def _many(paths: list[str]) -> dict[str, str | None]:
+        calls.append(list(paths))
+        return melody_fingerprint_many(paths)
+
+    monkeypatch.setattr(ctl, "melody_fingerprint_many", _many)
+    first = ctl._melody_fp_paths([str(f), missing])
+    assert first == {str(f): melody_fingerprint_file(f), missing: None}
+    assert ctl._melody_fp_paths([str(f)]) == {str(f): first[str(f)]}
+    assert calls == [[str(f)]]
+
 
 def test_settings_load_save_roundtrip(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     settings_p = tmp_path / "settings.json"
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from spcdb_tool.controller import SongAgg, SongOccur
+from spcdb_tool.gui_app import SPCDBGui, _PreflightSnapshot
+
+
+def _occ(sid: int, label: str) -> SongOccur:
+    return SongOccur(
+        song_id=sid, title="T", artist="A", source_label=label, melody1_sha1="x", melody1_fp=None
+    )
+
+
+def test_build_report_uses_inputs_captured_at_build_start(tmp_path: Path) -> None:
+    gui = object.__new__(SPCDBGui)
+    gui._base_idx = None
+    gui._src_indexes = {}
+    gui._src_labels = {}
+    gui._src_get = lambda *_a, **_k: None
+    gui._selected_song_ids = {1, 2}
+    gui._songs = [SongAgg(song_id=1, title="One", artist="X", preferred_source="Base", sources=("Base",))]
+    gui._conflicts = {2: [_occ(2, "Base"), _occ(2, "A")]}
+    gui._conflict_choices = {2: "A"}
+    gui._last_preflight = _PreflightSnapshot(provider={1: "Base", 2: "A"}, dupe_ids=[2])
+    gui._session_log_path = None
+
+    inputs = gui._build_report_inputs()
+
+    # A validation pass / songs refresh landing mid-build replaces the live state.
+    gui._conflicts = {}
+    gui._conflict_choices.clear()
+    gui._songs = []
+    gui._selected_song_ids = set()
+
+    out = tmp_path / "Built"
+    out.mkdir()
+    rp = gui._write_build_report(out_dir=str(out), ok=True, duration_s=1.0, inputs=inputs)
+    report = json.loads(Path(rp).read_text(encoding="utf-8"))
+
+    assert report["selection"]["song_ids"] == [1, 2]
+    assert report["selection"]["conflicts_count"] == 1
+    assert [c["chosen"] for c in report["conflicts"]] == ["A"]
+    assert report["songs"][0]["title"] == "One"
+
+
+class _FakeWidget:
+    def __init__(self) -> None:
+        self.state = ""
+
+    def configure(self, **kw: str) -> None:
+        self.state = kw.get("state", self.state)
+
+    def set(self, _value: str) -> None:
+        pass
+
+
+def test_report_button_rechecks_the_file_on_refresh(tmp_path: Path) -> None:
+    rp = tmp_path / "Built_build_report.json"
+    rp.write_text("{}", encoding="utf-8")
+
+    gui = object.__new__(SPCDBGui)
+    gui.last_build_var = _FakeWidget()
+    for name in ("open_last_build_btn", "copy_last_build_btn", "log_last_build_btn", "report_last_build_btn"):
+        setattr(gui, name, _FakeWidget())
+    gui._last_build = {"ts": "t", "ok": True, "out_dir": str(tmp_path / "Built"), "report_path": str(rp), "report_exists": True}
+
+    gui._do_refresh_last_build_ui()
+    assert gui.report_last_build_btn.state == "normal"
+
+    rp.unlink()  # moved/deleted by the user after the build
+    gui._do_refresh_last_build_ui()
+    assert gui.report_last_build_btn.state == "disabled"
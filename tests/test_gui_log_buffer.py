@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from collections import deque
+from pathlib import Path
+from typing import List
+
+from spcdb_tool.gui_app import SPCDBGui
+
+
+class _FakeText:
+    def __init__(self) -> None:
+        self.chunks: List[str] = []
+
+    def insert(self, _index: str, text: str) -> None:
+        self.chunks.append(text)
+
+    def see(self, _index: str) -> None:
+        pass
+
+
+def test_log_burst_beyond_buffer_size_loses_no_lines(tmp_path: Path) -> None:
+    gui = object.__new__(SPCDBGui)
+    gui._log_buf = deque(maxlen=3)
+    gui._log_flush_pending = True  # timer already queued; it never fires here
+    gui.log_text = _FakeText()
+    gui._session_log_path = tmp_path / "session.log"
+
+    for i in range(8):
+        gui._log(f"line {i}")
+    gui._flush_logs()
+
+    shown = "".join(gui.log_text.chunks).splitlines()
+    assert [ln.split("] ", 1)[1] for ln in shown] == [f"line {i}" for i in range(8)]
+    assert gui._session_log_path.read_text(encoding="utf-8").splitlines() == shown
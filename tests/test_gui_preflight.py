@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import ntpath
+import os
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import pytest
+
+from spcdb_tool.controller import DiscIndex
+from spcdb_tool.gui_app import SPCDBGui, _has_melody
+
+
+def _idx(tmp_path: Path, name: str) -> DiscIndex:
+    return DiscIndex(
+        input_path=str(tmp_path / name),
+        export_root=str(tmp_path / name / "Export"),
+        product_code=name,
+        product_desc=None,
+        max_bank=1,
+        chosen_bank=1,
+        songs_xml=None,
+        acts_xml=None,
+        song_count=0,
+        warnings=[],
+    )
+
+
+def test_preflight_never_loads_unused_donor_maps(tmp_path: Path) -> None:
+    # Song 1 is served from Base and duplicated only in B, which routing never needs.
+    songs = {"Base": {1: ("", ""), 2: ("", "")}, "A": {2: ("", ""), 3: ("", "")}, "B": {1: ("", ""), 4: ("", "")}}
+    by_root: Dict[str, str] = {}
+    loaded: List[str] = []
+
+    gui = object.__new__(SPCDBGui)
+    gui._base_idx = _idx(tmp_path, "Base")
+    by_root[gui._base_idx.export_root] = "Base"
+    gui._src_indexes = {}
+    gui._src_labels = {}
+    for lab in ("A", "B"):
+        idx = _idx(tmp_path, lab)
+        by_root[idx.export_root] = lab
+        gui._src_indexes[lab] = idx
+        gui._src_labels[lab] = lab
+    gui._src_get = lambda *_a, **_k: None
+    gui._selected_song_ids = {1, 2, 3}
+    # Per-disc id sets the GUI already holds from the last songs refresh.
+    gui._disc_song_ids_by_label = {lab: set(m) for lab, m in songs.items()}
+    gui._disc_song_cache = {}
+
+    def _loader(idx: DiscIndex) -> Dict[int, Tuple[str, str]]:
+        lab = by_root[idx.export_root]
+        loaded.append(lab)
+        return songs[lab]
+
+    gui._get_disc_song_map = _loader
+
+    _needed, provider, dupe_ids, _errors = gui._preflight_build(
+        out_dir=tmp_path / "out",
+        prefer={},
+        src_label_paths=[("A", "A"), ("B", "B")],
+    )
+
+    assert provider == {1: "Base", 2: "Base", 3: "A"}
+    # Same answer as scanning every disc, without parsing B.
+    assert dupe_ids == [1, 2]
+    assert "B" not in loaded
+
+
+def test_has_melody_follows_platform_case_rules(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    song = tmp_path / "1"
+    song.mkdir()
+    (song / "MELODY_1.XML").write_bytes(b"")
+
+    monkeypatch.setattr(os.path, "normcase", ntpath.normcase)
+    assert _has_melody(str(song)) is True
+    assert _has_melody(str(tmp_path / "missing")) is False
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+import spcdb_tool.controller as ctl
+from spcdb_tool.gui_app import SPCDBGui
+
+
+def test_failed_settings_write_is_retried_on_next_flush(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    settings_p = tmp_path / "cfg" / "settings.json"
+    monkeypatch.setattr(ctl, "_settings_path", lambda: settings_p)
+
+    gui = object.__new__(SPCDBGui)
+    gui._settings_flush_job = None
+    gui._settings_dirty = True
+    gui._settings_saved_blob = None
+    gui._settings_cache = {"a": 1}
+
+    gui._flush_settings()  # parent folder missing: the write fails
+    assert not settings_p.exists()
+    assert gui._settings_saved_blob is None
+
+    settings_p.parent.mkdir()
+    gui._flush_settings()
+    assert ctl._load_settings() == {"a": 1}
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from typing import List
+
+from spcdb_tool.controller import SongAgg
+from spcdb_tool.gui_app import SPCDBGui
+
+
+def _agg(sid: int, label: str) -> SongAgg:
+    return SongAgg(song_id=sid, title=f"T{sid}", artist="", preferred_source=label, sources=(label,))
+
+
+def test_partial_batches_keep_songs_sorted_and_replace_by_id() -> None:
+    gui = object.__new__(SPCDBGui)
+    gui._songs = [_agg(99, "Old")]  # previous refresh: dropped by the first batch
+    gui._songs_partial_by_id = {}
+    gui._disc_song_ids_by_label = {}
+    gui._invalidate_sel_counts = lambda **_k: None
+    gui._debounced_apply_filter = lambda: None
+
+    gui._on_songs_partial("Base", [_agg(5, "Base"), _agg(1, "Base")], {1, 5})
+    gui._on_songs_partial("A", [_agg(3, "A"), _agg(5, "A"), _agg(7, "A")], {3, 5, 7})
+
+    got: List[SongAgg] = gui._songs
+    assert [s.song_id for s in got] == [1, 3, 5, 7]
+    assert [s.preferred_source for s in got] == ["Base", "A", "A", "A"]
+    assert gui._base_song_ids == {1, 5}
@@ -68,3 +68,25 @@ def test_index_disc_reindexes_when_cache_stale(tmp_path: Path, monkeypatch: pyte
     st = ctl.get_index_cache_status(str(disc.disc_root))
     assert st["exists"] is True
     assert st["stale"] is False
+
+
+def test_index_only_refresh_keeps_songs_for_same_signature(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    _patch_cache_dir(tmp_path, monkeypatch)
+
+    disc = make_fake_disc(tmp_path, label="SONGS_KEEP", include_chc=False, song_ids=[1, 2])
+    idx = ctl.index_disc(str(disc.disc_root))
+    songs = ctl._load_songs_for_disc_cached(idx)
+    assert set(songs) == {1, 2}
+
+    # A queued index-only write landing after the songs write keeps them.
+    ctl._write_index_cache(idx, songs=None)
+    _di, cached, stale, _reason = ctl._load_index_cache(idx.input_path)
+    assert stale is False
+    assert cached == songs
+
+    # Once the disc changed, an index-only write drops them.
+    songs_xml = disc.export_root / "songs_1_0.xml"
+    songs_xml.write_text(songs_xml.read_text(encoding="utf-8") + "\n" + ("X" * 2000), encoding="utf-8")
+    ctl._write_index_cache(idx, songs=None)
+    _di, cached, _stale, _reason = ctl._load_index_cache(idx.input_path)
+    assert cached is None
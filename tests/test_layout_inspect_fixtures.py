@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import ntpath
+import os
 from pathlib import Path
 
 import pytest
@@ -55,6 +57,44 @@ def test_inspect_export_resolves_filesystem_export_refs(tmp_path: Path) -> None:
     assert report.existence["all"].get("FileSystem/Export/melodies_1.chc") is True
 
 
+def test_inspect_export_counts_follow_platform_case_rules(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    disc = make_fake_disc(tmp_path, label="InspectCase", include_textures=True, include_chc=True)
+    before = inspect_export(disc.export_root, kind="disc_folder", input_path=str(disc.disc_root), warnings=[]).counts
+
+    (disc.export_root / "SONGS_2_0.XML").write_bytes(b"")
+    (disc.export_root / "Melodies_2.CHC").write_bytes(b"")
+    (disc.export_root / "textures" / "PAGE_9.JPG").write_bytes(b"")
+
+    monkeypatch.setattr(os.path, "normcase", ntpath.normcase)
+    after = inspect_export(disc.export_root, kind="disc_folder", input_path=str(disc.disc_root), warnings=[]).counts
+
+    assert after["songs_xml_files"] == before["songs_xml_files"] + 1
+    assert after["banks_from_songs_xml"] == before["banks_from_songs_xml"] + 1
+    assert after["melodies_chc_files"] == before["melodies_chc_files"] + 1
+    assert after["texture_pages"] == before["texture_pages"] + 1
+
+
+def test_inspect_export_follows_a_relinked_disc_folder(tmp_path: Path) -> None:
+    with_chc = make_fake_disc(tmp_path, label="WithChc", ref_prefix="FileSystem/Export/", include_chc=True)
+    no_chc = make_fake_disc(tmp_path, label="NoChc", ref_prefix="FileSystem/Export/", include_chc=False)
+    link = tmp_path / "current"
+    try:
+        link.symlink_to(with_chc.disc_root, target_is_directory=True)
+    except OSError:
+        pytest.skip("symlinks not available")
+    export_root = link / with_chc.export_root.relative_to(with_chc.disc_root)
+    ref = "FileSystem/Export/melodies_1.chc"
+
+    first = inspect_export(export_root, kind="disc_folder", input_path=str(link), warnings=[])
+    assert first.existence["all"].get(ref) is True
+
+    # Same path string, new target: nothing resolved by the first run may be reused.
+    link.unlink()
+    link.symlink_to(no_chc.disc_root, target_is_directory=True)
+    second = inspect_export(export_root, kind="disc_folder", input_path=str(link), warnings=[])
+    assert second.existence["all"].get(ref) is False
+
+
 def test_resolve_input_missing_export_raises(tmp_path: Path) -> None:
     p = tmp_path / "EmptyFolder"
     p.mkdir(parents=True, exist_ok=True)
@@ -2,7 +2,10 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from spcdb_tool.melody_fingerprint import melody_fingerprint_file
+import pytest
+
+import spcdb_tool.melody_fingerprint as mf
+from spcdb_tool.melody_fingerprint import melody_fingerprint_file, melody_fingerprint_many
 from tests.conftest import write_melody_xml
 
 
@@ -116,3 +119,117 @@ def test_numbers_as_floats_are_handled(tmp_path: Path) -> None:
     )
 
     assert melody_fingerprint_file(a) == melody_fingerprint_file(b)
+
+
+def test_fingerprint_many_matches_single_file(tmp_path: Path) -> None:
+    paths = []
+    for i in range(40):
+        p = tmp_path / f"{i}.xml"
+        write_melody_xml(
+            p,
+            body=f"""
+  <SENTENCE>
+    <NOTE MidiNote=\"{60 + i % 5}\" Duration=\"100\" Lyric=\"a\" />
+  </SENTENCE>
+""",
+        )
+        paths.append(p)
+    paths.append(tmp_path / "missing.xml")
+
+    got = melody_fingerprint_many(paths, workers=2)
+    assert got == {p: melody_fingerprint_file(p) for p in paths}
+    assert got[tmp_path / "missing.xml"] is None
+
+
+def test_fingerprint_many_reuses_one_pool(tmp_path: Path) -> None:
+    paths = []
+    for i in range(40):
+        p = tmp_path / f"{i}.xml"
+        write_melody_xml(p, body=f'<SENTENCE><NOTE MidiNote="{60 + i}" Duration="100" Lyric="a" /></SENTENCE>')
+        paths.append(p)
+
+    try:
+        first = melody_fingerprint_many(paths, workers=2)
+        pool = mf._pool
+        assert pool is not None  # the pooled path ran (a failure drops the pool)
+        second = melody_fingerprint_many(paths[::-1], workers=2)
+        assert mf._pool is pool
+    finally:
+        mf._shutdown_pool()
+
+    assert first == second == {p: melody_fingerprint_file(p) for p in paths}
+
+
+def test_melody_without_namespace_matches_namespaced(tmp_path: Path) -> None:
+    body = '<SENTENCE><NOTE MidiNote="60" Duration="100" Lyric="a" /></SENTENCE>'
+    bare = tmp_path / "bare.xml"
+    bare.write_text(f'<?xml version="1.0"?>\n<MELODY>{body}</MELODY>\n', encoding="utf-8")
+    ns = tmp_path / "ns.xml"
+    write_melody_xml(ns, body=body)
+
+    fp = melody_fingerprint_file(bare)
+    assert fp is not None
+    assert fp == melody_fingerprint_file(ns)
+
+
+def test_utf16_and_long_prolog_melodies_are_parsed(tmp_path: Path) -> None:
+    body = '<SENTENCE><NOTE MidiNote="60" Duration="100" Lyric="a" /></SENTENCE>'
+    ref = tmp_path / "ref.xml"
+    write_melody_xml(ref, body=body)
+    xml = ref.read_text(encoding="utf-8")
+
+    utf16 = tmp_path / "utf16.xml"
+    utf16.write_bytes(xml.replace('encoding="utf-8"', 'encoding="utf-16"').encode("utf-16"))
+    prolog = tmp_path / "prolog.xml"
+    prolog.write_text(
+        '<?xml version="1.0"?>\n<!--' + "x" * 5000 + '-->\n<MELODY>' + body + "</MELODY>\n",
+        encoding="utf-8",
+    )
+
+    fp = melody_fingerprint_file(ref)
+    assert fp is not None
+    assert melody_fingerprint_file(utf16) == fp
+    assert melody_fingerprint_file(prolog) == fp
+
+
+def test_non_melody_xml_has_no_fingerprint(tmp_path: Path) -> None:
+    p = tmp_path / "other.xml"
+    p.write_text('<?xml version="1.0"?>\n<foo><bar Delay="5" /></foo>\n', encoding="utf-8")
+
+    assert melody_fingerprint_file(p) is None
+
+
+def test_mixed_case_lyric_and_delay_on_canonical_note(tmp_path: Path) -> None:
+    a = tmp_path / "canonical.xml"
+    b = tmp_path / "mixed.xml"
+    write_melody_xml(
+        a,
+        body='<SENTENCE><NOTE MidiNote="60" Duration="100" Lyric="abc" Delay="7" /></SENTENCE>',
+    )
+    write_melody_xml(
+        b,
+        body='<SENTENCE><NOTE MidiNote="60" Duration="100" LYRIC="abc" DELAY="7" /></SENTENCE>',
+    )
+
+    assert melody_fingerprint_file(a) == melody_fingerprint_file(b)
+
+
+@pytest.mark.parametrize("backend", ["expat", "lxml"])
+def test_mixed_case_sentence_tags_match_on_both_backends(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, backend: str
+) -> None:
+    if backend == "lxml":
+        monkeypatch.setattr(mf, "_LXML", pytest.importorskip("lxml.etree"))
+    else:
+        monkeypatch.setattr(mf, "_LXML", None)
+    # Same bytes as the other backend's run: bypass the raw-digest memo.
+    monkeypatch.setattr(mf, "_RAW_TO_SEMANTIC", {})
+
+    a = tmp_path / "upper.xml"
+    b = tmp_path / "mixed.xml"
+    write_melody_xml(a, body='<SENTENCE><NOTE MidiNote="60" Duration="100" Lyric="a" /></SENTENCE>')
+    write_melody_xml(b, body='<Sentence><Note MidiNote="60" Duration="100" Lyric="a" /></Sentence>')
+
+    fp = melody_fingerprint_file(a)
+    assert fp is not None
+    assert fp == melody_fingerprint_file(b)
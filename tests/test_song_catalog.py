@@ -135,3 +135,48 @@ def test_build_song_catalog_prefers_base_metadata_and_aggregates_sources(
     songs2, by_label2 = ctl.build_song_catalog(discs)
     assert songs2 == songs
     assert by_label2 == by_label
+
+
+def test_iter_song_catalog_streams_per_disc_updates(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    _patch_cache_dir(tmp_path, monkeypatch)
+
+    base = make_fake_disc(
+        tmp_path,
+        label="BASE",
+        layout="ps3_game",
+        bank=1,
+        song_ids=[1],
+        include_chc=False,
+        include_textures=False,
+        include_covers=False,
+    )
+    donor = make_fake_disc(
+        tmp_path,
+        label="DONOR",
+        layout="ps3_game",
+        bank=1,
+        song_ids=[1, 2],
+        include_chc=False,
+        include_textures=False,
+        include_covers=False,
+    )
+
+    discs = [
+        ("Base", ctl.index_disc(str(base.disc_root)), True),
+        ("Donor", ctl.index_disc(str(donor.disc_root)), False),
+    ]
+    batches = list(ctl.iter_song_catalog(discs))
+
+    assert [b[0] for b in batches] == ["Base", "Donor"]
+    assert batches[0][2] == {1}
+    assert [s.song_id for s in batches[0][1]] == [1]
+    assert batches[0][1][0].sources == ("Base",)
+
+    # The donor batch re-emits song 1 with its merged sources.
+    assert batches[1][2] == {1, 2}
+    assert [s.song_id for s in batches[1][1]] == [1, 2]
+    assert batches[1][1][0].sources == ("Base", "Donor")
+    assert batches[1][1][0].preferred_source == "Base"
+
+    songs, _by_label = ctl.build_song_catalog(discs)
+    assert songs == batches[1][1]
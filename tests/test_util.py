@@ -40,6 +40,22 @@ def test_to_jsonable_and_dumps_pretty(tmp_path: Path) -> None:
     assert back["x"]["a"] == 1
 
 
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_bytes_roundtrip_with_and_without_orjson(monkeypatch: pytest.MonkeyPatch, use_orjson: bool) -> None:
+    if not use_orjson:
+        monkeypatch.setattr(util, "orjson", None)
+    elif util.orjson is None:
+        pytest.skip("orjson not installed")
+
+    data = {"b": [3, 1, 2], "a": "Ünïcode", "n": None}
+    raw = util.json_dumps_bytes(data, pretty=True, sort_keys=True)
+    assert isinstance(raw, bytes)
+    assert raw.decode("utf-8").index('"a"') < raw.decode("utf-8").index('"b"')
+    assert util.json_loads(raw) == data
+    assert util.json_loads(raw.decode("utf-8")) == data
+    assert json.loads(raw) == data
+
+
 def test_safe_listdir_missing(tmp_path: Path) -> None:
     missing = tmp_path / "does_not_exist"
     assert util.safe_listdir(missing) == []
@@ -159,3 +159,79 @@ def test_cleanup_extraction_artifacts_moves_to_trash(tmp_path: Path, monkeypatch
 
     trash_dir = Path(str(rep["trash_dir"]))
     assert (trash_dir / disc.disc_root.name).exists()
+
+
+def test_cleanup_extraction_artifacts_parallel_moves_avoid_collisions(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    _patch_cache_dir(tmp_path, monkeypatch)
+
+    disc = make_fake_disc(
+        tmp_path,
+        label="CleanupPar",
+        layout="ps3_game",
+        bank=1,
+        song_ids=[1],
+        include_chc=False,
+        include_textures=False,
+        include_covers=False,
+    )
+
+    outs = []
+    for i in range(5):
+        d = disc.disc_root / f"Pack{i}.pkd_out"
+        d.mkdir(parents=True, exist_ok=True)
+        (d / "dummy.txt").write_text(str(i), encoding="utf-8")
+        outs.append(d)
+
+    # Pre-existing trash entry forces a collision rename for Pack0.
+    trash_disc = disc.disc_root.parent / "_spcdb_trash" / "TESTTS" / disc.disc_root.name
+    (trash_disc / "Pack0.pkd_out").mkdir(parents=True, exist_ok=True)
+
+    logs: list[str] = []
+    rep = ctl.cleanup_extraction_artifacts(
+        disc.disc_root,
+        include_pkd_out_dirs=True,
+        include_pkd_files=False,
+        trash_ts="TESTTS",
+        log_cb=logs.append,
+        max_workers=4,
+    )
+
+    assert rep["moved_dirs"] == 5
+    assert all(not d.exists() for d in outs)
+    assert (trash_disc / "Pack0.pkd_out_2" / "dummy.txt").read_text(encoding="utf-8") == "0"
+    assert sum(1 for m in logs if m.startswith("[cleanup] Moved:")) == 5
+    assert logs[-1] == "[cleanup] Moved 5 dir(s), 0 file(s); 0 failed, 0 skipped"
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_cleanup_extraction_artifacts_stops_and_reports_after_a_failed_move(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, max_workers: int
+) -> None:
+    _patch_cache_dir(tmp_path, monkeypatch)
+
+    disc = make_fake_disc(tmp_path, label="CleanupFail", song_ids=[1], include_chc=False)
+    for i in range(5):
+        (disc.disc_root / f"Pack{i}.pkd_out").mkdir(parents=True, exist_ok=True)
+
+    real_move = ctl._move_path
+
+    def _flaky(src: Path, dst: Path) -> None:
+        if src.name == "Pack0.pkd_out":
+            raise OSError("locked")
+        real_move(src, dst)
+
+    monkeypatch.setattr(ctl, "_move_path", _flaky)
+
+    logs: list[str] = []
+    with pytest.raises(OSError, match="locked"):
+        ctl.cleanup_extraction_artifacts(
+            disc.disc_root, trash_ts="TESTTS", log_cb=logs.append, max_workers=max_workers
+        )
+
+    moved_lines = [m for m in logs if m.startswith("[cleanup] Moved:")]
+    err_at = next(i for i, m in enumerate(logs) if m.startswith("[cleanup] ERROR moving"))
+    skipped = 4 - len(moved_lines)
+    assert logs[-1] == f"[cleanup] Moved {len(moved_lines)} dir(s), 0 file(s); 1 failed, {skipped} skipped"
+    if max_workers == 1:
+        # Nothing after the failed move is attempted.
+        assert not any(m.startswith("[cleanup] Moved:") for m in logs[err_at:])